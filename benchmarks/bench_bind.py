@@ -0,0 +1,87 @@
+"""
+Loads a 100-field dataclass config with roskarl.bind.load vs hand-written
+env_var_* calls vs a reflection-based binder that walks the fields on every
+load.
+
+Run with: python benchmarks/bench_bind.py
+"""
+
+import dataclasses
+import os
+import timeit
+from datetime import timedelta
+
+from roskarl import env_var, env_var_bool, env_var_duration, env_var_int
+from roskarl.bind import HELPERS, clear_loaders, load, loader
+
+FIELDS = 100
+ROUNDS = 5
+NUMBER = 2_000
+
+KINDS = [
+    (int, "42", env_var_int),
+    (str, "value", env_var),
+    (bool, "true", env_var_bool),
+    (timedelta, "30s", env_var_duration),
+]
+
+Config = dataclasses.make_dataclass(
+    "Config",
+    [(f"field_{i}", KINDS[i % len(KINDS)][0]) for i in range(FIELDS)],
+)
+for i in range(FIELDS):
+    os.environ[f"FIELD_{i}"] = KINDS[i % len(KINDS)][1]
+
+# what a person would type: one explicit call per field
+hand_written_source = "def hand_written():\n    return Config(\n{}    )\n".format(
+    "".join(
+        f"        field_{i}={KINDS[i % len(KINDS)][2].__name__}"
+        f"('FIELD_{i}', required=True),\n"
+        for i in range(FIELDS)
+    )
+)
+namespace = {"Config": Config, **{kind[2].__name__: kind[2] for kind in KINDS}}
+exec(hand_written_source, namespace)
+hand_written = namespace["hand_written"]
+
+
+def reflective():
+    hints = {field.name: field.type for field in dataclasses.fields(Config)}
+    return Config(
+        **{
+            name: HELPERS[hint](name.upper(), required=True)
+            for name, hint in hints.items()
+        }
+    )
+
+
+def report(label: str, seconds: float) -> None:
+    per_load = seconds / NUMBER
+    print(f"{label:<28} {per_load * 1e6:8.1f} µs/load  {1 / per_load:>10,.0f} loads/s")
+
+
+def main() -> None:
+    assert load(Config) == hand_written() == reflective()
+
+    def generate() -> None:
+        clear_loaders()
+        loader(Config)
+
+    generated = min(timeit.repeat(generate, number=20, repeat=ROUNDS)) / 20
+    print(f"{'loader code generation':<28} {generated * 1e6:8.1f} µs (once per class)")
+    report(
+        "hand-written calls",
+        min(timeit.repeat(hand_written, number=NUMBER, repeat=ROUNDS)),
+    )
+    report(
+        "roskarl.bind.load",
+        min(timeit.repeat(lambda: load(Config), number=NUMBER, repeat=ROUNDS)),
+    )
+    report(
+        "reflection per load",
+        min(timeit.repeat(reflective, number=NUMBER, repeat=ROUNDS)),
+    )
+
+
+if __name__ == "__main__":
+    main()
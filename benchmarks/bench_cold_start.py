@@ -0,0 +1,86 @@
+"""
+Cold start of a fresh interpreter that loads a 20-field dataclass config:
+a module generated by `python -m roskarl compile` vs roskarl.bind.load vs an
+interpreter that does nothing.
+
+Run with: python benchmarks/bench_cold_start.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROUNDS = 20
+FIELDS = 20
+
+KINDS = [("int", "42"), ("str", "value"), ("bool", "true"), ("timedelta", "30s")]
+
+SCHEMA = "\n".join(
+    [
+        "from dataclasses import dataclass",
+        "from datetime import timedelta",
+        "",
+        "",
+        "@dataclass",
+        "class Config:",
+        *(f"    field_{i}: {KINDS[i % len(KINDS)][0]}" for i in range(FIELDS)),
+        "",
+    ]
+)
+ENV = {
+    **os.environ,
+    **{f"FIELD_{i}": KINDS[i % len(KINDS)][1] for i in range(FIELDS)},
+}
+
+SCRIPTS = {
+    "python -c pass": "pass",
+    "compiled module": "import generated; generated.load()",
+    "roskarl.bind.load": (
+        "import schema; from roskarl.bind import load; load(schema.Config)"
+    ),
+}
+
+
+def best_of(code: str, cwd: str) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=cwd, env=ENV, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, "schema.py").write_text(SCHEMA)
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "roskarl",
+                "compile",
+                "schema:Config",
+                "-o",
+                "generated.py",
+            ],
+            cwd=directory,
+            env={**ENV, "PYTHONPATH": directory},
+            check=True,
+        )
+        # compile .pyc files up front so every variant starts equally warm
+        for code in SCRIPTS.values():
+            subprocess.run([sys.executable, "-c", code], cwd=directory, env=ENV)
+        baseline = best_of(SCRIPTS["python -c pass"], directory)
+        for label, code in SCRIPTS.items():
+            seconds = best_of(code, directory) if code != "pass" else baseline
+            print(
+                f"{label:<20} {seconds * 1e3:8.1f} ms"
+                f"  (+{(seconds - baseline) * 1e3:.1f} ms over bare python)"
+            )
+
+
+if __name__ == "__main__":
+    main()
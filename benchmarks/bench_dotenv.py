@@ -0,0 +1,77 @@
+"""
+Parses a 50k-line .env file with roskarl.dotenv and python-dotenv.
+
+Run with: python benchmarks/bench_dotenv.py
+"""
+
+import random
+import tempfile
+import timeit
+from pathlib import Path
+
+from roskarl.dotenv import read_dotenv
+
+LINES = 50_000
+ROUNDS = 5
+
+
+def make_dotenv(path: Path, lines: int) -> None:
+    rng = random.Random(0)
+    out = []
+    while len(out) < lines:
+        i = len(out)
+        kind = rng.random()
+        if kind < 0.05:
+            out.append(f"# tenant {i}")
+        elif kind < 0.10:
+            out.append("")
+        elif kind < 0.30:
+            out.append(f'export TENANT_{i}_NAME="Tenant \\"{i}\\" AB"')
+        elif kind < 0.40:
+            out.append(f"TENANT_{i}_PATH='/srv/tenants/{i}/data'")
+        elif kind < 0.42:
+            out.append(f'TENANT_{i}_CERT="-----BEGIN-----')
+            out.append("MIIBszCCAVmgAwIBAgIU")
+            out.append('-----END-----"')
+        else:
+            out.append(f"TENANT_{i}_TIMEOUT={rng.randrange(1, 600)}s  # seconds")
+    path.write_text("\n".join(out) + "\n")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / ".env"
+        make_dotenv(path, LINES)
+        size = path.stat().st_size
+
+        def report(label: str, seconds: float) -> None:
+            print(
+                f"{label:<28} {seconds * 1000:8.1f} ms  {size / seconds / 2**20:8.1f} MB/s"
+            )
+
+        report(
+            "roskarl read_dotenv",
+            min(timeit.repeat(lambda: read_dotenv(path), number=1, repeat=ROUNDS)),
+        )
+        try:
+            from dotenv import dotenv_values
+        except ImportError:
+            print("python-dotenv not installed, skipping comparison")
+            return
+        report(
+            "python-dotenv dotenv_values",
+            min(
+                timeit.repeat(
+                    lambda: dotenv_values(path, interpolate=False),
+                    number=1,
+                    repeat=ROUNDS,
+                )
+            ),
+        )
+        ours = read_dotenv(path)
+        theirs = dotenv_values(path, interpolate=False)
+        print(f"identical results: {ours == theirs} ({len(ours):,} keys)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Per-request config overrides across thousands of concurrent asyncio tasks:
+roskarl.source.override vs mutating os.environ vs copying the environment
+into a scoped source.
+
+Run with: python benchmarks/bench_overrides.py
+"""
+
+import asyncio
+import os
+import timeit
+
+from roskarl import env_var, env_var_int
+from roskarl.source import override, use_source
+
+TASKS = 10_000
+ROUNDS = 5
+# a realistically sized environment, which the copying approach pays for
+for i in range(200):
+    os.environ.setdefault(f"BENCH_FILLER_{i}", "x" * 40)
+os.environ.setdefault("TENANT", "base")
+os.environ.setdefault("TIMEOUT", "30")
+
+
+def read_config() -> tuple[str | None, int | None]:
+    return env_var("TENANT"), env_var_int("TIMEOUT")
+
+
+async def with_override(tenant: int) -> None:
+    with override(TENANT=str(tenant), TIMEOUT="5"):
+        await asyncio.sleep(0)
+        read_config()
+
+
+async def with_environ_copy(tenant: int) -> None:
+    with use_source({**os.environ, "TENANT": str(tenant), "TIMEOUT": "5"}):
+        await asyncio.sleep(0)
+        read_config()
+
+
+async def with_environ_mutation(tenant: int) -> None:
+    # not task-safe: another task can observe (or restore) these values
+    saved = {key: os.environ.get(key) for key in ("TENANT", "TIMEOUT")}
+    os.environ["TENANT"] = str(tenant)
+    os.environ["TIMEOUT"] = "5"
+    try:
+        await asyncio.sleep(0)
+        read_config()
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def run(handler) -> None:
+    async def main() -> None:
+        await asyncio.gather(*(handler(i) for i in range(TASKS)))
+
+    asyncio.run(main())
+
+
+def report(label: str, seconds: float, count: int, unit: str) -> None:
+    print(f"{label:<40} {seconds * 1000:8.2f} ms  {count / seconds:>12,.0f} {unit}/s")
+
+
+def main() -> None:
+    for label, handler in [
+        ("override (contextvar overlay)", with_override),
+        ("use_source(copy of os.environ)", with_environ_copy),
+        ("mutate os.environ (unsafe)", with_environ_mutation),
+    ]:
+        seconds = min(timeit.repeat(lambda: run(handler), number=1, repeat=ROUNDS))
+        report(f"{TASKS:,} tasks: {label}", seconds, TASKS, "tasks")
+
+    def enter_exit() -> None:
+        with override(TENANT="t"):
+            pass
+
+    calls = 200_000
+    seconds = min(timeit.repeat(enter_exit, number=calls, repeat=ROUNDS))
+    report("override enter/exit", seconds, calls, "calls")
+    seconds = min(timeit.repeat(read_config, number=calls, repeat=ROUNDS))
+    report("2 helper reads, no override", seconds, calls, "calls")
+
+    def read_overridden() -> None:
+        with override(TENANT="t", TIMEOUT="5"):
+            for _ in range(10):
+                read_config()
+
+    seconds = min(timeit.repeat(read_overridden, number=calls // 10, repeat=ROUNDS))
+    report("2 helper reads, under override", seconds, calls, "calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Collects the variables of 100 plugins (PLUGIN_<NAME>_*) from a 5,000-variable
+environment: one startswith() scan per plugin vs a roskarl.prefix.PrefixIndex
+built once and queried per plugin.
+
+Run with: python benchmarks/bench_prefix.py
+"""
+
+import timeit
+
+from roskarl.prefix import PrefixIndex
+
+PLUGINS = 100
+PER_PLUGIN = 10
+FILLER = 4_000
+ROUNDS = 5
+NUMBER = 20
+
+ENV = {f"OTHER_{i:05d}": "x" * 40 for i in range(FILLER)}
+for p in range(PLUGINS):
+    for i in range(PER_PLUGIN):
+        ENV[f"PLUGIN_P{p:03d}_SETTING_{i}"] = str(i)
+PREFIXES = [f"PLUGIN_P{p:03d}_" for p in range(PLUGINS)]
+
+
+def scan() -> list[dict[str, str]]:
+    return [
+        {k: v for k, v in ENV.items() if k.startswith(prefix)} for prefix in PREFIXES
+    ]
+
+
+def indexed() -> list[dict[str, str]]:
+    index = PrefixIndex(ENV)
+    return [dict(index.view(prefix)) for prefix in PREFIXES]
+
+
+def report(label: str, seconds: float) -> None:
+    per_reload = seconds / NUMBER
+    print(f"{label:<34} {per_reload * 1e3:8.2f} ms/reload")
+
+
+def main() -> None:
+    assert scan() == indexed()
+    print(f"{len(ENV):,} variables, {PLUGINS} plugins x {PER_PLUGIN} variables")
+    report(
+        "startswith scan per plugin",
+        min(timeit.repeat(scan, number=NUMBER, repeat=ROUNDS)),
+    )
+    report(
+        "PrefixIndex (build + 100 queries)",
+        min(timeit.repeat(indexed, number=NUMBER, repeat=ROUNDS)),
+    )
+    index = PrefixIndex(ENV)
+    report(
+        "PrefixIndex (100 queries)",
+        min(
+            timeit.repeat(
+                lambda: [dict(index.view(prefix)) for prefix in PREFIXES],
+                number=NUMBER,
+                repeat=ROUNDS,
+            )
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Cost of roskarl.profiler per env_var_* read: a plain env_var_int and
+env_var_duration read with profiling off (the default) and inside profiling().
+
+Run with: python benchmarks/bench_profiler.py
+"""
+
+import os
+import timeit
+
+from roskarl import env_var_duration, env_var_int
+from roskarl.profiler import profiling
+
+ROUNDS = 7
+NUMBER = 100_000
+
+os.environ["BENCH_WORKERS"] = "4"
+os.environ["BENCH_TIMEOUT"] = "1h30m"
+
+CASES = {
+    "env_var_int": lambda: env_var_int("BENCH_WORKERS"),
+    "env_var_duration": lambda: env_var_duration("BENCH_TIMEOUT"),
+}
+
+
+def best(case) -> float:
+    return min(timeit.repeat(case, number=NUMBER, repeat=ROUNDS)) / NUMBER
+
+
+def main() -> None:
+    for label, case in CASES.items():
+        off = best(case)
+        with profiling():
+            on = best(case)
+        print(f"{label:<16} off {off * 1e9:8.0f} ns/read   on {on * 1e9:8.0f} ns/read")
+
+
+if __name__ == "__main__":
+    main()
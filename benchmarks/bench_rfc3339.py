@@ -0,0 +1,61 @@
+"""
+Compares roskarl.rfc3339 against datetime.fromisoformat.
+
+Run with: python benchmarks/bench_rfc3339.py
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from roskarl.rfc3339 import (
+    parse_rfc3339,
+    parse_rfc3339_datetime64,
+    parse_rfc3339_many,
+)
+
+N = 100_000
+ROUNDS = 5
+
+
+def make_values(n: int) -> list[str]:
+    rng = random.Random(0)
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    offsets = ["Z", "+00:00", "+01:00", "-05:00", "+05:30"]
+    values = []
+    for _ in range(n):
+        dt = start + timedelta(seconds=rng.randrange(10**8))
+        values.append(
+            dt.strftime("%Y-%m-%dT%H:%M:%S")
+            + f".{rng.randrange(10**6):06d}"
+            + rng.choice(offsets)
+        )
+    return values
+
+
+def report(label: str, seconds: float) -> None:
+    print(f"{label:<34} {seconds * 1000:8.1f} ms  {N / seconds:>12,.0f} values/s")
+
+
+def main() -> None:
+    values = make_values(N)
+
+    def best(fn) -> float:
+        return min(timeit.repeat(fn, number=1, repeat=ROUNDS))
+
+    report(
+        "datetime.fromisoformat (loop)",
+        best(lambda: [datetime.fromisoformat(v) for v in values]),
+    )
+    report("parse_rfc3339 (loop)", best(lambda: [parse_rfc3339(v) for v in values]))
+    report("parse_rfc3339_many", best(lambda: parse_rfc3339_many(values)))
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("numpy not installed, skipping parse_rfc3339_datetime64")
+        return
+    report("parse_rfc3339_datetime64", best(lambda: parse_rfc3339_datetime64(values)))
+
+
+if __name__ == "__main__":
+    main()
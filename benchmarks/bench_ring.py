@@ -0,0 +1,60 @@
+"""
+HashRing lookup throughput and rebalance cost for 64 Postgres shards.
+
+Run with: python benchmarks/bench_ring.py
+"""
+
+import timeit
+
+from roskarl import DSN
+from roskarl.ring import HashRing
+
+SHARDS = 64
+N = 1_000_000
+ROUNDS = 5
+
+
+def shard(i: int) -> DSN:
+    return DSN("postgresql", "app", "secret", f"shard{i}.internal", 5432, "app")
+
+
+def main() -> None:
+    ring = HashRing([shard(i) for i in range(SHARDS)])
+    keys = [f"tenant-{i}" for i in range(N)]
+    byte_keys = [key.encode() for key in keys]
+
+    def report(label: str, seconds: float, n: int = N) -> None:
+        print(f"{label:<32} {seconds * 1000:8.1f} ms  {n / seconds:>12,.0f} lookups/s")
+
+    get = ring.get
+    report(
+        "get (str keys)",
+        min(timeit.repeat(lambda: [get(k) for k in keys], number=1, repeat=ROUNDS)),
+    )
+    report(
+        "get_many (str keys)",
+        min(timeit.repeat(lambda: ring.get_many(keys), number=1, repeat=ROUNDS)),
+    )
+    report(
+        "get_many (bytes keys)",
+        min(timeit.repeat(lambda: ring.get_many(byte_keys), number=1, repeat=ROUNDS)),
+    )
+
+    build = min(
+        timeit.repeat(
+            lambda: HashRing([shard(i) for i in range(SHARDS)]), number=1, repeat=ROUNDS
+        )
+    )
+    print(f"{'build ring (64 x 160 vnodes)':<32} {build * 1000:8.1f} ms")
+
+    before = ring.get_many(keys)
+    ring.add(shard(SHARDS))
+    after = ring.get_many(keys)
+    moved = sum(b != a for b, a in zip(before, after))
+    print(
+        f"adding shard {SHARDS} moved {moved / N:.2%} of keys (ideal {1 / (SHARDS + 1):.2%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
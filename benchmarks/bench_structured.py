@@ -0,0 +1,45 @@
+"""
+Reads a ~1 MB JSON document from the environment: json.loads on every read
+vs env_var_json (parses every read) vs env_var_json(frozen=True), which
+parses once per raw value and then returns the cached, immutable result.
+
+Run with: python benchmarks/bench_structured.py
+"""
+
+import json
+import os
+import timeit
+
+from roskarl import env_var_json
+
+ROUNDS = 5
+NUMBER = 20
+
+DOCUMENT = {
+    "routes": [
+        {"path": f"/service/{i}", "weight": i % 7, "tags": ["a", "b", "c"]}
+        for i in range(16_000)
+    ]
+}
+os.environ["BENCH_ROUTING"] = json.dumps(DOCUMENT)
+
+
+def report(label: str, seconds: float) -> None:
+    print(f"{label:<30} {seconds / NUMBER * 1e3:10.4f} ms/read")
+
+
+def main() -> None:
+    raw = os.environ["BENCH_ROUTING"]
+    print(f"{len(raw) / 1e6:.2f} MB of JSON")
+    assert env_var_json("BENCH_ROUTING") == json.loads(raw)
+    cases = {
+        "json.loads(os.environ[...])": lambda: json.loads(os.environ["BENCH_ROUTING"]),
+        "env_var_json": lambda: env_var_json("BENCH_ROUTING"),
+        "env_var_json(frozen=True)": lambda: env_var_json("BENCH_ROUTING", frozen=True),
+    }
+    for label, case in cases.items():
+        report(label, min(timeit.repeat(case, number=NUMBER, repeat=ROUNDS)))
+
+
+if __name__ == "__main__":
+    main()
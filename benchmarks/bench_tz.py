@@ -0,0 +1,72 @@
+"""
+Validates a few thousand per-tenant timezones with ZoneInfo vs roskarl.tz.
+
+Run with: python benchmarks/bench_tz.py
+"""
+
+import random
+import timeit
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
+from roskarl.tz import clear_zone_cache, load_zone
+
+TENANTS = 5_000
+ROUNDS = 5
+
+
+def make_tenant_zones(n: int) -> list[str]:
+    rng = random.Random(0)
+    zones = sorted(available_timezones())
+    # a handful of typos, as you'd get from hand-edited tenant config
+    return [
+        rng.choice(zones) if rng.random() > 0.01 else "Europe/Stokholm"
+        for _ in range(n)
+    ]
+
+
+def validate(loader, keys: list[str]) -> int:
+    valid = 0
+    for key in keys:
+        try:
+            loader(key)
+            valid += 1
+        except ZoneInfoNotFoundError:
+            pass
+    return valid
+
+
+def report(label: str, seconds: float) -> None:
+    print(f"{label:<36} {seconds * 1000:8.2f} ms  {TENANTS / seconds:>12,.0f} zones/s")
+
+
+def main() -> None:
+    keys = make_tenant_zones(TENANTS)
+
+    def cold_zoneinfo() -> None:
+        ZoneInfo.clear_cache()
+        validate(ZoneInfo, keys)
+
+    def cold_roskarl() -> None:
+        clear_zone_cache()
+        validate(load_zone, keys)
+
+    report(
+        "ZoneInfo (cold cache)",
+        min(timeit.repeat(cold_zoneinfo, number=1, repeat=ROUNDS)),
+    )
+    report(
+        "load_zone (cold cache)",
+        min(timeit.repeat(cold_roskarl, number=1, repeat=ROUNDS)),
+    )
+    report(
+        "ZoneInfo (warm)",
+        min(timeit.repeat(lambda: validate(ZoneInfo, keys), number=1, repeat=ROUNDS)),
+    )
+    report(
+        "load_zone (warm)",
+        min(timeit.repeat(lambda: validate(load_zone, keys), number=1, repeat=ROUNDS)),
+    )
+
+
+if __name__ == "__main__":
+    main()
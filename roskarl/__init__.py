@@ -1,35 +1,52 @@
-from roskarl.env import (
-    env_var_bool,
-    env_var_custom,
-    env_var_duration,
-    env_var_enum,
-    env_var_float,
-    env_var_int,
-    env_var_list,
-    env_var_log_level,
-    env_var_path,
-    env_var_secret,
-    env_var_url,
-    env_var,
-    env_var_tz,
-    env_var_dsn,
-    env_var_rfc3339_datetime,
-    env_var_iso8601_datetime,
-    DSN,
-    Secret,
-)
-from roskarl.cron import (
-    env_var_cron,
-    env_var_interval_expression,
-    env_var_interval_expression_extended,
-    IntervalExpression,
-    IntervalExpressionExtended,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from roskarl.env import (
+        env_var_bool,
+        env_var_custom,
+        env_var_custom_bytes,
+        env_var_bytes,
+        env_var_base64,
+        env_var_base64_view,
+        env_var_duration,
+        env_var_enum,
+        env_var_float,
+        env_var_int,
+        env_var_list,
+        env_var_log_level,
+        env_var_path,
+        env_var_secret,
+        env_var_url,
+        env_var_parsed_url,
+        env_var,
+        env_var_tz,
+        env_var_zoneinfo,
+        env_var_dsn,
+        env_var_dsn_set,
+        env_var_rfc3339_datetime,
+        env_var_iso8601_datetime,
+        DSN,
+        Secret,
+        URL,
+    )
+    from roskarl.cron import (
+        env_var_cron,
+        env_var_interval_expression,
+        env_var_interval_expression_extended,
+        IntervalExpression,
+        IntervalExpressionExtended,
+    )
+    from roskarl.structured import env_var_json, env_var_toml
 
 __all__ = [
     "env_var_bool",
     "env_var_cron",
     "env_var_custom",
+    "env_var_custom_bytes",
+    "env_var_bytes",
+    "env_var_base64",
+    "env_var_base64_view",
     "env_var_duration",
     "env_var_enum",
     "env_var_float",
@@ -39,16 +56,62 @@ __all__ = [
     "env_var_path",
     "env_var_secret",
     "env_var_url",
+    "env_var_parsed_url",
     "env_var",
     "env_var_tz",
+    "env_var_zoneinfo",
     "env_var_dsn",
+    "env_var_dsn_set",
     "env_var_rfc3339_datetime",
     "env_var_iso8601_datetime",
     "DSN",
     "Secret",
+    "URL",
     "env_var_cron",
     "env_var_interval_expression",
     "env_var_interval_expression_extended",
     "IntervalExpression",
     "IntervalExpressionExtended",
+    "env_var_json",
+    "env_var_toml",
 ]
+
+# Exports are imported on first access, so `import roskarl.duration` (as done
+# by modules from `python -m roskarl compile`) doesn't pay for roskarl.env,
+# and nothing imports icron unless a cron helper is used.
+_CRON_EXPORTS = {
+    "env_var_cron",
+    "env_var_interval_expression",
+    "env_var_interval_expression_extended",
+    "IntervalExpression",
+    "IntervalExpressionExtended",
+}
+_STRUCTURED_EXPORTS = {"env_var_json", "env_var_toml"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        # submodules, e.g. `import roskarl; roskarl.env`
+        try:
+            module = import_module(f"roskarl.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"roskarl.{name}":
+                raise
+            raise AttributeError(
+                f"module 'roskarl' has no attribute '{name}'"
+            ) from None
+        globals()[name] = module
+        return module
+    if name in _CRON_EXPORTS:
+        module = "roskarl.cron"
+    elif name in _STRUCTURED_EXPORTS:
+        module = "roskarl.structured"
+    else:
+        module = "roskarl.env"
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,44 @@
+import argparse
+import sys
+from importlib import import_module
+
+from roskarl.codegen import compile_module
+
+
+def _load_class(target: str) -> type:
+    module_name, _, class_name = target.partition(":")
+    if not module_name or not class_name:
+        raise SystemExit(f"Expected 'module:Class', got '{target}'")
+    return getattr(import_module(module_name), class_name)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m roskarl")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_parser = commands.add_parser(
+        "compile",
+        help="generate a standalone loader module for a config dataclass",
+    )
+    compile_parser.add_argument("target", help="the dataclass, as module:Class")
+    compile_parser.add_argument("--prefix", default="", help="variable name prefix")
+    compile_parser.add_argument(
+        "-o", "--output", help="file to write (default: stdout)"
+    )
+    args = parser.parse_args(argv)
+
+    command = f"python -m roskarl compile {args.target}"
+    if args.prefix:
+        command += f" --prefix {args.prefix}"
+    if args.output:
+        command += f" -o {args.output}"
+    source = compile_module(_load_class(args.target), args.prefix, command)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(source)
+    else:
+        sys.stdout.write(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+import dataclasses
+import types
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, TypeVar, Union, get_args, get_origin, get_type_hints
+from zoneinfo import ZoneInfo
+
+from roskarl.cron import (
+    IntervalExpression,
+    IntervalExpressionExtended,
+    env_var_interval_expression,
+    env_var_interval_expression_extended,
+)
+from roskarl.env import (
+    DSN,
+    URL,
+    Secret,
+    env_var,
+    env_var_bool,
+    env_var_custom,
+    env_var_duration,
+    env_var_enum,
+    env_var_float,
+    env_var_int,
+    env_var_iso8601_datetime,
+    env_var_list,
+    env_var_parsed_url,
+    env_var_path,
+    env_var_secret,
+    env_var_zoneinfo,
+    parse_dsn,
+)
+
+T = TypeVar("T")
+
+# Type hint -> helper. Every helper is called as helper(name, *args, default=...,
+# should_print_unset=..., required=...).
+HELPERS: dict[Any, Callable[..., Any]] = {
+    str: env_var,
+    bool: env_var_bool,
+    int: env_var_int,
+    float: env_var_float,
+    timedelta: env_var_duration,
+    datetime: env_var_iso8601_datetime,
+    Path: env_var_path,
+    Secret: env_var_secret,
+    URL: env_var_parsed_url,
+    ZoneInfo: env_var_zoneinfo,
+    list[str]: env_var_list,
+    IntervalExpression: env_var_interval_expression,
+    IntervalExpressionExtended: env_var_interval_expression_extended,
+}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FieldPlan:
+    """How one dataclass field is read: helper(env, *args, ...)."""
+
+    attribute: str
+    env: str
+    helper: Callable[..., Any]
+    args: tuple[Any, ...]
+    default: Any
+    default_factory: Any
+    required: bool
+
+
+def _unwrap_optional(hint: Any) -> tuple[Any, bool]:
+    if get_origin(hint) in (Union, types.UnionType):
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(args) == 1 and len(get_args(hint)) == 2:
+            return args[0], True
+    return hint, False
+
+
+def _helper_for(hint: Any) -> tuple[Callable[..., Any], tuple[Any, ...]] | None:
+    try:
+        helper = HELPERS.get(hint)
+    except TypeError:  # unhashable hint
+        helper = None
+    if helper is not None:
+        return helper, ()
+    if hint is DSN:
+        return env_var_custom, (parse_dsn,)
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return env_var_enum, (hint,)
+    return None
+
+
+def plan_field(field: dataclasses.Field, hint: Any, env: str) -> FieldPlan:
+    """
+    Plans a single dataclass field read from variable env, given its resolved
+    type hint. metadata={"helper": fn} overrides the helper picked from hint.
+    """
+    hint, optional = _unwrap_optional(hint)
+    if "helper" in field.metadata:
+        helper, args = field.metadata["helper"], ()
+    else:
+        found = _helper_for(hint)
+        if found is None:
+            raise TypeError(
+                f"Cannot bind field '{field.name}' of type {hint!r}; "
+                "pass metadata={'helper': ...}"
+            )
+        helper, args = found
+    has_default = (
+        field.default is not dataclasses.MISSING
+        or field.default_factory is not dataclasses.MISSING
+    )
+    return FieldPlan(
+        attribute=field.name,
+        env=env,
+        helper=helper,
+        args=args,
+        default=field.default,
+        default_factory=field.default_factory,
+        required=not optional and not has_default,
+    )
+
+
+def plan(cls: type, prefix: str = "") -> list[FieldPlan]:
+    """
+    Maps every init field of dataclass cls to the helper that reads it. The
+    variable name is prefix + the upper-cased field name, unless the field
+    sets metadata={"env": "NAME"}; metadata={"helper": fn} overrides the
+    helper picked from the type hint.
+    """
+    if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
+        raise TypeError(f"{cls!r} is not a dataclass")
+    hints = get_type_hints(cls, include_extras=True)
+    return [
+        plan_field(
+            field,
+            hints[field.name],
+            field.metadata.get("env", prefix + field.name.upper()),
+        )
+        for field in dataclasses.fields(cls)
+        if field.init
+    ]
+
+
+def read_field(field: FieldPlan) -> Any:
+    """
+    Reads one planned field from the active source, exactly as the generated
+    loaders do, for callers that bind fields one at a time.
+    """
+    kwargs: dict[str, Any] = {}
+    if field.default is not dataclasses.MISSING and field.default is not None:
+        kwargs["default"] = field.default
+    if field.default_factory is not dataclasses.MISSING:
+        kwargs["should_print_unset"] = False
+    if field.required:
+        kwargs["required"] = True
+    value = field.helper(field.env, *field.args, **kwargs)
+    if value is None and field.default_factory is not dataclasses.MISSING:
+        value = field.default_factory()
+    return value
+
+
+def _literal(value: Any) -> bool:
+    return value is None or type(value) in (bool, int, str)
+
+
+def _bind(namespace: dict[str, Any], value: Any, fallback: str) -> str:
+    """Adds value to namespace under its own __name__ if free, else fallback."""
+    name = getattr(value, "__name__", "")
+    if (
+        not name.isidentifier()
+        or name in ("load", "cls")
+        or name.startswith("v_")
+        or namespace.get(name, value) is not value
+    ):
+        name = fallback
+    namespace[name] = value
+    return name
+
+
+def _generate(cls: type, prefix: str) -> tuple[str, dict[str, Any]]:
+    namespace: dict[str, Any] = {"cls": cls}
+    lines = ["def load():"]
+    names = {}
+    for field in plan(cls, prefix):
+        helper_name = _bind(namespace, field.helper, f"helper_{field.attribute}")
+        call = [repr(field.env)]
+        for i, arg in enumerate(field.args):
+            call.append(_bind(namespace, arg, f"arg_{field.attribute}_{i}"))
+        if field.default is not dataclasses.MISSING and field.default is not None:
+            if _literal(field.default):
+                call.append(f"default={field.default!r}")
+            else:
+                namespace[f"default_{field.attribute}"] = field.default
+                call.append(f"default=default_{field.attribute}")
+        if field.default_factory is not dataclasses.MISSING:
+            call.append("should_print_unset=False")
+        if field.required:
+            call.append("required=True")
+        local = f"v_{field.attribute}"
+        names[field.attribute] = local
+        lines.append(f"    {local} = {helper_name}({', '.join(call)})")
+        if field.default_factory is not dataclasses.MISSING:
+            namespace[f"factory_{field.attribute}"] = field.default_factory
+            lines.append(f"    if {local} is None:")
+            lines.append(f"        {local} = factory_{field.attribute}()")
+    arguments = ", ".join(f"{attr}={local}" for attr, local in names.items())
+    lines.append(f"    return cls({arguments})")
+    return "\n".join(lines) + "\n", namespace
+
+
+_LOADERS: dict[tuple[type, str], Callable[[], Any]] = {}
+
+
+def loader(cls: type[T], prefix: str = "") -> Callable[[], T]:
+    """
+    Returns the generated loader for cls: a straight-line function with one
+    helper call per field, built once per (cls, prefix) and cached.
+    """
+    key = (cls, prefix)
+    load_fn = _LOADERS.get(key)
+    if load_fn is None:
+        source, namespace = _generate(cls, prefix)
+        filename = f"<roskarl loader {cls.__module__}.{cls.__qualname__}>"
+        exec(compile(source, filename, "exec"), namespace)
+        load_fn = namespace["load"]
+        load_fn.__qualname__ = f"load_{cls.__qualname__}"
+        load_fn.__roskarl_source__ = source
+        _LOADERS[key] = load_fn
+    return load_fn
+
+
+def load(cls: type[T], prefix: str = "") -> T:
+    """
+    Builds an instance of dataclass cls from environment variables, choosing
+    each field's helper from its type hint: str, bool, int, float, timedelta,
+    datetime, Path, Secret, URL, ZoneInfo, list[str], DSN, Enum subclasses,
+    IntervalExpression and IntervalExpressionExtended, optionally `| None`.
+
+    Fields without a default (and not `| None`) are required. Dataclass
+    defaults and default factories are used when a variable is unset.
+
+    Example:
+        @dataclass
+        class Config:
+            database: DSN
+            timeout: timedelta = timedelta(seconds=30)
+            log_format: str | None = None
+
+        config = load(Config, prefix="APP_")  # APP_DATABASE, APP_TIMEOUT, ...
+    """
+    return loader(cls, prefix)()
+
+
+def clear_loaders() -> None:
+    """Drops every cached loader, e.g. after redefining a class in a REPL."""
+    _LOADERS.clear()
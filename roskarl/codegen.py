@@ -0,0 +1,162 @@
+import dataclasses
+from typing import Any, Callable
+
+from roskarl.bind import FieldPlan, plan
+from roskarl.env import (
+    env_var,
+    env_var_bool,
+    env_var_custom,
+    env_var_duration,
+    env_var_enum,
+    env_var_float,
+    env_var_int,
+    env_var_iso8601_datetime,
+    env_var_list,
+    env_var_parsed_url,
+    env_var_path,
+    env_var_secret,
+    env_var_zoneinfo,
+    parse_dsn,
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Inline:
+    """Parsing code for one type: an expression over `raw` and `{name}`."""
+
+    expression: str
+    imports: tuple[str, ...] = ()
+    support: str = ""
+
+
+_PARSE_WITH = """
+def _parse_with(helper, name, value):
+    with use_source({name: value}):
+        return helper(name, required=True)
+"""
+
+_INLINE: dict[Callable[..., Any], _Inline] = {
+    env_var: _Inline("raw"),
+    env_var_int: _Inline("int(raw)"),
+    env_var_float: _Inline("float(raw)"),
+    env_var_bool: _Inline(
+        "parse_bool(raw)", ("from roskarl.parsers import parse_bool",)
+    ),
+    env_var_list: _Inline('[item.strip() for item in raw.split(",")]'),
+    env_var_path: _Inline("Path(raw)", ("from pathlib import Path",)),
+    env_var_duration: _Inline(
+        "parse_named_duration({name}, raw)",
+        ("from roskarl.duration import parse_named_duration",),
+    ),
+    env_var_iso8601_datetime: _Inline(
+        "parse_named_iso8601({name}, raw)",
+        ("from roskarl.rfc3339 import parse_named_iso8601",),
+    ),
+    env_var_zoneinfo: _Inline(
+        "parse_zone(raw)", ("from roskarl.tz import parse_zone",)
+    ),
+    env_var_secret: _Inline("Secret(raw)", ("from roskarl.env import Secret",)),
+    env_var_parsed_url: _Inline(
+        "parse_named_url({name}, raw)", ("from roskarl.env import parse_named_url",)
+    ),
+}
+
+
+def _import_of(value: Any) -> tuple[str, str]:
+    """Returns ('from module import name', name) for a module-level object."""
+    module, name = value.__module__, value.__qualname__
+    if module == "__main__" or "<locals>" in name or "." in name:
+        raise ValueError(
+            f"{module}.{name} must be defined at module level of an importable module"
+        )
+    return f"from {module} import {name}", name
+
+
+def _quote(value: str) -> str:
+    """A string literal in black's preferred double quotes."""
+    if '"' in value or "\\" in value or not value.isprintable():
+        return repr(value)
+    return f'"{value}"'
+
+
+def _inline_for(field: FieldPlan) -> _Inline:
+    if field.helper is env_var_custom and field.args == (parse_dsn,):
+        return _Inline("parse_dsn(raw)", ("from roskarl.env import parse_dsn",))
+    if field.helper is env_var_enum:
+        line, enum_name = _import_of(field.args[0])
+        return _Inline(
+            f"parse_named_enum({{name}}, {enum_name}, raw)",
+            (line, "from roskarl.parsers import parse_named_enum"),
+        )
+    inline = _INLINE.get(field.helper)
+    if inline is not None:
+        return inline
+    # cron types and metadata helpers: run the helper's own parser on raw
+    line, helper_name = _import_of(field.helper)
+    return _Inline(
+        f"_parse_with({helper_name}, {{name}}, raw)",
+        (line, "from roskarl.source import use_source"),
+        _PARSE_WITH,
+    )
+
+
+def compile_module(cls: type, prefix: str = "", command: str = "") -> str:
+    """
+    Returns the source of a standalone module whose load() builds cls from
+    os.environ with the same variable names, defaults and validation as
+    roskarl.bind.load(cls, prefix), but with no introspection at runtime:
+    one straight-line os.environ.get per field, with the parsing inlined.
+
+    The module only imports the roskarl parsers its fields need — e.g.
+    roskarl.cron (and icron) only when there is a cron field. Helpers listed
+    in field metadata are imported from their module and run as-is.
+
+    The generated module reads os.environ directly, not roskarl sources.
+    """
+    class_import, class_name = _import_of(cls)
+    imports = {"import os", class_import}
+    support: dict[str, None] = {}
+    body = []
+    for field in plan(cls, prefix):
+        inline = _inline_for(field)
+        imports.update(inline.imports)
+        if inline.support:
+            support[inline.support] = None
+        name = field.env
+        expression = inline.expression.format(name=_quote(name))
+        body.append(f"    raw = os.environ.get({_quote(name)})")
+        body.append("    if raw:")
+        body.append(f"        kwargs[{_quote(field.attribute)}] = {expression}")
+        # like roskarl.bind, a None default is no default: the helper prints
+        has_default = (
+            field.default is not dataclasses.MISSING and field.default is not None
+        ) or field.default_factory is not dataclasses.MISSING
+        if field.required:
+            body.append("    else:")
+            message = f"Environment variable '{name}' is not set"
+            body.append(f"        raise ValueError({_quote(message)})")
+        elif not has_default:
+            body.append("    else:")
+            body.append(f"        print({_quote(name + ' not set or set to None.')})")
+            body.append(f"        kwargs[{_quote(field.attribute)}] = None")
+
+    command = command or f"python -m roskarl compile {cls.__module__}:{class_name}"
+    header = [
+        '"""',
+        f"Generated by `{command}`.",
+        f"Do not edit; re-run the command after changing {class_name}.",
+        '"""',
+        "",
+        *sorted(imports, key=lambda line: (not line.startswith("import"), line)),
+        "",
+    ]
+    functions = "".join(f"\n{source}" for source in support)
+    load = [
+        "",
+        "",
+        f"def load() -> {class_name}:",
+        "    kwargs = {}",
+        *body,
+        f"    return {class_name}(**kwargs)",
+    ]
+    return "\n".join(header) + functions + "\n".join(load) + "\n"
@@ -1,6 +1,6 @@
-from typing import Annotated, Literal, overload
+from typing import Annotated, Callable, Literal, overload
 from icron import croniter
-from roskarl.env import env_var_custom
+from roskarl.env import _deferred_default, env_var_custom
 
 
 def _field_kind(field: str, *, ones_allowed: bool) -> str:
@@ -136,6 +136,7 @@ def env_var_cron(
     should_print_unset: bool = ...,
     *,
     required: Literal[True],
+    default_factory: Callable[[], str] | None = ...,
 ) -> str: ...
 
 
@@ -145,6 +146,8 @@ def env_var_cron(
     default: str | None = ...,
     should_print_unset: bool = ...,
     required: bool = ...,
+    *,
+    default_factory: Callable[[], str] | None = ...,
 ) -> str | None: ...
 
 
@@ -153,6 +156,8 @@ def env_var_cron(
     default: str | None = None,
     should_print_unset: bool = True,
     required: bool = False,
+    *,
+    default_factory: Callable[[], str] | None = None,
 ) -> str | None:
     """
     Reads a cron expression from an environment variable.
@@ -168,10 +173,14 @@ def env_var_cron(
             )
         return value
 
-    if default is not None:
-        default = parse(default)
-
-    return env_var_custom(name, parse, default, should_print_unset, required)
+    factory = _deferred_default(name, default, default_factory, parse, env_var_cron)
+    return env_var_custom(
+        name,
+        parse,
+        should_print_unset=should_print_unset,
+        required=required,
+        default_factory=factory,
+    )
 
 
 @overload
@@ -181,6 +190,7 @@ def env_var_interval_expression(
     should_print_unset: bool = ...,
     *,
     required: Literal[True],
+    default_factory: Callable[[], IntervalExpression] | None = ...,
 ) -> IntervalExpression: ...
 
 
@@ -190,6 +200,8 @@ def env_var_interval_expression(
     default: IntervalExpression | None = ...,
     should_print_unset: bool = ...,
     required: bool = ...,
+    *,
+    default_factory: Callable[[], IntervalExpression] | None = ...,
 ) -> IntervalExpression | None: ...
 
 
@@ -198,6 +210,8 @@ def env_var_interval_expression(
     default: IntervalExpression | None = None,
     should_print_unset: bool = True,
     required: bool = False,
+    *,
+    default_factory: Callable[[], IntervalExpression] | None = None,
 ) -> IntervalExpression | None:
     """
     Reads an IntervalExpression from an environment variable.
@@ -222,10 +236,16 @@ def env_var_interval_expression(
             )
         return resolved
 
-    if default is not None:
-        default = parse(default)
-
-    return env_var_custom(name, parse, default, should_print_unset, required)
+    factory = _deferred_default(
+        name, default, default_factory, parse, env_var_interval_expression
+    )
+    return env_var_custom(
+        name,
+        parse,
+        should_print_unset=should_print_unset,
+        required=required,
+        default_factory=factory,
+    )
 
 
 @overload
@@ -235,6 +255,7 @@ def env_var_interval_expression_extended(
     should_print_unset: bool = ...,
     *,
     required: Literal[True],
+    default_factory: Callable[[], IntervalExpressionExtended] | None = ...,
 ) -> IntervalExpressionExtended: ...
 
 
@@ -244,6 +265,8 @@ def env_var_interval_expression_extended(
     default: IntervalExpressionExtended | None = ...,
     should_print_unset: bool = ...,
     required: bool = ...,
+    *,
+    default_factory: Callable[[], IntervalExpressionExtended] | None = ...,
 ) -> IntervalExpressionExtended | None: ...
 
 
@@ -252,6 +275,8 @@ def env_var_interval_expression_extended(
     default: IntervalExpressionExtended | None = None,
     should_print_unset: bool = True,
     required: bool = False,
+    *,
+    default_factory: Callable[[], IntervalExpressionExtended] | None = None,
 ) -> IntervalExpressionExtended | None:
     """
     Reads an IntervalExpressionExtended from an environment variable.
@@ -279,7 +304,13 @@ def env_var_interval_expression_extended(
             )
         return resolved
 
-    if default is not None:
-        default = parse(default)
-
-    return env_var_custom(name, parse, default, should_print_unset, required)
+    factory = _deferred_default(
+        name, default, default_factory, parse, env_var_interval_expression_extended
+    )
+    return env_var_custom(
+        name,
+        parse,
+        should_print_unset=should_print_unset,
+        required=required,
+        default_factory=factory,
+    )
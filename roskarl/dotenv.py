@@ -0,0 +1,96 @@
+import re
+from pathlib import Path
+
+
+# One entry per assignment. Quoted values may span lines; bare values run to
+# the newline and _bare_value cuts off their ' #' comment and trailing blanks
+# (a lazy match up to those backtracks quadratically on runs of blanks).
+# Everything between two matches must be blank lines, comments or bare keys
+# without '=' (which python-dotenv also accepts and leaves unset).
+_ASSIGNMENT_RE = re.compile(
+    r"""
+    ^[ \t]*(?:export[ \t]+)?
+    (?P<key>[A-Za-z_][A-Za-z0-9_.\-]*)
+    [ \t]*=[ \t]*
+    (?:
+        '(?P<single>[^']*)'[ \t]*(?:\#[^\n]*)?
+      | "(?P<double>(?:[^"\\]|\\.)*)"[ \t]*(?:\#[^\n]*)?
+      | (?P<bare>(?:[^'"\n][^\n]*)?)
+    )$
+    """,
+    re.MULTILINE | re.VERBOSE | re.DOTALL,
+)
+_IGNORABLE_RE = re.compile(
+    r"(?:[ \t]*(?:(?:export[ \t]+)?[A-Za-z_][A-Za-z0-9_.\-]*[ \t]*)?(?:\#[^\n]*)?(?:\n|\Z))*"
+)
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\", "$": "$", "'": "'"}
+
+
+def _unescape(match: re.Match[str]) -> str:
+    char = match.group(1)
+    return _ESCAPES.get(char, "\\" + char)
+
+
+def _bare_value(value: str) -> str:
+    """value up to its first ' #' or '\\t#' comment, without trailing blanks."""
+    comment = min(
+        (i for i in (value.find(" #"), value.find("\t#")) if i != -1),
+        default=len(value),
+    )
+    return value[:comment].rstrip(" \t")
+
+
+def _check_gap(text: str, start: int, end: int, origin: str) -> None:
+    gap = _IGNORABLE_RE.match(text, start, end)
+    if gap is None or gap.end() != end:
+        bad = start if gap is None else gap.end()
+        line = text.count("\n", 0, bad) + 1
+        raise ValueError(f"{origin}:{line}: invalid .env line")
+
+
+def parse_dotenv(text: str, origin: str = "<string>") -> dict[str, str]:
+    """
+    Parses .env content into a dict, without touching os.environ.
+
+    Supports KEY=value, 'export KEY=value', whitespace around '=', comments
+    (full-line, or ' #' after a value), single-quoted literals, double-quoted
+    values with backslash escapes (\\n, \\t, \\r, \\", \\\\, \\$), and quoted
+    values spanning several lines. Later assignments win. ${VAR} references
+    are kept verbatim.
+
+    The whole buffer is scanned by one compiled regex, so the per-line work
+    happens in C rather than in a Python loop. Raises ValueError naming the
+    line of the first thing that isn't a valid assignment, comment or blank.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    result: dict[str, str] = {}
+    position = 0
+    for match in _ASSIGNMENT_RE.finditer(text):
+        if match.start() != position:
+            _check_gap(text, position, match.start(), origin)
+        key, single, double, bare = match.group("key", "single", "double", "bare")
+        if single is not None:
+            value = single
+        elif double is not None:
+            value = _ESCAPE_RE.sub(_unescape, double) if "\\" in double else double
+        else:
+            value = _bare_value(bare)
+        result[key] = value
+        position = match.end()
+    if position != len(text):
+        _check_gap(text, position, len(text), origin)
+    return result
+
+
+def read_dotenv(path: str | Path, encoding: str = "utf-8") -> dict[str, str]:
+    """
+    Reads and parses a .env file. The result is a plain dict, usable directly
+    as a roskarl.source:
+
+        with use_source(ChainMap(os.environ, read_dotenv(".env"))):
+            ...
+    """
+    path = Path(path)
+    return parse_dotenv(path.read_text(encoding=encoding), origin=str(path))
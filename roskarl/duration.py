@@ -0,0 +1,38 @@
+import re
+from datetime import timedelta
+
+_DURATION_RE = re.compile(r"^(?:\d+(?:ms|s|m|h|d))+$")
+_DURATION_PART = re.compile(r"(\d+)(ms|s|m|h|d)")
+_DURATION_UNITS = {
+    "ms": "milliseconds",
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+}
+
+
+def parse_duration(value: str) -> timedelta:
+    """
+    Parses a compound duration ('30s', '5m', '1h30m', '500ms', '7d', '1h 30m')
+    into a timedelta. Raises ValueError for anything else.
+    """
+    cleaned = value.replace(" ", "")
+    if not _DURATION_RE.fullmatch(cleaned):
+        raise ValueError(f"Not a valid duration: '{value}'")
+    kwargs: dict[str, int] = {}
+    for num, unit in _DURATION_PART.findall(cleaned):
+        key = _DURATION_UNITS[unit]
+        kwargs[key] = kwargs.get(key, 0) + int(num)
+    return timedelta(**kwargs)
+
+
+def parse_named_duration(name: str, value: str) -> timedelta:
+    """parse_duration, with an error message naming the variable."""
+    try:
+        return parse_duration(value)
+    except ValueError:
+        raise ValueError(
+            f"'{name}' is not a valid duration: '{value}'. "
+            "Expected format like '30s', '5m', '1h30m', '500ms'."
+        ) from None
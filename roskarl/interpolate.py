@@ -0,0 +1,196 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Mapping
+
+from roskarl.source import Source
+
+_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+@dataclass(frozen=True, slots=True)
+class _Ref:
+    name: str
+    default: "tuple[str | _Ref, ...] | None"
+
+
+_Parts = tuple[str | _Ref, ...]
+
+
+def _scan(value: str, start: int, nested: bool) -> tuple[list[str | _Ref], int]:
+    parts: list[str | _Ref] = []
+    literal: list[str] = []
+    i = start
+    while True:
+        j = value.find("$", i)
+        if nested:
+            close = value.find("}", i)
+            if close != -1 and (j == -1 or close < j):
+                literal.append(value[i:close])
+                parts.append("".join(literal))
+                return parts, close + 1
+        if j == -1:
+            if nested:
+                raise ValueError("unterminated '${' reference")
+            literal.append(value[i:])
+            parts.append("".join(literal))
+            return parts, len(value)
+        literal.append(value[i:j])
+        if value.startswith("$$", j):
+            literal.append("$")
+            i = j + 2
+            continue
+        if not value.startswith("${", j):
+            literal.append("$")
+            i = j + 1
+            continue
+        match = _NAME_RE.match(value, j + 2)
+        if match is None:
+            raise ValueError("invalid variable name in '${...}' reference")
+        name, end = match[0], match.end()
+        parts.append("".join(literal))
+        literal.clear()
+        if value.startswith("}", end):
+            parts.append(_Ref(name, None))
+            i = end + 1
+        elif value.startswith(":-", end):
+            default, i = _scan(value, end + 2, nested=True)
+            parts.append(_Ref(name, tuple(part for part in default if part != "")))
+        else:
+            raise ValueError("expected '}' or ':-' after variable name")
+
+
+@lru_cache(maxsize=1024)
+def parse_template(value: str) -> _Parts:
+    """
+    Splits value into literal strings and ${VAR} / ${VAR:-default} references.
+    '$$' is a literal '$', as is any '$' not followed by '{'. Defaults may
+    themselves contain references.
+    """
+    if "$" not in value:
+        return (value,)
+    parts, _ = _scan(value, 0, nested=False)
+    return tuple(part for part in parts if part != "")
+
+
+def _references(parts: _Parts, resolved: Mapping[str, str | None]) -> Iterator[str]:
+    """
+    Yields the names parts depends on. A default's references are only
+    yielded if its variable resolves empty, so, as in the shell, an unused
+    default can't create a cycle. The caller resolves each name before
+    resuming the iterator.
+    """
+    for part in parts:
+        if isinstance(part, _Ref):
+            yield part.name
+            if part.default is not None and not resolved[part.name]:
+                yield from _references(part.default, resolved)
+
+
+def _render(parts: _Parts, resolved: Mapping[str, str | None]) -> str:
+    if len(parts) == 1 and isinstance(parts[0], str):
+        return parts[0]
+    out = []
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+            continue
+        value = resolved[part.name]
+        if not value and part.default is not None:
+            out.append(_render(part.default, resolved))
+        elif value:
+            out.append(value)
+    return "".join(out)
+
+
+class Interpolated(Mapping[str, str]):
+    """
+    A source that expands ${VAR} and ${VAR:-default} references in the values
+    of another source, e.g. DATABASE_URL=postgresql://${DB_USER}@${DB_HOST}/app.
+    As in the shell, an unset reference expands to "" and the default is used
+    when the variable is unset or empty.
+
+    References form a dependency graph that is walked depth-first (without
+    recursion, so long chains are fine) and resolved in topological order.
+    Every resolved value is memoized, so each raw value is expanded at most
+    once however many others reference it; call clear() after the underlying
+    source changes. A cycle raises ValueError naming the variables in it.
+
+    Example:
+        set_source(Interpolated(os.environ))
+    """
+
+    __slots__ = ("source", "_resolved")
+
+    def __init__(self, source: Source) -> None:
+        self.source = source
+        self._resolved: dict[str, str | None] = {}
+
+    def clear(self) -> None:
+        """Forgets every expanded value."""
+        self._resolved = {}
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        value = self._resolve(name)
+        return default if value is None else value
+
+    def __getitem__(self, name: str) -> str:
+        value = self._resolve(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.source)
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def _parts(self, name: str) -> _Parts | None:
+        raw = self.source.get(name)
+        if raw is None:
+            return None
+        try:
+            return parse_template(raw)
+        except ValueError as exc:
+            raise ValueError(f"'{name}' has an invalid reference: {exc}") from None
+
+    def _resolve(self, root: str) -> str | None:
+        resolved = self._resolved
+        if root in resolved:
+            return resolved[root]
+        parts = {root: self._parts(root)}
+        path = [root]
+        on_path = {root}
+        pending = [_references(parts[root] or (), resolved)]
+        while pending:
+            for dependency in pending[-1]:
+                if dependency in resolved:
+                    continue
+                if dependency in on_path:
+                    cycle = " -> ".join(path[path.index(dependency) :] + [dependency])
+                    raise ValueError(f"Cyclic variable reference: {cycle}")
+                if dependency not in parts:
+                    parts[dependency] = self._parts(dependency)
+                path.append(dependency)
+                on_path.add(dependency)
+                pending.append(_references(parts[dependency] or (), resolved))
+                break
+            else:
+                pending.pop()
+                name = path.pop()
+                on_path.discard(name)
+                own = parts[name]
+                resolved[name] = None if own is None else _render(own, resolved)
+        return resolved[root]
+
+
+def interpolate(values: Mapping[str, str]) -> dict[str, str]:
+    """
+    Expands every value of values against the others and returns a new dict.
+
+    Example:
+        interpolate(read_dotenv(".env"))
+    """
+    expanded = Interpolated(values)
+    return {name: expanded[name] for name in values}
@@ -0,0 +1,111 @@
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+from roskarl.source import _overlay, _scoped_source
+
+T = TypeVar("T")
+
+_UNRESOLVED: Any = object()
+
+
+class LazyEnv(Generic[T]):
+    """
+    A class attribute that reads its variable with an env_var_* helper on
+    first access and caches the result:
+
+        class Settings:
+            timeout = LazyEnv(env_var_duration, "TIMEOUT", required=True)
+            schedule = LazyEnv(env_var_cron, "SCHEDULE")
+
+        Settings.timeout  # env_var_duration("TIMEOUT", required=True), once
+
+    Settings a code path never touches are never parsed, so a CLI that needs
+    two of two hundred settings only pays for two. Call validate_all(Settings)
+    at server startup to resolve everything up front and fail fast.
+
+    The value is shared by the class and all its instances. Concurrent first
+    accesses resolve it once. Inside override() or use_source() the variable
+    is read through the helper on every access and nothing is cached, so a
+    scoped value never leaks to readers outside the block.
+    """
+
+    __slots__ = ("helper", "name", "args", "kwargs", "attribute", "_value", "_lock")
+
+    def __init__(
+        self, helper: Callable[..., T], name: str, *args: Any, **kwargs: Any
+    ) -> None:
+        self.helper = helper
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.attribute = name
+        self._value: T = _UNRESOLVED
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner: type, attribute: str) -> None:
+        self.attribute = attribute
+
+    def __get__(self, instance: object, owner: type | None = None) -> T:
+        value = self._value
+        if value is _UNRESOLVED or _scoped():
+            return self.resolve()
+        return value
+
+    def __repr__(self) -> str:
+        helper = getattr(self.helper, "__name__", None) or repr(self.helper)
+        return f"LazyEnv({helper}, {self.name!r})"
+
+    @property
+    def resolved(self) -> bool:
+        return self._value is not _UNRESOLVED
+
+    def resolve(self) -> T:
+        """
+        Returns the cached value, reading the variable if needed. While an
+        override or scoped source is active, reads it without caching.
+        """
+        if _scoped():
+            return self.helper(self.name, *self.args, **self.kwargs)
+        with self._lock:
+            if self._value is _UNRESOLVED:
+                self._value = self.helper(self.name, *self.args, **self.kwargs)
+            return self._value
+
+    def reset(self) -> None:
+        """Forgets the cached value; the next access reads the variable again."""
+        with self._lock:
+            self._value = _UNRESOLVED
+
+
+def _scoped() -> bool:
+    """Whether an override() or use_source() block is active here."""
+    return _overlay.get() is not None or _scoped_source.get() is not None
+
+
+def lazy_fields(config: type | object) -> dict[str, LazyEnv[Any]]:
+    """Returns the LazyEnv attributes of a class (or an instance's class)."""
+    cls = config if isinstance(config, type) else type(config)
+    fields: dict[str, LazyEnv[Any]] = {}
+    for klass in reversed(cls.__mro__):
+        for attribute, value in vars(klass).items():
+            if isinstance(value, LazyEnv):
+                fields[attribute] = value
+            else:
+                fields.pop(attribute, None)
+    return fields
+
+
+def validate_all(config: type | object) -> dict[str, Any]:
+    """
+    Resolves every LazyEnv on config (including inherited ones) and returns
+    their values by attribute name. Raises the first helper error.
+    """
+    return {
+        attribute: field.resolve() for attribute, field in lazy_fields(config).items()
+    }
+
+
+def reset_all(config: type | object) -> None:
+    """Forgets every cached LazyEnv value on config, e.g. between tests."""
+    for field in lazy_fields(config).values():
+        field.reset()
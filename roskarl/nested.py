@@ -0,0 +1,163 @@
+import dataclasses
+from typing import Any, TypeVar, get_type_hints
+
+from roskarl.bind import (
+    FieldPlan,
+    _helper_for,
+    _unwrap_optional,
+    plan_field,
+    read_field,
+)
+from roskarl.source import Source, current_source, use_source
+
+T = TypeVar("T")
+
+Tree = dict[str, Any]
+"""Nested dicts of lower-cased name segments; the leaves are raw str values."""
+
+
+def decode(
+    source: Source | None = None, prefix: str = "", delimiter: str = "__"
+) -> Tree:
+    """
+    Splits every variable named prefix + A + delimiter + B ... into a nested
+    dict {"a": {"b": value}}, in a single pass over source (default: the
+    active source). Segments are lower-cased; names with an empty segment are
+    skipped. A name that is both a value and a section raises ValueError.
+
+    Example:
+        # APP__DB__HOST=db, APP__DB__POOL__SIZE=10
+        decode(prefix="APP__")  # {"db": {"host": "db", "pool": {"size": "10"}}}
+    """
+    if not delimiter:
+        raise ValueError("delimiter must not be empty")
+    source = current_source() if source is None else source
+    start = len(prefix)
+    tree: Tree = {}
+    for name, value in source.items():
+        if not name.startswith(prefix):
+            continue
+        *path, leaf = name[start:].lower().split(delimiter)
+        if not leaf or not all(path):
+            continue
+        node = tree
+        for depth, segment in enumerate(path, 1):
+            child = node.setdefault(segment, {})
+            if not isinstance(child, dict):
+                section = prefix + delimiter.join(path[:depth]).upper()
+                raise ValueError(f"'{section}' is both a value and a section")
+            node = child
+        if leaf in node:
+            if isinstance(node[leaf], dict):
+                raise ValueError(f"'{name}' is both a value and a section")
+            raise ValueError(f"'{name}' is set more than once (case differs)")
+        node[leaf] = value
+    return tree
+
+
+def _is_section(hint: Any) -> bool:
+    """Dataclasses are sections, except those with a helper, like DSN."""
+    return (
+        isinstance(hint, type)
+        and dataclasses.is_dataclass(hint)
+        and _helper_for(hint) is None
+    )
+
+
+def bind_tree(
+    cls: type[T],
+    tree: Tree,
+    prefix: str = "",
+    delimiter: str = "__",
+    strict: bool = False,
+) -> T:
+    """
+    Builds dataclass cls from a tree returned by decode(). Fields typed as a
+    dataclass are sections, bound recursively from their subtree; every other
+    field is read with the same helper, default and required semantics as
+    roskarl.bind.load, with prefix + the full path as the variable name.
+    metadata={"env": "SEGMENT"} renames a field's segment.
+
+    With strict=True, segments that match no field raise ValueError, which
+    catches misspelled variables.
+    """
+    if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
+        raise TypeError(f"{cls!r} is not a dataclass")
+    hints = get_type_hints(cls, include_extras=True)
+    kwargs: dict[str, Any] = {}
+    leaves: dict[str, str] = {}
+    plans: list[FieldPlan] = []
+    known: set[str] = set()
+    for field in dataclasses.fields(cls):
+        if not field.init:
+            continue
+        segment = field.metadata.get("env", field.name).lower()
+        known.add(segment)
+        name = prefix + segment.upper()
+        value = tree.get(segment)
+        hint, optional = _unwrap_optional(hints[field.name])
+        if _is_section(hint) and "helper" not in field.metadata:
+            if isinstance(value, str):
+                raise ValueError(
+                    f"'{name}' is a section; set {name}{delimiter}<FIELD> instead"
+                )
+            if value is None:
+                if (
+                    field.default is not dataclasses.MISSING
+                    or field.default_factory is not dataclasses.MISSING
+                ):
+                    continue
+                if optional:
+                    kwargs[field.name] = None
+                    continue
+            kwargs[field.name] = bind_tree(
+                hint, value or {}, name + delimiter, delimiter, strict
+            )
+            continue
+        if isinstance(value, dict):
+            raise ValueError(f"'{name}' is a value, but is set as a section")
+        if value is not None:
+            leaves[name] = value
+        plans.append(plan_field(field, hints[field.name], name))
+    if strict:
+        unknown = sorted(prefix + segment.upper() for segment in tree.keys() - known)
+        if unknown:
+            raise ValueError(f"Unknown variables or sections: {', '.join(unknown)}")
+    with use_source(leaves):
+        for field_plan in plans:
+            kwargs[field_plan.attribute] = read_field(field_plan)
+    return cls(**kwargs)
+
+
+def load(
+    cls: type[T],
+    prefix: str = "",
+    delimiter: str = "__",
+    source: Source | None = None,
+    strict: bool = False,
+) -> T:
+    """
+    Builds dataclass cls, including nested dataclass sections, from variables
+    like APP__DB__PRIMARY__HOST with one scan of the source.
+
+    Example:
+        @dataclass
+        class Pool:
+            size: int = 5
+            timeout: timedelta = timedelta(seconds=30)
+
+        @dataclass
+        class Database:
+            primary: DSN
+            pool: Pool = field(default_factory=Pool)
+
+        @dataclass
+        class Config:
+            db: Database
+            debug: bool = False
+
+        # APP__DB__PRIMARY=postgresql://..., APP__DB__POOL__SIZE=10
+        config = load(Config, prefix="APP__")
+    """
+    tree = decode(source, prefix, delimiter)
+    return bind_tree(cls, tree, prefix, delimiter, strict)
@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import TypeVar
+
+EnumT = TypeVar("EnumT", bound=Enum)
+
+
+def parse_bool(value: str) -> bool:
+    """'true' or 'false', case insensitive. Raises ValueError for anything else."""
+    if value.upper() == "TRUE":
+        return True
+    if value.upper() == "FALSE":
+        return False
+    raise ValueError(
+        f"Bool must be set to true or false (case insensitive), not: '{value}'"
+    )
+
+
+def parse_named_enum(name: str, enum_class: type[EnumT], value: str) -> EnumT:
+    """The member of enum_class whose .value is value; the error names name."""
+    try:
+        return enum_class(value)
+    except ValueError:
+        valid = [e.value for e in enum_class]
+        raise ValueError(f"'{name}' must be one of {valid}, got '{value}'") from None
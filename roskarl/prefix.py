@@ -0,0 +1,139 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Iterator, Mapping
+
+from roskarl.source import Source, current_source, use_source
+
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def _successor(prefix: str) -> str | None:
+    """The smallest string greater than every string starting with prefix."""
+    stripped = prefix.rstrip(_MAX_CHAR)
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+class PrefixView(Mapping[str, str]):
+    """
+    The variables of a PrefixIndex that start with a prefix, optionally with
+    the prefix stripped from their names. Holds a slice position into the
+    index, not a copy, and can be used as a source.
+    """
+
+    __slots__ = ("_index", "_prefix", "_strip", "_start", "_stop")
+
+    def __init__(
+        self, index: "PrefixIndex", prefix: str, strip: bool, start: int, stop: int
+    ) -> None:
+        self._index = index
+        self._prefix = prefix
+        self._strip = strip
+        self._start = start
+        self._stop = stop
+
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    def _full(self, name: object) -> str | None:
+        if not isinstance(name, str):
+            return None
+        if self._strip:
+            return self._prefix + name
+        return name if name.startswith(self._prefix) else None
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        full = self._full(name)
+        if full is None:
+            return default
+        return self._index._values.get(full, default)
+
+    def __getitem__(self, name: str) -> str:
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        full = self._full(name)
+        return full is not None and full in self._index._values
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self._index._keys
+        if not self._strip:
+            return iter(keys[self._start : self._stop])
+        cut = len(self._prefix)
+        return (keys[i][cut:] for i in range(self._start, self._stop))
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __repr__(self) -> str:
+        return f"PrefixView({self._prefix!r}, {len(self)} variables)"
+
+
+class PrefixIndex(Mapping[str, str]):
+    """
+    A snapshot of a source with its names kept sorted, so every variable
+    starting with a prefix is found with two bisects: O(log n) to locate the
+    group plus O(k) to walk it, instead of scanning the whole environment.
+
+        index = PrefixIndex(os.environ)
+        with index.scope("PLUGIN_KAFKA_"):
+            brokers = env_var_list("BROKERS")  # reads PLUGIN_KAFKA_BROKERS
+
+    The index is immutable; build a new one to pick up changes.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, source: Source | None = None) -> None:
+        values = dict(current_source() if source is None else source)
+        self._values: dict[str, str] = values
+        self._keys: list[str] = sorted(values)
+
+    def _span(self, prefix: str) -> tuple[int, int]:
+        keys = self._keys
+        start = bisect_left(keys, prefix)
+        upper = _successor(prefix)
+        stop = len(keys) if upper is None else bisect_left(keys, upper, start)
+        return start, stop
+
+    def view(self, prefix: str, strip: bool = False) -> PrefixView:
+        """
+        The variables whose names start with prefix, as a read-only mapping.
+        With strip=True the names are given (and looked up) without prefix.
+        """
+        start, stop = self._span(prefix)
+        return PrefixView(self, prefix, strip, start, stop)
+
+    def count(self, prefix: str) -> int:
+        start, stop = self._span(prefix)
+        return stop - start
+
+    @contextmanager
+    def scope(self, prefix: str) -> Iterator[PrefixView]:
+        """
+        Makes the env_var_* helpers read the variables starting with prefix,
+        with prefix stripped from their names, in the current thread or task.
+        """
+        view = self.view(prefix, strip=True)
+        with use_source(view):
+            yield view
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        return self._values.get(name, default)
+
+    def __getitem__(self, name: str) -> str:
+        return self._values[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
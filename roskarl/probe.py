@@ -0,0 +1,139 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from roskarl.env import DSN, _unbracket
+
+DEFAULT_PORTS: dict[str, int] = {
+    "postgresql": 5432,
+    "postgres": 5432,
+    "mysql": 3306,
+    "mariadb": 3306,
+    "mssql": 1433,
+    "sqlserver": 1433,
+    "db2": 50000,
+    "redis": 6379,
+    "mongodb": 27017,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class HostProbe:
+    """
+    Result of one TCP connect attempt.
+
+    latency is the connect time in seconds, or None if the host could not be
+    reached within the timeout (error then says why).
+    """
+
+    hostname: str
+    port: int
+    latency: float | None
+    error: str | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.latency is not None
+
+
+_PROBES: dict[tuple[str, int], tuple[float, HostProbe]] = {}
+
+
+def clear_probe_cache() -> None:
+    _PROBES.clear()
+
+
+async def _connect(hostname: str, port: int, timeout: float) -> HostProbe:
+    started = time.perf_counter()
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(_unbracket(hostname), port), timeout
+        )
+    except (OSError, asyncio.TimeoutError) as e:
+        return HostProbe(hostname, port, None, repr(e))
+    latency = time.perf_counter() - started
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return HostProbe(hostname, port, latency)
+
+
+async def probe_hosts(
+    hosts: Iterable[tuple[str, int]],
+    timeout: float = 1.0,
+    ttl: float = 30.0,
+) -> list[HostProbe]:
+    """
+    Opens a TCP connection to every (hostname, port) concurrently and returns
+    one HostProbe per host, in the order given. IPv6 literals may keep their
+    URI brackets ('[::1]'), as in DSN.hosts.
+
+    Results are cached per (hostname, port) for ttl seconds, so repeated calls
+    (e.g. one per pool checkout) only hit the network once per TTL window.
+    Pass ttl=0 to always probe.
+    """
+    hosts = list(hosts)
+    now = time.monotonic()
+    results: dict[tuple[str, int], HostProbe] = {}
+    stale: list[tuple[str, int]] = []
+    for host in hosts:
+        cached = _PROBES.get(host)
+        if cached is not None and cached[0] > now:
+            results[host] = cached[1]
+        elif host not in stale:
+            stale.append(host)
+
+    if stale:
+        probes = await asyncio.gather(
+            *(_connect(hostname, port, timeout) for hostname, port in stale)
+        )
+        expires = time.monotonic() + ttl
+        for host, probe in zip(stale, probes):
+            results[host] = probe
+            if ttl > 0:
+                _PROBES[host] = (expires, probe)
+
+    return [results[host] for host in hosts]
+
+
+async def order_hosts(
+    dsn: DSN,
+    timeout: float = 1.0,
+    ttl: float = 30.0,
+    default_port: int | None = None,
+) -> DSN:
+    """
+    Probes every host of a (multi-host) DSN and returns a copy whose hosts are
+    ordered fastest-first: reachable hosts by connect latency, then unreachable
+    ones in their original order. Drivers that try hosts in order (libpq,
+    asyncpg) then connect to the fastest healthy replica first.
+
+    Hosts without a port are probed on default_port, falling back to the
+    protocol's well-known port from DEFAULT_PORTS. Raises ValueError if neither
+    is known.
+    """
+    port_fallback = default_port or DEFAULT_PORTS.get(dsn.protocol)
+    targets: list[tuple[str, int]] = []
+    for hostname, port in dsn.hosts:
+        if port is None:
+            if port_fallback is None:
+                raise ValueError(
+                    f"No port for host '{hostname}' and no default port known "
+                    f"for protocol '{dsn.protocol}'"
+                )
+            port = port_fallback
+        targets.append((hostname, port))
+
+    probes = await probe_hosts(targets, timeout=timeout, ttl=ttl)
+    ranked = sorted(
+        range(len(probes)),
+        key=lambda i: (
+            not probes[i].available,
+            probes[i].latency if probes[i].latency is not None else 0.0,
+            i,
+        ),
+    )
+    return dsn.with_hosts(dsn.hosts[i] for i in ranked)
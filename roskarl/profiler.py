@@ -0,0 +1,250 @@
+import atexit
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+
+@dataclass(slots=True)
+class VariableStats:
+    """What a Profile recorded for one environment variable."""
+
+    name: str
+    parser: str
+    calls: int = 0
+    set: int = 0
+    defaulted: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    lookup_ns: int = 0
+    parse_ns: int = 0
+
+    @property
+    def total_ns(self) -> int:
+        return self.lookup_ns + self.parse_ns
+
+
+@dataclass(slots=True)
+class ParserStats:
+    """Totals for one parser across every variable it read."""
+
+    parser: str
+    variables: int = 0
+    calls: int = 0
+    cache_hits: int = 0
+    parse_ns: int = 0
+
+
+def _describe(parser: Callable[..., Any]) -> str:
+    """'env_var_cron' for env_var_cron.<locals>.parse, else the qualname."""
+    qualname = getattr(parser, "__qualname__", None) or repr(parser)
+    return qualname.split(".<locals>", 1)[0]
+
+
+def _ms(ns: int) -> float:
+    return round(ns / 1e6, 3)
+
+
+class Profile:
+    """
+    Time spent reading each variable: the raw lookup, and the parser (or
+    default / default_factory resolution when the variable is unset), with
+    call counts, set-vs-default counts and hits on roskarl's internal caches.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._variables: dict[str, VariableStats] = {}
+
+    def read(
+        self,
+        name: str,
+        lookup: Callable[[str], V | None],
+        parser: Callable[[V], T],
+        unset: Callable[[], T | None],
+    ) -> T | None:
+        """
+        Reads name as an env_var_* helper would, timing each step: lookup
+        returns the raw value (str, bytes, or e.g. a secret file's path),
+        which parser gets if it is truthy; otherwise unset() is called.
+        """
+        with self._lock:
+            stats = self._variables.get(name)
+            if stats is None:
+                stats = self._variables[name] = VariableStats(name, _describe(parser))
+        started = perf_counter_ns()
+        value = lookup(name)
+        looked_up = perf_counter_ns()
+        token = _current.set(stats)
+        failed = True
+        try:
+            result = parser(value) if value else unset()
+            failed = False
+            return result
+        finally:
+            finished = perf_counter_ns()
+            _current.reset(token)
+            with self._lock:
+                stats.calls += 1
+                if value:
+                    stats.set += 1
+                else:
+                    stats.defaulted += 1
+                stats.errors += failed
+                stats.lookup_ns += looked_up - started
+                stats.parse_ns += finished - looked_up
+
+    def variables(self) -> list[VariableStats]:
+        """Per-variable stats, slowest first."""
+        with self._lock:
+            stats = [replace(s) for s in self._variables.values()]
+        return sorted(stats, key=lambda s: (-s.total_ns, s.name))
+
+    def parsers(self) -> list[ParserStats]:
+        """Per-parser totals, slowest first."""
+        totals: dict[str, ParserStats] = {}
+        for stats in self.variables():
+            parser = totals.setdefault(stats.parser, ParserStats(stats.parser))
+            parser.variables += 1
+            parser.calls += stats.calls
+            parser.cache_hits += stats.cache_hits
+            parser.parse_ns += stats.parse_ns
+        return sorted(totals.values(), key=lambda p: (-p.parse_ns, p.parser))
+
+    def as_dict(self) -> dict[str, Any]:
+        """The report as JSON-able data, with times in milliseconds."""
+        variables = self.variables()
+        return {
+            "total_ms": _ms(sum(s.total_ns for s in variables)),
+            "variables": [
+                {
+                    "name": s.name,
+                    "parser": s.parser,
+                    "calls": s.calls,
+                    "set": s.set,
+                    "defaulted": s.defaulted,
+                    "errors": s.errors,
+                    "cache_hits": s.cache_hits,
+                    "lookup_ms": _ms(s.lookup_ns),
+                    "parse_ms": _ms(s.parse_ns),
+                    "total_ms": _ms(s.total_ns),
+                }
+                for s in variables
+            ],
+            "parsers": [
+                {
+                    "parser": p.parser,
+                    "variables": p.variables,
+                    "calls": p.calls,
+                    "cache_hits": p.cache_hits,
+                    "parse_ms": _ms(p.parse_ns),
+                }
+                for p in self.parsers()
+            ],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def report(self) -> str:
+        """The report as a plain-text table, slowest variables first."""
+        data = self.as_dict()
+        width = max([8] + [len(v["name"]) for v in data["variables"]])
+        lines = [
+            f"roskarl: {len(data['variables'])} variables read "
+            f"in {data['total_ms']:.3f} ms",
+            f"{'variable':<{width}}  calls  set  default  hits"
+            "  lookup ms   parse ms   total ms  parser",
+        ]
+        for v in data["variables"]:
+            lines.append(
+                f"{v['name']:<{width}}  {v['calls']:>5}  {v['set']:>3}"
+                f"  {v['defaulted']:>7}  {v['cache_hits']:>4}"
+                f"  {v['lookup_ms']:>9.3f}  {v['parse_ms']:>9.3f}"
+                f"  {v['total_ms']:>9.3f}  {v['parser']}"
+            )
+        if data["parsers"]:
+            width = max(len(p["parser"]) for p in data["parsers"])
+            lines.append("")
+            lines.append(f"{'parser':<{width}}  variables  calls  hits   parse ms")
+            for p in data["parsers"]:
+                lines.append(
+                    f"{p['parser']:<{width}}  {p['variables']:>9}  {p['calls']:>5}"
+                    f"  {p['cache_hits']:>4}  {p['parse_ms']:>9.3f}"
+                )
+        return "\n".join(lines)
+
+
+# The profile every helper records into, or None. Checked on every read, so
+# that this one comparison is all profiling costs while it is off.
+active: Profile | None = None
+
+# The variable being parsed, so that cache hits can be attributed to it.
+_current: ContextVar[VariableStats | None] = ContextVar(
+    "roskarl_profiled_variable", default=None
+)
+
+
+def cache_hit() -> None:
+    """Called by roskarl's caches on a hit; counts it for the active profile."""
+    profile = active
+    if profile is None:
+        return
+    stats = _current.get()
+    if stats is not None:
+        with profile._lock:
+            stats.cache_hits += 1
+
+
+@contextmanager
+def profiling() -> Iterator[Profile]:
+    """
+    Records every env_var_* read in the with-block, in all threads, into a
+    new Profile. Replaces the active profile (e.g. one started with
+    ROSKARL_PROFILE) until the block ends.
+
+    Example:
+        with profiling() as profile:
+            config = load(Config, prefix="APP_")
+        print(profile.report())
+    """
+    global active
+    previous = active
+    profile = active = Profile()
+    try:
+        yield profile
+    finally:
+        active = previous
+
+
+# ROSKARL_PROFILE values that mean "off" and "report to stderr"; anything else
+# is a path.
+_OFF = frozenset(("0", "false", "no", "off"))
+_STDERR = frozenset(("1", "true", "yes", "on", "stderr"))
+
+
+def _dump(profile: Profile, target: str) -> None:
+    if target.lower() in _STDERR:
+        print(profile.report(), file=sys.stderr)
+        return
+    text = profile.to_json() if target.endswith(".json") else profile.report()
+    with open(target, "w", encoding="utf-8") as file:
+        file.write(text + "\n")
+
+
+# ROSKARL_PROFILE=1 profiles the whole process and prints the report to
+# stderr at exit; ROSKARL_PROFILE=path writes it to path instead (as JSON if
+# path ends with .json), and ROSKARL_PROFILE=0 (or false/no/off) leaves it off.
+# Read from os.environ directly, not from a source.
+_target = os.environ.get("ROSKARL_PROFILE")
+if _target and _target.lower() not in _OFF:
+    active = Profile()
+    atexit.register(_dump, active, _target)
@@ -0,0 +1,138 @@
+import re
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import Any
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NS_PER_SECOND = 1_000_000_000
+
+# Group layout: 1-6 date/time, 7 fraction, 8 'Z', 9-11 numeric offset. A match
+# with lastindex < 8 therefore carries no offset.
+_RFC3339_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[Tt ]"
+    r"([01]\d|2[0-3]):([0-5]\d):([0-5]\d)"
+    r"(?:\.(\d{1,9}))?"
+    r"(?:([Zz])|([+-])([01]\d|2[0-3]):([0-5]\d))?",
+    re.ASCII,
+)
+
+
+def _match(value: str) -> re.Match[str]:
+    match = _RFC3339_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid RFC3339 date-time: '{value}'")
+    return match
+
+
+def parse_fields(value: str) -> tuple[int, int, int, int, int, int, int, int | None]:
+    """
+    Parses an RFC3339 date-time into its raw fields:
+    (year, month, day, hour, minute, second, nanosecond, offset_seconds).
+
+    Grammar: YYYY-MM-DD('T'|'t'|' ')HH:MM:SS[.F{1,9}][('Z'|'z'|±HH:MM)].
+    offset_seconds is None when the offset is omitted, which RFC3339 itself
+    does not allow — callers decide whether to accept that.
+
+    Only the grammar and field ranges are checked here; calendar validity
+    (e.g. February 30th) is left to the date/datetime constructor.
+    """
+    match = _match(value)
+    year, month, day, hour, minute, second, fraction, zulu, sign, oh, om = (
+        match.groups()
+    )
+    offset: int | None = None
+    if zulu:
+        offset = 0
+    elif sign:
+        offset = int(oh) * 3600 + int(om) * 60
+        if sign == "-":
+            offset = -offset
+    return (
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction.ljust(9, "0")) if fraction else 0,
+        offset,
+    )
+
+
+def parse_rfc3339(value: str, require_offset: bool = True) -> datetime:
+    """
+    Parses an RFC3339 date-time string into a datetime.
+
+    The grammar is checked in a single regex pass; the datetime itself is then
+    built by datetime.fromisoformat, which accepts every string the grammar
+    allows except a lowercase 'z'. Fractional seconds beyond microsecond
+    precision are truncated (datetime can't hold nanoseconds — use
+    parse_rfc3339_datetime64 for that). Pass require_offset=False to also
+    accept naive values, which are returned without tzinfo.
+    """
+    match = _match(value)
+    if require_offset and (match.lastindex or 0) < 8:
+        raise ValueError(f"RFC3339 date-time is missing an offset: '{value}'")
+    if match.group(8) == "z":
+        value = value[:-1] + "Z"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid RFC3339 date-time: '{value}'")
+
+
+def parse_rfc3339_many(
+    values: Iterable[str], require_offset: bool = True
+) -> list[datetime]:
+    """Parses every value with parse_rfc3339 and returns the datetimes in order."""
+    return [parse_rfc3339(value, require_offset) for value in values]
+
+
+def parse_rfc3339_epoch_ns(value: str) -> int:
+    """
+    Parses an RFC3339 date-time string into integer nanoseconds since the
+    Unix epoch (UTC), keeping full nanosecond precision. The offset is required.
+    """
+    year, month, day, hour, minute, second, nanosecond, offset = parse_fields(value)
+    if offset is None:
+        raise ValueError(f"RFC3339 date-time is missing an offset: '{value}'")
+    days = date(year, month, day).toordinal() - _EPOCH_ORDINAL
+    seconds = days * 86400 + hour * 3600 + minute * 60 + second - offset
+    return seconds * _NS_PER_SECOND + nanosecond
+
+
+def parse_rfc3339_datetime64(values: Iterable[str]) -> Any:
+    """
+    Parses RFC3339 strings into a numpy datetime64[ns] array normalized to UTC.
+
+    Requires numpy (pip install roskarl[numpy]).
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "parse_rfc3339_datetime64 requires numpy: pip install roskarl[numpy]"
+        ) from e
+    return numpy.array(
+        [parse_rfc3339_epoch_ns(value) for value in values], dtype="int64"
+    ).view("datetime64[ns]")
+
+
+def parse_named_iso8601(name: str, value: str) -> datetime:
+    """
+    Parses an ISO8601 datetime with datetime.fromisoformat, retrying RFC3339
+    variants it rejects on 3.11 (e.g. a lowercase 'z'). The offset is
+    optional. The error message names the variable.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return parse_rfc3339(value, require_offset=False)
+    except ValueError:
+        raise ValueError(
+            f"'{name}' is not a valid ISO8601 datetime string: '{value}'. "
+            "Expected format: 2026-01-01T00:00:00 or 2026-01-01T00:00:00+00:00"
+        ) from None
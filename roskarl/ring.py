@@ -0,0 +1,110 @@
+import hashlib
+from bisect import bisect_right
+from typing import Callable, Generic, Iterable, TypeVar
+from zlib import crc32
+
+T = TypeVar("T")
+
+
+def _point(label: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(label.encode(), digest_size=4).digest(), "big"
+    )
+
+
+class HashRing(Generic[T]):
+    """
+    Consistent-hash ring mapping string keys to nodes (e.g. the DSNs returned
+    by env_var_dsn_set).
+
+    Every node is placed on a 32-bit ring at `vnodes` pseudo-random points,
+    derived from node_id(node) (str() by default — for a DSN that is the
+    password-masked URL, so host/port/database identify a shard). The points
+    are kept as one sorted array, so a lookup is a crc32 of the key plus a
+    bisect: O(log(nodes * vnodes)). Adding or removing a node only moves the
+    keys on the arcs that node gains or loses, roughly 1/n of them.
+
+    Lookups never see a half-built table: add/remove build new arrays and swap
+    them in with a single assignment, so the ring can be shared across threads.
+    """
+
+    __slots__ = ("vnodes", "_node_id", "_nodes", "_table")
+
+    def __init__(
+        self,
+        nodes: Iterable[T] = (),
+        vnodes: int = 160,
+        node_id: Callable[[T], str] = str,
+    ) -> None:
+        if vnodes < 1:
+            raise ValueError("vnodes must be at least 1")
+        self.vnodes = vnodes
+        self._node_id = node_id
+        self._nodes: dict[str, T] = {}
+        for node in nodes:
+            self._nodes[self._checked_id(node)] = node
+        self._rebuild()
+
+    def _checked_id(self, node: T) -> str:
+        ident = self._node_id(node)
+        if ident in self._nodes:
+            raise ValueError(f"Duplicate node on hash ring: '{ident}'")
+        return ident
+
+    def _rebuild(self) -> None:
+        ring = sorted(
+            (
+                (_point(f"{ident}#{i}"), ident, node)
+                for ident, node in self._nodes.items()
+                for i in range(self.vnodes)
+            ),
+            key=lambda entry: (entry[0], entry[1]),
+        )
+        points = [point for point, _, _ in ring]
+        owners = [node for _, _, node in ring]
+        # bisect_right returns len(points) for keys past the last point; the
+        # extra owner wraps those around to the first node on the ring.
+        if owners:
+            owners.append(owners[0])
+        self._table = (points, owners)
+
+    @property
+    def nodes(self) -> tuple[T, ...]:
+        return tuple(self._nodes.values())
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add(self, node: T) -> None:
+        self._nodes[self._checked_id(node)] = node
+        self._rebuild()
+
+    def remove(self, node: T) -> None:
+        ident = self._node_id(node)
+        if ident not in self._nodes:
+            raise KeyError(ident)
+        del self._nodes[ident]
+        self._rebuild()
+
+    def get(self, key: str | bytes) -> T:
+        """Returns the node that owns key. Raises LookupError on an empty ring."""
+        points, owners = self._table
+        if not points:
+            raise LookupError("Hash ring has no nodes")
+        if isinstance(key, str):
+            key = key.encode()
+        return owners[bisect_right(points, crc32(key))]
+
+    def get_many(self, keys: Iterable[str | bytes]) -> list[T]:
+        """Bulk get() with the per-call attribute lookups hoisted out of the loop."""
+        points, owners = self._table
+        if not points:
+            raise LookupError("Hash ring has no nodes")
+        return [
+            owners[
+                bisect_right(
+                    points, crc32(key.encode() if isinstance(key, str) else key)
+                )
+            ]
+            for key in keys
+        ]
@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+from typing import Iterator, Mapping
+
+DEFAULT_SECRETS_DIR = Path("/run/secrets")
+
+
+def find_secret_file(directory: str | Path, name: str) -> Path | None:
+    """
+    Returns the file for name in directory, trying name as given and then
+    lowercased (DB_PASSWORD -> db_password, the usual Docker/Kubernetes key
+    spelling). Names that could escape the directory never match.
+    """
+    if not name or "/" in name or "\\" in name or name.startswith("."):
+        return None
+    directory = Path(directory)
+    for candidate in dict.fromkeys((name, name.lower())):
+        path = directory / candidate
+        if path.is_file():
+            return path
+    return None
+
+
+class SecretFile:
+    """
+    A file read on demand. The contents are cached and only re-read when the
+    file's inode, mtime or size changes, so rotated credentials (including
+    Kubernetes' atomic symlink swaps) are picked up on the next read.
+    A single trailing newline is stripped.
+    """
+
+    __slots__ = ("path", "_cache")
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._cache: tuple[tuple[int, int, int], str] | None = None
+
+    def read(self) -> str:
+        stat = os.stat(self.path)
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cache = self._cache
+        if cache is not None and cache[0] == stamp:
+            return cache[1]
+        # Stat before reading: if the file is swapped in between, the newer
+        # contents are cached under the older stamp and re-read next time.
+        with open(self.path, encoding="utf-8") as file:
+            text = file.read().removesuffix("\n")
+        self._cache = (stamp, text)
+        return text
+
+
+class SecretsDir(Mapping[str, str]):
+    """
+    A roskarl.source backed by a directory of secret files, one file per key
+    (/run/secrets by default). Files are only read when a key is looked up,
+    and each file's contents are cached until it changes on disk.
+
+    Example:
+        with use_source(ChainMap(SecretsDir(), os.environ)):
+            dsn = env_var_dsn("DB_DSN")
+    """
+
+    __slots__ = ("path", "_files")
+
+    def __init__(self, path: str | Path = DEFAULT_SECRETS_DIR) -> None:
+        self.path = Path(path)
+        self._files: dict[Path, SecretFile] = {}
+
+    def file(self, name: str) -> SecretFile | None:
+        """Returns the (shared, cached) SecretFile for name, or None."""
+        path = find_secret_file(self.path, name)
+        if path is None:
+            return None
+        secret_file = self._files.get(path)
+        if secret_file is None:
+            secret_file = self._files.setdefault(path, SecretFile(path))
+        return secret_file
+
+    def __getitem__(self, name: str) -> str:
+        secret_file = self.file(name)
+        if secret_file is None:
+            raise KeyError(name)
+        try:
+            return secret_file.read()
+        except FileNotFoundError:
+            raise KeyError(name) from None
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and find_secret_file(self.path, name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            entries = list(os.scandir(self.path))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            # Kubernetes mounts keep their real files under hidden ..data dirs.
+            if not entry.name.startswith(".") and entry.is_file():
+                yield entry.name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"SecretsDir({str(self.path)!r})"
@@ -0,0 +1,254 @@
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Mapping
+
+Source = Mapping[str, str]
+"""
+Anything the env_var_* helpers can read raw values from: os.environ, a dict
+from roskarl.dotenv.read_dotenv, a ChainMap of several, etc. Only .get() is used.
+"""
+
+_default_source: Source = os.environ
+_scoped_source: ContextVar[Source | None] = ContextVar(
+    "roskarl_scoped_source", default=None
+)
+
+
+# Innermost override first, each node pointing at the one it shadows.
+_Overlay = tuple[Mapping[str, str | None], "_Overlay | None"]
+_overlay: ContextVar[_Overlay | None] = ContextVar("roskarl_overlay", default=None)
+
+
+def lookup(name: str) -> str | None:
+    """
+    Returns the raw value of name from the active overrides, else from the
+    active source, or None.
+    """
+    overlay = _overlay.get()
+    while overlay is not None:
+        values, overlay = overlay
+        if name in values:
+            return values[name]
+    source = _scoped_source.get()
+    if source is None:
+        source = _default_source
+    return source.get(name)
+
+
+def overridden(name: str) -> tuple[str | None] | None:
+    """
+    Returns (value,) if an active override sets name, with value None if it
+    unsets it, or None if no override mentions name.
+    """
+    overlay = _overlay.get()
+    while overlay is not None:
+        values, overlay = overlay
+        if name in values:
+            return (values[name],)
+    return None
+
+
+# os.environb shares its storage with os.environ; it is None on Windows.
+_environb = getattr(os, "environb", None)
+
+
+def lookup_bytes(name: str) -> bytes | None:
+    """
+    lookup() for bytes. While the active source is os.environ the value is
+    taken from os.environb as stored, with no str decoding or re-encoding;
+    values from other sources and overrides are encoded with os.fsencode.
+    """
+    overlay = _overlay.get()
+    while overlay is not None:
+        values, overlay = overlay
+        if name in values:
+            value = values[name]
+            return None if value is None else os.fsencode(value)
+    source = _scoped_source.get()
+    if source is None:
+        source = _default_source
+    if source is os.environ and _environb is not None:
+        return _environb.get(os.fsencode(name))
+    value = source.get(name)
+    return None if value is None else os.fsencode(value)
+
+
+def current_source() -> Source:
+    """Returns the source the env_var_* helpers are currently reading from."""
+    source = _scoped_source.get()
+    return _default_source if source is None else source
+
+
+def names() -> set[str]:
+    """
+    Returns every name lookup() can see: the active source's and the active
+    overrides' (including ones an override unsets).
+    """
+    found = set(current_source())
+    overlay = _overlay.get()
+    while overlay is not None:
+        values, overlay = overlay
+        found.update(values)
+    return found
+
+
+def set_source(source: Source | None) -> None:
+    """
+    Replaces the process-wide source for every thread and task. Pass None to
+    go back to os.environ.
+    """
+    global _default_source
+    _default_source = os.environ if source is None else source
+
+
+@contextmanager
+def use_source(source: Source) -> Iterator[Source]:
+    """
+    Makes the env_var_* helpers read from source inside the with-block, for the
+    current thread or asyncio task only. os.environ is never modified.
+
+    Example:
+        with use_source(ChainMap(os.environ, read_dotenv(".env"))):
+            timeout = env_var_duration("TIMEOUT")
+    """
+    token = _scoped_source.set(source)
+    try:
+        yield source
+    finally:
+        _scoped_source.reset(token)
+
+
+@contextmanager
+def override(
+    values: Mapping[str, str | None] | None = None, /, **kwargs: str | None
+) -> Iterator[None]:
+    """
+    Overrides individual variables for the current thread or asyncio task
+    only, on top of whatever source is active. A value of None makes the
+    variable read as unset. Overrides nest; the innermost wins.
+
+    Entering and leaving is O(1): the mapping is not copied (so don't mutate
+    it while in use) and neither is the environment. Lookups check each
+    active override before the source.
+
+    Example:
+        with override(TIMEOUT=tenant.timeout, DB_DSN=tenant.dsn):
+            await handle(request)
+    """
+    if values is None:
+        values = kwargs
+    elif kwargs:
+        values = {**values, **kwargs}
+    token = _overlay.set((values, _overlay.get()))
+    try:
+        yield
+    finally:
+        _overlay.reset(token)
+
+
+class Sources(Mapping[str, str]):
+    """
+    A stack of named layers, lowest precedence first, merged into one source:
+
+        Sources([
+            ("defaults", {"TIMEOUT": "30s"}),
+            ("base", read_dotenv(".env")),
+            ("production", read_dotenv(".env.production")),
+            ("environ", os.environ),
+            ("cli", overrides),
+        ])
+
+    Each layer is snapshotted and the merged dict is built once, so a helper
+    lookup is a single dict hit. set_layer/refresh only re-resolve the keys
+    whose value in that layer changed. origin(name) tells which layer a value
+    came from.
+
+    Keys are updated one at a time in place, so a reader running during a
+    refresh sees each key either before or after it, never a torn value.
+    """
+
+    __slots__ = ("_layers", "_snapshots", "_merged", "_origins")
+
+    def __init__(self, layers: Iterable[tuple[str, Source]] = ()) -> None:
+        self._layers: dict[str, Source] = {}
+        self._snapshots: dict[str, dict[str, str]] = {}
+        for layer, values in layers:
+            if layer in self._layers:
+                raise ValueError(f"Duplicate source layer: '{layer}'")
+            self._layers[layer] = values
+            self._snapshots[layer] = dict(values)
+        self._merged: dict[str, str] = {}
+        self._origins: dict[str, str] = {}
+        for layer, snapshot in self._snapshots.items():
+            self._merged.update(snapshot)
+            self._origins.update(dict.fromkeys(snapshot, layer))
+
+    @property
+    def layers(self) -> tuple[str, ...]:
+        """Layer names, lowest precedence first."""
+        return tuple(self._layers)
+
+    def origin(self, name: str) -> str | None:
+        """Returns the layer the value of name came from, or None if unset."""
+        return self._origins.get(name)
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        return self._merged.get(name, default)
+
+    def __getitem__(self, name: str) -> str:
+        return self._merged[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._merged
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._merged)
+
+    def __len__(self) -> int:
+        return len(self._merged)
+
+    def __repr__(self) -> str:
+        return f"Sources({list(self._layers)!r})"
+
+    def set_layer(self, layer: str, values: Source) -> set[str]:
+        """
+        Replaces the contents of an existing layer and returns the names whose
+        merged value changed.
+        """
+        if layer not in self._layers:
+            raise KeyError(layer)
+        old = self._snapshots[layer]
+        new = dict(values)
+        self._layers[layer] = values
+        self._snapshots[layer] = new
+        keys = old.keys() | new.keys()
+        return self._resolve(key for key in keys if old.get(key) != new.get(key))
+
+    def refresh(self, layer: str | None = None) -> set[str]:
+        """
+        Re-snapshots one layer (or all of them), e.g. after os.environ was
+        modified, and returns the names whose merged value changed.
+        """
+        layers = list(self._layers) if layer is None else [layer]
+        changed: set[str] = set()
+        for name in layers:
+            changed |= self.set_layer(name, self._layers[name])
+        return changed
+
+    def _resolve(self, keys: Iterable[str]) -> set[str]:
+        changed = set()
+        stack = list(reversed(self._snapshots.items()))
+        for key in keys:
+            before = self._merged.get(key)
+            for layer, snapshot in stack:
+                if key in snapshot:
+                    self._merged[key] = snapshot[key]
+                    self._origins[key] = layer
+                    break
+            else:
+                self._merged.pop(key, None)
+                self._origins.pop(key, None)
+            if self._merged.get(key) != before:
+                changed.add(key)
+        return changed
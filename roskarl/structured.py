@@ -0,0 +1,287 @@
+import dataclasses
+import json
+import tomllib
+import types
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    Mapping,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    overload,
+)
+
+import roskarl.profiler as _profiler
+from roskarl.env import env_var_custom
+
+T = TypeVar("T")
+
+_LOADERS: dict[str, Callable[[str], Any]] = {"JSON": json.loads, "TOML": tomllib.loads}
+
+
+def freeze(value: Any) -> Any:
+    """
+    Returns a deeply immutable copy of parsed JSON/TOML: dicts become
+    read-only MappingProxyType views and lists become tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _describe(value: Any) -> str:
+    return type(value).__name__
+
+
+def _bind(hint: Any, value: Any, path: str) -> Any:
+    """Builds hint (a dataclass, container or scalar type) from parsed data."""
+    if hint is Any:
+        return value
+    origin = get_origin(hint)
+    if origin in (Union, types.UnionType):
+        args = get_args(hint)
+        if value is None and type(None) in args:
+            return None
+        errors = []
+        for arg in args:
+            if arg is type(None):
+                continue
+            try:
+                return _bind(arg, value, path)
+            except ValueError as e:
+                errors.append(str(e))
+        if len(errors) == 1:
+            raise ValueError(errors[0])
+        raise ValueError(f"{path}: matches none of {hint}, got {_describe(value)}")
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        if not isinstance(value, Mapping):
+            raise ValueError(f"{path}: expected an object, got {_describe(value)}")
+        hints = get_type_hints(hint)
+        fields = {field.name: field for field in dataclasses.fields(hint)}
+        unknown = [key for key in value if key not in fields or not fields[key].init]
+        if unknown:
+            raise ValueError(f"{path}: unknown key '{unknown[0]}'")
+        kwargs = {}
+        for name, field in fields.items():
+            if not field.init:
+                continue
+            if name in value:
+                kwargs[name] = _bind(hints[name], value[name], f"{path}.{name}")
+            elif (
+                field.default is dataclasses.MISSING
+                and field.default_factory is dataclasses.MISSING
+            ):
+                raise ValueError(f"{path}: missing key '{name}'")
+        return hint(**kwargs)
+    if origin in (list, tuple):
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(f"{path}: expected an array, got {_describe(value)}")
+        args = get_args(hint)
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            raise ValueError(f"{path}: only tuple[X, ...] can be bound")
+        item = args[0] if args else Any
+        items = [_bind(item, v, f"{path}[{i}]") for i, v in enumerate(value)]
+        return tuple(items) if origin is tuple or isinstance(value, tuple) else items
+    if origin is dict or hint is dict:
+        if not isinstance(value, Mapping):
+            raise ValueError(f"{path}: expected an object, got {_describe(value)}")
+        item = get_args(hint)[1] if get_args(hint) else Any
+        bound = {key: _bind(item, v, f"{path}.{key}") for key, v in value.items()}
+        return MappingProxyType(bound) if isinstance(value, MappingProxyType) else bound
+    if hint is float and type(value) is int:
+        return float(value)
+    if isinstance(hint, type) and (
+        not isinstance(value, hint) or (hint is int and type(value) is bool)
+    ):
+        raise ValueError(f"{path}: expected {hint.__name__}, got {_describe(value)}")
+    return value
+
+
+def _parse(kind: str, value: str, into: type | None, frozen: bool) -> Any:
+    try:
+        parsed = _LOADERS[kind](value)
+    except ValueError as e:  # TOMLDecodeError is a ValueError
+        raise ValueError(f"is not valid {kind}: {e}") from None
+    if frozen:
+        parsed = freeze(parsed)
+    if into is not None:
+        try:
+            parsed = _bind(into, parsed, "$")
+        except ValueError as e:
+            raise ValueError(f"does not match {into.__name__}: {e}") from None
+    return parsed
+
+
+# Only immutable results are cached: a cached object goes to every caller.
+_parse_cached = lru_cache(maxsize=64)(_parse)
+
+
+def _shareable(into: type | None, frozen: bool) -> bool:
+    if not frozen:
+        return False
+    if into is None or not dataclasses.is_dataclass(into):
+        return True
+    return into.__dataclass_params__.frozen
+
+
+def _helper(
+    kind: str, name: str, into: type | None, frozen: bool
+) -> Callable[[str], Any]:
+    shareable = _shareable(into, frozen)
+    parse = _parse_cached if shareable else _parse
+
+    def parser(value: str) -> Any:
+        # lru_cache doesn't report hits per call; its counter has to do
+        hits = None
+        if shareable and _profiler.active is not None:
+            hits = _parse_cached.cache_info().hits
+        try:
+            result = parse(kind, value, into, frozen)
+        except ValueError as e:
+            raise ValueError(f"'{name}' {e}") from None
+        if hits is not None and _parse_cached.cache_info().hits > hits:
+            _profiler.cache_hit()
+        return result
+
+    return parser
+
+
+@overload
+def env_var_json(
+    name: str,
+    default: T | None = ...,
+    should_print_unset: bool = ...,
+    *,
+    required: Literal[True],
+    frozen: bool = ...,
+    into: type[T],
+    default_factory: Callable[[], T] | None = ...,
+) -> T: ...
+
+
+@overload
+def env_var_json(
+    name: str,
+    default: T | None = ...,
+    should_print_unset: bool = ...,
+    required: bool = ...,
+    *,
+    frozen: bool = ...,
+    into: type[T],
+    default_factory: Callable[[], T] | None = ...,
+) -> T | None: ...
+
+
+@overload
+def env_var_json(
+    name: str,
+    default: Any = ...,
+    should_print_unset: bool = ...,
+    required: bool = ...,
+    *,
+    frozen: bool = ...,
+    into: None = ...,
+    default_factory: Callable[[], Any] | None = ...,
+) -> Any: ...
+
+
+def env_var_json(
+    name: str,
+    default: Any = None,
+    should_print_unset: bool = True,
+    required: bool = False,
+    *,
+    frozen: bool = False,
+    into: type | None = None,
+    default_factory: Callable[[], Any] | None = None,
+) -> Any:
+    """
+    Reads a JSON document from an environment variable.
+
+    With frozen=True the result is deeply immutable (see freeze()) and is
+    cached by raw value, so reading the same value again costs a lookup
+    instead of a parse. With into=SomeDataclass the document is bound to
+    that dataclass, recursively through nested dataclasses, lists and dicts,
+    and keys and scalar types are checked; a mismatch raises ValueError with
+    the path, e.g. "$.routes[2].weight: expected int, got str". Bound results
+    are cached only if the dataclass is frozen too.
+    """
+    return env_var_custom(
+        name,
+        _helper("JSON", name, into, frozen),
+        default,
+        should_print_unset,
+        required,
+        default_factory=default_factory,
+    )
+
+
+@overload
+def env_var_toml(
+    name: str,
+    default: T | None = ...,
+    should_print_unset: bool = ...,
+    *,
+    required: Literal[True],
+    frozen: bool = ...,
+    into: type[T],
+    default_factory: Callable[[], T] | None = ...,
+) -> T: ...
+
+
+@overload
+def env_var_toml(
+    name: str,
+    default: T | None = ...,
+    should_print_unset: bool = ...,
+    required: bool = ...,
+    *,
+    frozen: bool = ...,
+    into: type[T],
+    default_factory: Callable[[], T] | None = ...,
+) -> T | None: ...
+
+
+@overload
+def env_var_toml(
+    name: str,
+    default: Any = ...,
+    should_print_unset: bool = ...,
+    required: bool = ...,
+    *,
+    frozen: bool = ...,
+    into: None = ...,
+    default_factory: Callable[[], Any] | None = ...,
+) -> Any: ...
+
+
+def env_var_toml(
+    name: str,
+    default: Any = None,
+    should_print_unset: bool = True,
+    required: bool = False,
+    *,
+    frozen: bool = False,
+    into: type | None = None,
+    default_factory: Callable[[], Any] | None = None,
+) -> Any:
+    """
+    Reads a TOML document from an environment variable and returns it as a
+    dict. Same frozen/into options and caching as env_var_json.
+    """
+    return env_var_custom(
+        name,
+        _helper("TOML", name, into, frozen),
+        default,
+        should_print_unset,
+        required,
+        default_factory=default_factory,
+    )
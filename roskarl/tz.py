@@ -0,0 +1,72 @@
+import sys
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
+_ZONES: dict[str, ZoneInfo] = {}
+# Keys ZoneInfo rejected, so they fail again without I/O.
+_UNKNOWN: set[str] = set()
+_zone_index: frozenset[str] | None = None
+
+
+def _cache_hit() -> None:
+    # Only reported if something already imported roskarl.profiler (roskarl.env
+    # does), so that modules from `python -m roskarl compile` that load zones
+    # don't pay for importing it.
+    profiler = sys.modules.get("roskarl.profiler")
+    if profiler is not None:
+        profiler.cache_hit()
+
+
+def zone_index() -> frozenset[str]:
+    """
+    Returns the set of IANA zone names available on this system.
+
+    Built on first use from zoneinfo.available_timezones() (which walks the
+    tzpath and the tzdata package once) and kept for the life of the process.
+    """
+    global _zone_index
+    if _zone_index is None:
+        _zone_index = frozenset(available_timezones())
+    return _zone_index
+
+
+def load_zone(key: str) -> ZoneInfo:
+    """
+    Returns the ZoneInfo for key, loading it at most once per process.
+
+    Accepts every key ZoneInfo accepts, including ones zone_index() leaves
+    out ('posix/Europe/Stockholm', 'right/UTC', 'posixrules'). Unknown keys
+    are remembered too, so they fail again without filesystem I/O.
+
+    Raises ZoneInfoNotFoundError for unknown zones.
+    """
+    zone = _ZONES.get(key)
+    if zone is not None:
+        _cache_hit()
+        return zone
+    if key in _UNKNOWN:
+        _cache_hit()
+        raise ZoneInfoNotFoundError(f"No time zone found with key {key}")
+    try:
+        zone = ZoneInfo(key)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        # ValueError: path-like keys, e.g. '../../etc/passwd'
+        _UNKNOWN.add(key)
+        raise ZoneInfoNotFoundError(f"No time zone found with key {key}") from e
+    _ZONES[key] = zone
+    return zone
+
+
+def parse_zone(value: str) -> ZoneInfo:
+    """load_zone, raising ValueError for unknown zones."""
+    try:
+        return load_zone(value)
+    except ZoneInfoNotFoundError as e:
+        raise ValueError(f"Timezone string was not valid. {e}") from None
+
+
+def clear_zone_cache() -> None:
+    """Drops cached zones and the name index, e.g. after a tzdata upgrade."""
+    global _zone_index
+    _ZONES.clear()
+    _UNKNOWN.clear()
+    _zone_index = None
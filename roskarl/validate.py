@@ -0,0 +1,113 @@
+import dataclasses
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, TypeVar
+
+from roskarl.bind import FieldPlan, plan, read_field
+from roskarl.env import env_var_path
+
+T = TypeVar("T")
+
+# Built-in helpers that may touch the filesystem; every other built-in helper
+# only parses a string and is cheaper to run inline than on a thread.
+_IO_HELPERS = {env_var_path}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FieldError:
+    """Why one field could not be loaded."""
+
+    attribute: str
+    env: str
+    message: str
+
+
+class ValidationErrors(ValueError):
+    """Raised by load_all() with every invalid field, not just the first."""
+
+    def __init__(self, errors: list[FieldError]) -> None:
+        self.errors = tuple(errors)
+        lines = [f"{len(errors)} invalid setting(s):"]
+        lines.extend(f"  {error.env}: {error.message}" for error in errors)
+        super().__init__("\n".join(lines))
+
+
+def _io_bound(field: FieldPlan, metadata: Any) -> bool:
+    if "io" in metadata:
+        return bool(metadata["io"])
+    return "helper" in metadata or field.helper in _IO_HELPERS
+
+
+def _resolve(
+    cls: type, prefix: str, max_workers: int
+) -> tuple[dict[str, Any], list[FieldError]]:
+    metadata = {field.name: field.metadata for field in dataclasses.fields(cls)}
+    plans = plan(cls, prefix)
+    slow = [p for p in plans if _io_bound(p, metadata[p.attribute])]
+    results: dict[str, Any] = {}
+    errors: list[FieldError] = []
+
+    def record(field: FieldPlan, outcome: Future[Any] | None) -> None:
+        try:
+            value = read_field(field) if outcome is None else outcome.result()
+        except ValueError as exc:
+            errors.append(FieldError(field.attribute, field.env, str(exc)))
+        except Exception as exc:
+            # e.g. PermissionError from Path.exists, or a TypeError from a
+            # custom helper: still one bad field, not the end of the run
+            message = f"{type(exc).__name__}: {exc}"
+            errors.append(FieldError(field.attribute, field.env, message))
+        else:
+            results[field.attribute] = value
+
+    futures: dict[str, Future[Any]] = {}
+    pool = None
+    if slow:
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(slow)))
+        # each task runs in its own copy of the caller's context, so active
+        # sources and overrides apply on the worker threads too
+        for field in slow:
+            futures[field.attribute] = pool.submit(
+                copy_context().run, read_field, field
+            )
+    try:
+        # cheap fields are read inline while the slow ones are in flight
+        for field in plans:
+            record(field, futures.get(field.attribute))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results, errors
+
+
+def validate(cls: type, prefix: str = "", max_workers: int = 8) -> list[FieldError]:
+    """
+    Loads every field of dataclass cls as roskarl.bind.load would and
+    returns all the errors (empty if the config is valid), so one deploy
+    shows every misconfigured variable instead of only the first. Exceptions
+    other than ValueError are collected too, with their type in the message.
+
+    Fields whose helper may do I/O (env_var_path, helpers set in field
+    metadata) run concurrently on up to max_workers threads, so the total
+    time is about that of the slowest check rather than the sum. Set
+    metadata={"io": True} or {"io": False} to choose per field.
+    """
+    return _resolve(cls, prefix, max_workers)[1]
+
+
+def load_all(cls: type[T], prefix: str = "", max_workers: int = 8) -> T:
+    """
+    Like roskarl.bind.load, but validates every field (see validate()) and
+    raises ValidationErrors listing all invalid ones.
+
+    Example:
+        try:
+            config = load_all(Config, prefix="APP_")
+        except ValidationErrors as e:
+            for error in e.errors:
+                print(error.env, error.message)
+    """
+    results, errors = _resolve(cls, prefix, max_workers)
+    if errors:
+        raise ValidationErrors(errors)
+    return cls(**results)
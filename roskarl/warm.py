@@ -0,0 +1,217 @@
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, TypeVar, get_type_hints
+from zoneinfo import ZoneInfo
+
+from roskarl.bind import FieldPlan, _unwrap_optional, plan, read_field
+from roskarl.bind import load as bind_load
+from roskarl.env import (
+    DSN,
+    URL,
+    Secret,
+    env_var_dsn,
+    env_var_dsn_set,
+    env_var_parsed_url,
+    env_var_secret,
+)
+from roskarl.source import lookup
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+try:
+    _VERSION = version("roskarl")
+except PackageNotFoundError:
+    _VERSION = "unknown"
+
+# Fields of these types, or read with these helpers (or partials of them), are
+# re-read from the environment on every start and their raw values are left
+# out of the fingerprint, so they never reach disk.
+_SENSITIVE = (Secret, DSN, URL)
+_SENSITIVE_HELPERS = {env_var_secret, env_var_dsn, env_var_dsn_set, env_var_parsed_url}
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _identity(value: Any) -> str:
+    """A description of a helper or default that is stable across processes."""
+    if value is dataclasses.MISSING:
+        return "MISSING"
+    if isinstance(value, functools.partial):
+        return f"partial({_identity(value.func)}, {value.args!r}, {value.keywords!r})"
+    module = getattr(value, "__module__", None)
+    qualname = getattr(value, "__qualname__", None)
+    if module and qualname:
+        return f"{module}.{qualname}"
+    return repr(value)
+
+
+def _sensitive(field: dataclasses.Field, hint: Any, helper: Any) -> bool:
+    metadata = field.metadata
+    if metadata.get("sensitive") or not metadata.get("cache", True):
+        return True
+    while isinstance(helper, functools.partial):
+        helper = helper.func
+    return helper in _SENSITIVE_HELPERS or (
+        isinstance(hint, type) and issubclass(hint, _SENSITIVE)
+    )
+
+
+def _encode(value: Any, hint: Any) -> Any:
+    """A JSON-able [tag, payload] for value, or None if it can't be cached."""
+    kind = type(value)
+    if value is None:
+        return ["n", None]
+    if kind in (bool, int, float, str):
+        return [kind.__name__[0], value]
+    if kind is list and all(type(item) is str for item in value):
+        return ["l", value]
+    if kind is timedelta:
+        return ["td", value // _MICROSECOND]
+    if kind is datetime and (value.tzinfo is None or type(value.tzinfo) is timezone):
+        return ["dt", value.isoformat()]
+    if isinstance(value, Path):
+        return ["p", str(value)]
+    if kind is ZoneInfo:
+        return ["z", value.key]
+    if isinstance(value, Enum) and kind is hint:
+        return ["e", value.value]
+    return None
+
+
+def _decode(encoded: list[Any], hint: Any) -> Any:
+    tag, payload = encoded
+    if tag in ("n", "b", "i", "f", "s"):
+        return payload
+    if tag == "l":
+        return list(payload)
+    if tag == "td":
+        return timedelta(microseconds=payload)
+    if tag == "dt":
+        return datetime.fromisoformat(payload)
+    if tag == "p":
+        return Path(payload)
+    if tag == "z":
+        return ZoneInfo(payload)
+    if tag == "e":
+        return hint(payload)
+    raise ValueError(f"Unknown cache tag: {tag!r}")
+
+
+def fingerprint(cls: type, prefix: str = "") -> str:
+    """
+    Hashes everything a cached load of cls depends on: the roskarl version,
+    the class, each field's variable, helper and default, and the raw values
+    of the non-sensitive fields. Any change gives a different fingerprint.
+    """
+    hints = get_type_hints(cls, include_extras=True)
+    fields = {field.name: field for field in dataclasses.fields(cls)}
+    inputs: list[Any] = [_VERSION, _identity(cls), prefix]
+    for field_plan in plan(cls, prefix):
+        field = fields[field_plan.attribute]
+        hint, _ = _unwrap_optional(hints[field.name])
+        raw = (
+            None
+            if _sensitive(field, hint, field_plan.helper)
+            else lookup(field_plan.env)
+        )
+        inputs.append(
+            [
+                field_plan.attribute,
+                field_plan.env,
+                _identity(field_plan.helper),
+                [_identity(arg) for arg in field_plan.args],
+                _identity(field_plan.default),
+                _identity(field_plan.default_factory),
+                raw,
+            ]
+        )
+    blob = json.dumps(inputs, separators=(",", ":"), default=repr)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _read(path: Path, key: str) -> dict[str, Any] | None:
+    try:
+        with open(path, encoding="utf-8") as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    values = cached.get("values")
+    return values if isinstance(values, dict) else None
+
+
+def _write(path: Path, key: str, values: dict[str, Any]) -> None:
+    data = json.dumps({"key": key, "values": values}, separators=(",", ":"))
+    try:
+        # mkstemp creates the file with mode 0600
+        handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(handle, "w", encoding="utf-8") as file:
+            file.write(data)
+        os.replace(temporary, path)
+    except OSError as exc:
+        logger.warning("Could not write config cache '%s': %s", path, exc)
+
+
+def load(cls: type[T], cache: str | os.PathLike[str], prefix: str = "") -> T:
+    """
+    roskarl.bind.load(cls, prefix), with the resolved values kept in a cache
+    file between starts. When the fingerprint of the inputs matches the
+    cache, the stored values are used as-is and the parsers and validators
+    (cron, timezone, filesystem checks, ...) are skipped. Otherwise every
+    field is loaded and validated again and the cache is rewritten.
+
+    Fields typed Secret, DSN or URL, fields read with env_var_secret,
+    env_var_dsn(_set) or env_var_parsed_url (also via metadata "helper" or a
+    partial), and fields with metadata={"sensitive": True} are never written:
+    they are read from the environment on every start and their raw values
+    are not part of the fingerprint either. Every other field is written in
+    clear text, including plain str fields, so mark a str password
+    {"sensitive": True}.
+
+    Example:
+        config = load(Config, "/var/cache/myapp/config.json", prefix="APP_")
+    """
+    path = Path(cache)
+    key = fingerprint(cls, prefix)
+    hints = get_type_hints(cls, include_extras=True)
+    fields = {field.name: field for field in dataclasses.fields(cls)}
+    plans: list[FieldPlan] = plan(cls, prefix)
+    stored = _read(path, key)
+    if stored is not None:
+        kwargs = {}
+        try:
+            for attribute, encoded in stored.items():
+                hint, _ = _unwrap_optional(hints[attribute])
+                kwargs[attribute] = _decode(encoded, hint)
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Ignoring unusable config cache '%s': %s", path, exc)
+        else:
+            for field_plan in plans:
+                if field_plan.attribute not in kwargs:
+                    kwargs[field_plan.attribute] = read_field(field_plan)
+            return cls(**kwargs)
+
+    config = bind_load(cls, prefix)
+    values = {}
+    for field_plan in plans:
+        attribute = field_plan.attribute
+        hint, _ = _unwrap_optional(hints[attribute])
+        if _sensitive(fields[attribute], hint, field_plan.helper):
+            continue
+        encoded = _encode(getattr(config, attribute), hint)
+        if encoded is not None:
+            values[attribute] = encoded
+    _write(path, key, values)
+    return config
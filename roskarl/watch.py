@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import ChainMap
+from dataclasses import dataclass, field
+from pathlib import Path
+from stat import S_ISDIR
+from types import MappingProxyType
+from typing import Any, Callable, Generic, Mapping, TypeVar
+
+from roskarl.dotenv import read_dotenv
+from roskarl.secrets_dir import SecretsDir
+from roskarl.source import use_source
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Watch(Generic[T]):
+    helper: Callable[[str], T | None]
+    callback: Callable[[T | None], None]
+    value: T | None
+
+
+@dataclass(slots=True)
+class _Layer:
+    path: Path
+    stamp: tuple[int, int, int] | None = None
+    values: dict[str, str] = field(default_factory=dict)
+    directory: SecretsDir | None = None
+
+    @property
+    def current(self) -> Mapping[str, str]:
+        return self.values if self.directory is None else self.directory
+
+    def refresh(self) -> Mapping[str, str]:
+        """
+        Returns this layer's values. A .env file is only re-parsed when its
+        inode/mtime/size changes. A directory is read through a SecretsDir,
+        so only the files of looked-up keys are stat'ed, and only changed
+        ones are read again.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.stamp, self.values, self.directory = None, {}, None
+            return self.values
+        if S_ISDIR(stat.st_mode):
+            if self.directory is None:
+                self.directory = SecretsDir(self.path)
+            return self.directory
+        self.directory = None
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if stamp != self.stamp:
+            self.values = read_dotenv(self.path)
+            self.stamp = stamp
+        return self.values
+
+
+class ConfigWatcher:
+    """
+    Watches file-based sources — .env files, and directories holding one
+    value per file (secrets directories, mounted ConfigMaps) — and calls
+    back when a watched variable's parsed value changes. Later paths override
+    earlier ones; directory files match a name as-is or lowercased.
+
+    Changes are found by stat-polling every `interval` seconds: one stat per
+    .env file and one per watched name per directory. Only keys whose raw
+    value changed are re-parsed, with the same env_var_* helper that was
+    registered for them, evaluated against the watched files.
+
+    Run it either on a daemon thread (start/stop, or as a context manager) or
+    as an asyncio task (run); in the asyncio variant polling and re-parsing
+    (all the file I/O) happen in a worker thread and callbacks run on the
+    event loop.
+
+    Example:
+        watcher = ConfigWatcher(".env", "/etc/config", "/run/secrets")
+        level = watcher.watch("LOG_LEVEL", env_var_log_level, logger.setLevel)
+        watcher.start()
+    """
+
+    def __init__(
+        self,
+        *paths: str | Path,
+        interval: float = 1.0,
+        on_error: Callable[[str, Exception], None] | None = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self._on_error = on_error
+        self._layers = [_Layer(Path(path)) for path in paths]
+        self._watches: dict[str, list[_Watch[Any]]] = {}
+        self._raw: dict[str, str | None] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._source, _ = self._scan(strict=True)
+
+    @property
+    def source(self) -> Mapping[str, str]:
+        """The watched files as one source, as of the last check."""
+        return MappingProxyType(self._source)
+
+    def watch(
+        self,
+        name: str,
+        helper: Callable[[str], T | None],
+        callback: Callable[[T | None], None],
+    ) -> T | None:
+        """
+        Registers callback for name and returns its current parsed value.
+
+        helper is called as helper(name) — pass functools.partial to give it
+        further arguments. callback receives the newly parsed value (None
+        if the variable was removed) whenever it differs from the previous.
+        """
+        with self._lock:
+            self._raw[name] = self._source.get(name)
+            with use_source(self._source):
+                value = helper(name)
+            self._watches.setdefault(name, []).append(_Watch(helper, callback, value))
+        return value
+
+    def _scan(
+        self, strict: bool = False
+    ) -> tuple[Mapping[str, str], dict[str, str | None]]:
+        maps: list[Mapping[str, str]] = []
+        for layer in reversed(self._layers):
+            try:
+                maps.append(layer.refresh())
+            except (OSError, ValueError) as exc:
+                # A half-written or broken file must not take the watcher
+                # down; keep serving what was last read from it.
+                if strict:
+                    raise
+                self._report(str(layer.path), exc)
+                maps.append(layer.current)
+        source = ChainMap(*maps)
+        raw: dict[str, str | None] = {}
+        for name in self._watches:
+            try:
+                raw[name] = source.get(name)
+            except OSError as exc:
+                self._report(name, exc)
+                raw[name] = self._raw.get(name)
+        return source, raw
+
+    def _apply(
+        self, source: Mapping[str, str], raw: dict[str, str | None]
+    ) -> tuple[list[str], list[tuple[str, _Watch[Any], Any]]]:
+        """
+        Re-parses the changed names against source and returns them, plus
+        the (name, watch, value) callbacks due. Called with the lock held.
+        """
+        previous, self._raw, self._source = self._raw, raw, source
+        changed = [name for name in raw if raw[name] != previous.get(name)]
+        due = []
+        with use_source(source):
+            for name in changed:
+                for entry in self._watches[name]:
+                    try:
+                        value = entry.helper(name)
+                    except Exception as exc:
+                        self._report(name, exc)
+                        continue
+                    if value == entry.value:
+                        continue
+                    entry.value = value
+                    due.append((name, entry, value))
+        return changed, due
+
+    def _fire(self, due: list[tuple[str, _Watch[Any], Any]]) -> None:
+        for name, entry, value in due:
+            if entry.value is not value:
+                continue  # superseded by a later check
+            try:
+                entry.callback(value)
+            except Exception as exc:
+                self._report(name, exc)
+
+    def _check_deferred(self) -> list[tuple[str, _Watch[Any], Any]]:
+        with self._lock:
+            return self._apply(*self._scan())[1]
+
+    def _report(self, name: str, exc: Exception) -> None:
+        if self._on_error is not None:
+            self._on_error(name, exc)
+        else:
+            logger.error("Reloading '%s' failed: %s", name, exc)
+
+    def check(self) -> list[str]:
+        """
+        Polls every path once, fires callbacks for changed values and returns
+        the watched names whose raw value changed. A file that can't be read
+        or a value that fails to parse is reported to on_error (or logged)
+        and the last good value is kept.
+        """
+        with self._lock:
+            changed, due = self._apply(*self._scan())
+        # outside the lock, so that callbacks may call watch(), check() or stop()
+        self._fire(due)
+        return changed
+
+    def start(self) -> None:
+        """Starts polling on a daemon thread."""
+        if self._thread is not None:
+            raise RuntimeError("ConfigWatcher is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="roskarl-config-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the polling thread and waits for it to exit (unless called from
+        a callback on that thread).
+        """
+        self._stop.set()
+        if self._thread is not None:
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    async def run(self) -> None:
+        """Polls until cancelled. Use with asyncio.create_task(watcher.run())."""
+        while True:
+            await asyncio.sleep(self.interval)
+            # scan and re-parse under one lock hold, off the loop: helpers
+            # may read files (e.g. from a SecretsDir)
+            due = await asyncio.to_thread(self._check_deferred)
+            self._fire(due)
+
+    def __enter__(self) -> "ConfigWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
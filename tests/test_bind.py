@@ -0,0 +1,177 @@
+import os
+import pytest
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+from roskarl import (
+    DSN,
+    URL,
+    IntervalExpression,
+    Secret,
+    env_var_log_level,
+)
+from roskarl.bind import clear_loaders, load, loader, plan
+
+
+class Mode(Enum):
+    FAST = "fast"
+    SAFE = "safe"
+
+
+@dataclass
+class Config:
+    database: DSN
+    workers: int
+    timeout: timedelta = timedelta(seconds=30)
+    debug: bool = False
+    ratio: float = 0.5
+    name: str = "app"
+    mode: Mode = Mode.SAFE
+    data_dir: Path | None = None
+    api_key: Secret | None = None
+    api_url: URL | None = None
+    zone: ZoneInfo | None = None
+    started: datetime | None = None
+    every: IntervalExpression | None = None
+    tags: list[str] = field(default_factory=lambda: ["default"])
+
+
+FULL_ENV = {
+    "APP_DATABASE": "postgresql://u:p@db:5432/app",
+    "APP_WORKERS": "8",
+    "APP_TIMEOUT": "2m",
+    "APP_DEBUG": "true",
+    "APP_RATIO": "0.25",
+    "APP_NAME": "svc",
+    "APP_MODE": "fast",
+    "APP_DATA_DIR": "/var/data",
+    "APP_API_KEY": "k",
+    "APP_API_URL": "https://api.example.com/v1",
+    "APP_ZONE": "Europe/Stockholm",
+    "APP_STARTED": "2024-01-02T03:04:05+00:00",
+    "APP_EVERY": "*/5 * * * *",
+    "APP_TAGS": "a, b",
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_loaders():
+    clear_loaders()
+    yield
+    clear_loaders()
+
+
+class TestLoad:
+    def test_all_supported_types(self):
+        with patch.dict(os.environ, FULL_ENV, clear=True):
+            config = load(Config, prefix="APP_")
+        assert config.database.hostname == "db"
+        assert config.workers == 8
+        assert config.timeout == timedelta(minutes=2)
+        assert config.debug is True
+        assert config.ratio == 0.25
+        assert config.name == "svc"
+        assert config.mode is Mode.FAST
+        assert config.data_dir == Path("/var/data")
+        assert config.api_key == Secret("k")
+        assert config.api_url.host == "api.example.com"
+        assert config.zone == ZoneInfo("Europe/Stockholm")
+        assert config.started == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert config.every == "*/5 * * * *"
+        assert config.tags == ["a", "b"]
+
+    def test_defaults_when_unset(self):
+        env = {"APP_DATABASE": "postgresql://u:p@db/app", "APP_WORKERS": "1"}
+        with patch.dict(os.environ, env, clear=True):
+            config = load(Config, prefix="APP_")
+        assert config.timeout == timedelta(seconds=30)
+        assert config.debug is False
+        assert config.mode is Mode.SAFE
+        assert config.api_key is None
+        assert config.tags == ["default"]
+
+    def test_default_factory_called_per_load(self):
+        env = {"APP_DATABASE": "postgresql://u:p@db/app", "APP_WORKERS": "1"}
+        with patch.dict(os.environ, env, clear=True):
+            first = load(Config, prefix="APP_")
+            second = load(Config, prefix="APP_")
+        assert first.tags == second.tags and first.tags is not second.tags
+
+    def test_required_fields(self):
+        with patch.dict(os.environ, {"APP_WORKERS": "1"}, clear=True):
+            with pytest.raises(ValueError, match="'APP_DATABASE' is not set"):
+                load(Config, prefix="APP_")
+
+    def test_invalid_value_raises(self):
+        env = {**FULL_ENV, "APP_MODE": "turbo"}
+        with patch.dict(os.environ, env, clear=True):
+            with pytest.raises(ValueError, match="'APP_MODE' must be one of"):
+                load(Config, prefix="APP_")
+
+    def test_metadata_overrides(self):
+        @dataclass
+        class Logging:
+            level: int = field(
+                default=20, metadata={"env": "LOG_LEVEL", "helper": env_var_log_level}
+            )
+
+        with patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"}, clear=True):
+            assert load(Logging).level == 10
+
+    def test_string_annotations(self):
+        namespace = {"__name__": __name__}
+        exec(
+            "from __future__ import annotations\n"
+            "from dataclasses import dataclass\n"
+            "from datetime import timedelta\n"
+            "@dataclass\n"
+            "class Late:\n"
+            "    timeout: timedelta | None = None\n",
+            namespace,
+        )
+        with patch.dict(os.environ, {"TIMEOUT": "5s"}, clear=True):
+            assert load(namespace["Late"]).timeout == timedelta(seconds=5)
+
+    def test_non_init_fields_skipped(self):
+        @dataclass
+        class Derived:
+            workers: int
+            doubled: int = field(init=False)
+
+            def __post_init__(self):
+                self.doubled = self.workers * 2
+
+        with patch.dict(os.environ, {"WORKERS": "3"}, clear=True):
+            assert load(Derived).doubled == 6
+
+
+class TestLoader:
+    def test_cached_per_class_and_prefix(self):
+        assert loader(Config, "APP_") is loader(Config, "APP_")
+        assert loader(Config, "APP_") is not loader(Config, "OTHER_")
+
+    def test_generated_code_is_straight_line(self):
+        source = loader(Config, "APP_").__roskarl_source__
+        assert "for " not in source
+        assert "v_workers = env_var_int('APP_WORKERS', required=True)" in source
+        assert (
+            "v_database = env_var_custom('APP_DATABASE', parse_dsn, required=True)"
+            in source
+        )
+        assert "v_mode = env_var_enum('APP_MODE', Mode, default=default_mode)" in source
+        assert "v_debug = env_var_bool('APP_DEBUG', default=False)" in source
+
+    def test_unsupported_type(self):
+        @dataclass
+        class Bad:
+            value: dict[str, int]
+
+        with pytest.raises(TypeError, match="Cannot bind field 'value'"):
+            load(Bad)
+
+    def test_not_a_dataclass(self):
+        with pytest.raises(TypeError, match="is not a dataclass"):
+            plan(int)
@@ -0,0 +1,82 @@
+import base64
+import os
+import pytest
+from unittest.mock import patch
+from roskarl import (
+    env_var_base64,
+    env_var_base64_view,
+    env_var_bytes,
+    env_var_custom_bytes,
+)
+from roskarl.source import lookup_bytes, override, use_source
+
+PAYLOAD = bytes(range(256)) * 4
+ENCODED = base64.b64encode(PAYLOAD).decode()
+URLSAFE = base64.urlsafe_b64encode(PAYLOAD).decode().rstrip("=")
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "environb"), reason="os.environb is POSIX only"
+)
+
+
+class TestLookupBytes:
+    def test_reads_environb_without_copy(self):
+        with patch.dict(os.environ, {"PEM": "-----BEGIN-----"}, clear=True):
+            assert lookup_bytes("PEM") is os.environb[b"PEM"]
+            assert lookup_bytes("MISSING") is None
+
+    def test_non_utf8_value_round_trips(self):
+        with patch.dict(os.environ, {}, clear=True):
+            os.environb[b"RAW"] = b"\xff\xfe"
+            assert lookup_bytes("RAW") == b"\xff\xfe"
+
+    def test_scoped_source_and_overrides(self):
+        with use_source({"A": "source"}):
+            assert lookup_bytes("A") == b"source"
+            with override(A="override", B=None):
+                assert lookup_bytes("A") == b"override"
+                assert lookup_bytes("B") is None
+
+
+class TestBytesHelpers:
+    def test_env_var_bytes(self):
+        with patch.dict(os.environ, {"BLOB": "abc"}, clear=True):
+            assert env_var_bytes("BLOB") == b"abc"
+            assert env_var_bytes("MISSING", default=b"x") == b"x"
+            assert env_var_bytes("MISSING", default_factory=lambda: b"y") == b"y"
+            with pytest.raises(ValueError, match="'MISSING' is not set"):
+                env_var_bytes("MISSING", required=True)
+            assert env_var_bytes("MISSING", should_print_unset=False) is None
+
+    def test_empty_is_unset(self):
+        with patch.dict(os.environ, {"BLOB": ""}, clear=True):
+            assert env_var_bytes("BLOB", default=b"d") == b"d"
+
+    def test_base64(self):
+        with patch.dict(os.environ, {"KEY": ENCODED}, clear=True):
+            assert env_var_base64("KEY") == PAYLOAD
+
+    def test_base64_urlsafe_unpadded(self):
+        with patch.dict(os.environ, {"KEY": URLSAFE}, clear=True):
+            assert env_var_base64("KEY", urlsafe=True) == PAYLOAD
+            with pytest.raises(ValueError, match="'KEY' is not valid base64"):
+                env_var_base64("KEY")
+
+    @pytest.mark.parametrize("value", ["not base64!", "YWJj\nZGVm", "YWJ"])
+    def test_base64_invalid(self, value):
+        with patch.dict(os.environ, {"KEY": value}, clear=True):
+            with pytest.raises(ValueError, match="'KEY' is not valid base64"):
+                env_var_base64("KEY")
+
+    def test_base64_view(self):
+        with patch.dict(os.environ, {"KEY": ENCODED}, clear=True):
+            view = env_var_base64_view("KEY", required=True)
+        assert isinstance(view, memoryview) and view.readonly
+        assert view[256:512] == PAYLOAD[256:512]
+
+    def test_custom_parser_gets_bytes(self):
+        with patch.dict(os.environ, {"PEM": "line1\nline2"}, clear=True):
+            assert env_var_custom_bytes("PEM", bytes.splitlines) == [
+                b"line1",
+                b"line2",
+            ]
@@ -0,0 +1,228 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import textwrap
+import pytest
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+from roskarl import (
+    DSN,
+    URL,
+    IntervalExpression,
+    Secret,
+    env_var_log_level,
+)
+from roskarl.bind import load as bind_load
+from roskarl.codegen import compile_module
+
+
+class Mode(Enum):
+    FAST = "fast"
+    SAFE = "safe"
+
+
+@dataclass
+class Config:
+    database: DSN
+    workers: int
+    timeout: timedelta = timedelta(seconds=30)
+    debug: bool = False
+    ratio: float = 0.5
+    name: str = "app"
+    mode: Mode = Mode.SAFE
+    data_dir: Path | None = None
+    api_key: Secret | None = None
+    api_url: URL | None = None
+    zone: ZoneInfo | None = None
+    started: datetime | None = None
+    tags: list[str] = field(default_factory=lambda: ["default"])
+    optional_count: int | None = None
+    unset_optional: str | None = field(default=None, metadata={"env": "NOPE"})
+
+
+@dataclass
+class Scheduled:
+    every: IntervalExpression
+    level: int = field(default=20, metadata={"helper": env_var_log_level})
+    window: IntervalExpression | None = None
+
+
+FULL_ENV = {
+    "APP_DATABASE": "postgresql://u:p@db:5432/app",
+    "APP_WORKERS": "8",
+    "APP_TIMEOUT": "2m",
+    "APP_DEBUG": "true",
+    "APP_RATIO": "0.25",
+    "APP_NAME": "svc",
+    "APP_MODE": "fast",
+    "APP_DATA_DIR": "/var/data",
+    "APP_API_KEY": "k",
+    "APP_API_URL": "https://api.example.com/v1",
+    "APP_ZONE": "Europe/Stockholm",
+    "APP_STARTED": "2024-01-02T03:04:05z",
+    "APP_TAGS": "a, b",
+    "APP_OPTIONAL_COUNT": "3",
+}
+
+
+def import_source(tmp_path, source, name="generated_config"):
+    path = tmp_path / f"{name}.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def generated(tmp_path):
+    return import_source(tmp_path, compile_module(Config, prefix="APP_"))
+
+
+class TestCompileModule:
+    @pytest.mark.parametrize(
+        "env",
+        [
+            FULL_ENV,
+            {"APP_DATABASE": "postgresql://u:p@db/app", "APP_WORKERS": "1"},
+            {**FULL_ENV, "APP_DEBUG": "", "APP_TAGS": ""},
+        ],
+    )
+    def test_same_result_as_runtime_binder(self, generated, env):
+        with patch.dict(os.environ, env, clear=True):
+            assert generated.load() == bind_load(Config, prefix="APP_")
+
+    @pytest.mark.parametrize(
+        "env",
+        [
+            FULL_ENV,
+            {"APP_DATABASE": "postgresql://u:p@db/app", "APP_WORKERS": "1"},
+            {**FULL_ENV, "APP_NAME": "", "APP_OPTIONAL_COUNT": ""},
+        ],
+    )
+    def test_same_output_as_runtime_binder(self, generated, env, capsys):
+        with patch.dict(os.environ, env, clear=True):
+            bind_load(Config, prefix="APP_")
+            runtime = capsys.readouterr().out
+            generated.load()
+            compiled = capsys.readouterr().out
+        assert compiled == runtime
+        assert "NOPE not set or set to None." in compiled
+
+    def test_same_output_for_optional_cron(self, tmp_path, capsys):
+        module = import_source(tmp_path, compile_module(Scheduled), "generated_sched")
+        with patch.dict(os.environ, {"EVERY": "@hourly"}, clear=True):
+            assert module.load() == bind_load(Scheduled)
+            output = capsys.readouterr().out
+        assert output.count("WINDOW not set or set to None.") == 2
+
+    @pytest.mark.parametrize(
+        "env",
+        [
+            {"APP_WORKERS": "1"},
+            {**FULL_ENV, "APP_MODE": "turbo"},
+            {**FULL_ENV, "APP_TIMEOUT": "soon"},
+            {**FULL_ENV, "APP_DEBUG": "yes"},
+            {**FULL_ENV, "APP_STARTED": "yesterday"},
+            {**FULL_ENV, "APP_ZONE": "Mars/Olympus"},
+            {**FULL_ENV, "APP_API_URL": "not a url"},
+        ],
+    )
+    def test_same_errors_as_runtime_binder(self, generated, env):
+        with patch.dict(os.environ, env, clear=True):
+            with pytest.raises(ValueError) as runtime:
+                bind_load(Config, prefix="APP_")
+            with pytest.raises(ValueError) as compiled:
+                generated.load()
+        assert str(compiled.value) == str(runtime.value)
+
+    def test_parsers_imported_not_copied(self, generated):
+        from roskarl import duration, parsers, rfc3339, tz
+
+        assert generated.parse_bool is parsers.parse_bool
+        assert generated.parse_named_enum is parsers.parse_named_enum
+        assert generated.parse_named_duration is duration.parse_named_duration
+        assert generated.parse_named_iso8601 is rfc3339.parse_named_iso8601
+        assert generated.parse_zone is tz.parse_zone
+        assert "def " not in compile_module(Config).split("def load")[0]
+
+    def test_straight_line_reads(self):
+        source = compile_module(Config, prefix="APP_")
+        assert "for " not in source.split("def load")[1].replace("for item in", "")
+        assert 'raw = os.environ.get("APP_WORKERS")' in source
+        assert 'kwargs["workers"] = int(raw)' in source
+        assert "roskarl.cron" not in source
+        assert "roskarl.bind" not in source
+
+    def test_cron_and_metadata_helpers(self, tmp_path):
+        source = compile_module(Scheduled)
+        assert "from roskarl.cron import env_var_interval_expression" in source
+        assert "from roskarl.env import env_var_log_level" in source
+        module = import_source(tmp_path, source, "generated_scheduled")
+        with patch.dict(os.environ, {"EVERY": "@hourly", "LEVEL": "DEBUG"}):
+            assert module.load() == Scheduled(every="0 * * * *", level=10)
+        with patch.dict(os.environ, {"EVERY": "0 2 * * *"}):
+            with pytest.raises(ValueError, match="cron offset"):
+                module.load()
+
+    def test_local_classes_rejected(self):
+        @dataclass
+        class Local:
+            workers: int
+
+        with pytest.raises(ValueError, match="module level"):
+            compile_module(Local)
+
+
+class TestCommand:
+    SCHEMA = textwrap.dedent("""
+        from dataclasses import dataclass
+        from datetime import timedelta
+
+        @dataclass
+        class Config:
+            workers: int
+            timeout: timedelta = timedelta(seconds=30)
+            debug: bool = False
+        """)
+
+    def run(self, tmp_path, *args, **env):
+        return subprocess.run(
+            [sys.executable, *args],
+            cwd=tmp_path,
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_generated_module_imports_only_needed_parsers(self, tmp_path):
+        (tmp_path / "schema.py").write_text(self.SCHEMA)
+        self.run(tmp_path, "-m", "roskarl", "compile", "schema:Config", "-o", "gen.py")
+        assert (
+            "Generated by `python -m roskarl compile schema:Config -o gen.py`"
+            in (tmp_path / "gen.py").read_text()
+        )
+        result = self.run(
+            tmp_path,
+            "-c",
+            "import sys, gen; print(gen.load()); "
+            "print(sorted(m for m in sys.modules if m.startswith(('roskarl', 'icron'))))",
+            WORKERS="4",
+            TIMEOUT="1m",
+        )
+        config, modules = result.stdout.splitlines()
+        assert "workers=4" in config and "seconds=60" in config
+        assert modules == "['roskarl', 'roskarl.duration', 'roskarl.parsers']"
+
+    def test_prints_to_stdout(self, tmp_path):
+        (tmp_path / "schema.py").write_text(self.SCHEMA)
+        result = self.run(
+            tmp_path, "-m", "roskarl", "compile", "schema:Config", "--prefix", "APP_"
+        )
+        assert 'os.environ.get("APP_WORKERS")' in result.stdout
@@ -0,0 +1,113 @@
+import os
+import time
+import pytest
+from collections import ChainMap
+from datetime import timedelta
+from roskarl import env_var_duration, env_var_int
+from roskarl.dotenv import parse_dotenv, read_dotenv
+from roskarl.source import use_source
+
+
+class TestParseDotenv:
+    def test_plain(self):
+        assert parse_dotenv("A=1\nB=two\n") == {"A": "1", "B": "two"}
+
+    def test_export_prefix(self):
+        assert parse_dotenv("export A=1") == {"A": "1"}
+
+    def test_whitespace_around_equals(self):
+        assert parse_dotenv("  A = spaced value  ") == {"A": "spaced value"}
+
+    def test_comments(self):
+        text = "# header\nA=1 # trailing\nB=a#b\n   # indented\n"
+        assert parse_dotenv(text) == {"A": "1", "B": "a#b"}
+
+    def test_single_quotes_are_literal(self):
+        assert parse_dotenv(r"A='x\ny # z'") == {"A": r"x\ny # z"}
+
+    def test_double_quote_escapes(self):
+        assert parse_dotenv(r'A="tab\there \"q\" \\ \$HOME \d"') == {
+            "A": 'tab\there "q" \\ $HOME \\d'
+        }
+
+    def test_multiline_double(self):
+        text = 'CERT="-----BEGIN-----\nabc\n-----END-----"\nB=1'
+        assert parse_dotenv(text) == {
+            "CERT": "-----BEGIN-----\nabc\n-----END-----",
+            "B": "1",
+        }
+
+    def test_multiline_single(self):
+        assert parse_dotenv("A='one\ntwo'") == {"A": "one\ntwo"}
+
+    def test_empty_value(self):
+        assert parse_dotenv("A=\nB=''\nC=\"\"") == {"A": "", "B": "", "C": ""}
+
+    def test_later_assignment_wins(self):
+        assert parse_dotenv("A=1\nA=2") == {"A": "2"}
+
+    def test_crlf(self):
+        assert parse_dotenv("A=1\r\nB=2\r\n") == {"A": "1", "B": "2"}
+
+    def test_interpolation_is_not_expanded(self):
+        assert parse_dotenv("A=${B}/x") == {"A": "${B}/x"}
+
+    def test_bare_key_is_ignored(self):
+        assert parse_dotenv("JUST_A_KEY\nA=1") == {"A": "1"}
+
+    @pytest.mark.parametrize(
+        "text, line",
+        [
+            ('A="unterminated\nB=1\n', 1),
+            ('A="x" junk', 1),
+            ("A=1\nB=2\nnot valid\n", 3),
+            ("A=1\n1A=2", 2),
+        ],
+    )
+    def test_invalid_lines_raise_with_line_number(self, text, line):
+        with pytest.raises(ValueError, match=f"<string>:{line}:"):
+            parse_dotenv(text)
+
+
+class TestParseDotenvLinearTime:
+    def _elapsed(self, text: str) -> float:
+        start = time.perf_counter()
+        parse_dotenv(text)
+        return time.perf_counter() - start
+
+    @pytest.mark.parametrize(
+        "make",
+        [
+            lambda n: "K=x" + " " * n + "y",
+            lambda n: "K=x" + " \t" * n + "# comment",
+            lambda n: "K=x" + " " * n,
+        ],
+    )
+    def test_pathological_inputs_scale_linearly(self, make):
+        small = min(self._elapsed(make(20_000)) for _ in range(3))
+        large = min(self._elapsed(make(200_000)) for _ in range(3))
+        # 10x the input; a quadratic parser would take ~100x as long.
+        assert large < max(small, 1e-4) * 40
+
+
+class TestReadDotenv:
+    def test_reads_file(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("export TIMEOUT=30s\nWORKERS=4\n")
+        assert read_dotenv(path) == {"TIMEOUT": "30s", "WORKERS": "4"}
+
+    def test_error_names_file(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("oops\n=1\n")
+        with pytest.raises(ValueError, match=r"\.env:2:"):
+            read_dotenv(path)
+
+    def test_as_source_for_helpers(self, tmp_path, monkeypatch):
+        path = tmp_path / ".env"
+        path.write_text("TIMEOUT=30s\nWORKERS=4\n")
+        monkeypatch.setenv("WORKERS", "8")
+        monkeypatch.delenv("TIMEOUT", raising=False)
+        with use_source(ChainMap(os.environ, read_dotenv(path))):
+            assert env_var_duration("TIMEOUT") == timedelta(seconds=30)
+            assert env_var_int("WORKERS") == 8
+        assert "TIMEOUT" not in os.environ
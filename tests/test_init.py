@@ -1,3 +1,6 @@
+import subprocess
+import sys
+import pytest
 import roskarl
 from roskarl.env import DSN
 from roskarl.cron import IntervalExpression
@@ -13,6 +16,12 @@ class TestInit:
             "env_var_bool",
             "env_var_cron",
             "env_var_custom",
+            "env_var_custom_bytes",
+            "env_var_bytes",
+            "env_var_base64",
+            "env_var_base64_view",
+            "env_var_json",
+            "env_var_toml",
             "env_var_duration",
             "env_var_enum",
             "env_var_interval_expression",
@@ -23,13 +32,17 @@ class TestInit:
             "env_var_path",
             "env_var_secret",
             "env_var_url",
+            "env_var_parsed_url",
             "env_var",
             "env_var_tz",
+            "env_var_zoneinfo",
             "env_var_dsn",
+            "env_var_dsn_set",
             "env_var_rfc3339_datetime",
             "env_var_iso8601_datetime",
             "DSN",
             "Secret",
+            "URL",
             "IntervalExpression",
         ]
         for name in expected:
@@ -38,3 +51,12 @@ class TestInit:
     def test_types_are_correct(self):
         assert isinstance(roskarl.IntervalExpression, type(IntervalExpression))
         assert isinstance(roskarl.DSN, type(DSN))
+
+    def test_submodules_are_attributes(self):
+        # a fresh interpreter, so no other test has imported the submodules
+        code = "import roskarl; roskarl.env.env_var_int; roskarl.cron.has_offset"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="no attribute 'nope'"):
+            roskarl.nope
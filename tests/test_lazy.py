@@ -0,0 +1,154 @@
+import os
+import threading
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+from roskarl import env_var_cron, env_var_duration, env_var_int
+from roskarl.lazy import LazyEnv, lazy_fields, reset_all, validate_all
+from roskarl.source import override, use_source
+
+
+def counting(helper, calls):
+    def wrapper(name, *args, **kwargs):
+        calls.append(name)
+        return helper(name, *args, **kwargs)
+
+    wrapper.__name__ = helper.__name__
+    return wrapper
+
+
+class TestLazyEnv:
+    def test_not_read_until_accessed(self):
+        calls = []
+
+        class Settings:
+            timeout = LazyEnv(counting(env_var_duration, calls), "TIMEOUT")
+            workers = LazyEnv(counting(env_var_int, calls), "WORKERS")
+
+        assert calls == []
+        with patch.dict(os.environ, {"TIMEOUT": "30s", "WORKERS": "4"}):
+            assert Settings.timeout == timedelta(seconds=30)
+        assert calls == ["TIMEOUT"]
+
+    def test_cached_after_first_access(self):
+        calls = []
+
+        class Settings:
+            workers = LazyEnv(counting(env_var_int, calls), "WORKERS")
+
+        with patch.dict(os.environ, {"WORKERS": "4"}):
+            assert Settings.workers == 4
+        with patch.dict(os.environ, {"WORKERS": "8"}):
+            assert Settings.workers == 4
+            assert Settings().workers == 4
+        assert calls == ["WORKERS"]
+
+    def test_helper_arguments_forwarded(self):
+        class Settings:
+            workers = LazyEnv(env_var_int, "WORKERS", default=2)
+            timeout = LazyEnv(env_var_duration, "TIMEOUT", required=True)
+
+        with patch.dict(os.environ, {}, clear=True):
+            assert Settings.workers == 2
+            with pytest.raises(ValueError, match="'TIMEOUT' is not set"):
+                Settings.timeout
+
+    def test_error_is_not_cached(self):
+        class Settings:
+            workers = LazyEnv(env_var_int, "WORKERS")
+
+        with patch.dict(os.environ, {"WORKERS": "many"}):
+            with pytest.raises(ValueError):
+                Settings.workers
+        with patch.dict(os.environ, {"WORKERS": "3"}):
+            assert Settings.workers == 3
+
+    def test_scoped_values_are_not_cached(self):
+        class Settings:
+            workers = LazyEnv(env_var_int, "WORKERS")
+
+        with patch.dict(os.environ, {"WORKERS": "1"}):
+            with override(WORKERS="2"):
+                assert Settings.workers == 2
+            with use_source({"WORKERS": "3"}):
+                assert Settings.workers == 3
+            assert not Settings.__dict__["workers"].resolved
+            assert validate_all(Settings) == {"workers": 1}
+            with override(WORKERS="4"):
+                assert Settings.workers == 4
+            assert Settings.workers == 1
+
+    def test_reset(self):
+        class Settings:
+            workers = LazyEnv(env_var_int, "WORKERS")
+
+        with patch.dict(os.environ, {"WORKERS": "1"}):
+            assert Settings.workers == 1
+        reset_all(Settings)
+        with patch.dict(os.environ, {"WORKERS": "2"}):
+            assert Settings.workers == 2
+
+    def test_concurrent_first_access_resolves_once(self):
+        calls = []
+
+        class Settings:
+            workers = LazyEnv(counting(env_var_int, calls), "WORKERS")
+
+        barrier = threading.Barrier(16)
+        seen = []
+
+        def worker():
+            barrier.wait()
+            seen.append(Settings.workers)
+
+        with patch.dict(os.environ, {"WORKERS": "5"}):
+            threads = [threading.Thread(target=worker) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert seen == [5] * 16
+        assert calls == ["WORKERS"]
+
+    def test_repr(self):
+        assert (
+            repr(LazyEnv(env_var_int, "WORKERS")) == "LazyEnv(env_var_int, 'WORKERS')"
+        )
+
+
+class TestValidateAll:
+    def test_resolves_everything(self):
+        class Base:
+            workers = LazyEnv(env_var_int, "WORKERS")
+
+        class Settings(Base):
+            timeout = LazyEnv(env_var_duration, "TIMEOUT")
+            schedule = LazyEnv(env_var_cron, "SCHEDULE")
+            plain = 1
+
+        env = {"WORKERS": "4", "TIMEOUT": "1m", "SCHEDULE": "*/5 * * * *"}
+        with patch.dict(os.environ, env):
+            values = validate_all(Settings())
+        assert values == {
+            "workers": 4,
+            "timeout": timedelta(minutes=1),
+            "schedule": "*/5 * * * *",
+        }
+        assert all(field.resolved for field in lazy_fields(Settings).values())
+
+    def test_fails_fast(self):
+        class Settings:
+            schedule = LazyEnv(env_var_cron, "SCHEDULE")
+
+        with patch.dict(os.environ, {"SCHEDULE": "not a cron"}):
+            with pytest.raises(ValueError, match="SCHEDULE"):
+                validate_all(Settings)
+
+    def test_overridden_attribute_is_not_a_field(self):
+        class Base:
+            workers = LazyEnv(env_var_int, "WORKERS")
+
+        class Settings(Base):
+            workers = 1
+
+        assert lazy_fields(Settings) == {}
@@ -0,0 +1,143 @@
+import os
+import pytest
+from dataclasses import dataclass, field
+from datetime import timedelta
+from unittest.mock import patch
+from roskarl import DSN
+from roskarl.nested import bind_tree, decode, load
+
+
+@dataclass
+class Pool:
+    size: int = 5
+    timeout: timedelta = timedelta(seconds=30)
+
+
+@dataclass
+class Database:
+    primary: DSN
+    replica: DSN | None = None
+    pool: Pool = field(default_factory=Pool)
+
+
+@dataclass
+class Cache:
+    url: str
+
+
+@dataclass
+class Config:
+    db: Database
+    cache: Cache | None = None
+    debug: bool = False
+
+
+ENV = {
+    "APP__DB__PRIMARY": "postgresql://u:p@primary:5432/app",
+    "APP__DB__POOL__SIZE": "10",
+    "APP__DB__POOL__TIMEOUT": "1m",
+    "APP__DEBUG": "true",
+    "OTHER__DB__PRIMARY": "ignored",
+}
+
+
+class TestDecode:
+    def test_builds_tree(self):
+        assert decode(ENV, prefix="APP__") == {
+            "db": {
+                "primary": "postgresql://u:p@primary:5432/app",
+                "pool": {"size": "10", "timeout": "1m"},
+            },
+            "debug": "true",
+        }
+
+    def test_reads_active_source_by_default(self):
+        with patch.dict(os.environ, {"APP__A__B": "1"}, clear=True):
+            assert decode(prefix="APP__") == {"a": {"b": "1"}}
+
+    def test_custom_delimiter(self):
+        assert decode({"APP.A.B": "1", "APP.C": "2"}, "APP.", ".") == {
+            "a": {"b": "1"},
+            "c": "2",
+        }
+
+    def test_empty_segments_skipped(self):
+        assert decode({"__PYVENV_LAUNCHER__": "x", "A____B": "y", "C": "z"}) == {
+            "c": "z"
+        }
+
+    @pytest.mark.parametrize(
+        "env",
+        [
+            {"APP__DB": "x", "APP__DB__HOST": "y"},
+            {"APP__DB__HOST": "y", "APP__DB": "x"},
+        ],
+    )
+    def test_value_and_section_conflict(self, env):
+        with pytest.raises(ValueError, match="'APP__DB' is both a value and a section"):
+            decode(env, prefix="APP__")
+
+    def test_case_duplicates(self):
+        with pytest.raises(ValueError, match="set more than once"):
+            decode({"APP__DB__HOST": "a", "APP__db__host": "b"}, prefix="APP__")
+
+
+class TestLoad:
+    def test_binds_nested_sections(self):
+        config = load(Config, prefix="APP__", source=ENV)
+        assert config.db.primary.hostname == "primary"
+        assert config.db.replica is None
+        assert config.db.pool == Pool(size=10, timeout=timedelta(minutes=1))
+        assert config.cache is None
+        assert config.debug is True
+
+    def test_section_defaults(self):
+        env = {"APP__DB__PRIMARY": "postgresql://u:p@h/app"}
+        assert load(Config, prefix="APP__", source=env).db.pool == Pool()
+
+    def test_optional_section_set(self):
+        env = {**ENV, "APP__CACHE__URL": "redis://cache"}
+        assert load(Config, prefix="APP__", source=env).cache == Cache("redis://cache")
+
+    def test_required_leaf_reports_full_name(self):
+        with pytest.raises(ValueError, match="'APP__DB__PRIMARY' is not set"):
+            load(Config, prefix="APP__", source={"APP__DEBUG": "true"})
+
+    def test_invalid_leaf_reports_full_name(self):
+        env = {**ENV, "APP__DB__POOL__TIMEOUT": "soon"}
+        with pytest.raises(ValueError, match="'APP__DB__POOL__TIMEOUT' is not a valid"):
+            load(Config, prefix="APP__", source=env)
+
+    def test_section_set_as_value(self):
+        with pytest.raises(ValueError, match="'APP__DB' is a section"):
+            load(Config, prefix="APP__", source={"APP__DB": "x"})
+
+    def test_value_set_as_section(self):
+        env = {"APP__DB__PRIMARY": "postgresql://u:p@h/app", "APP__DEBUG__X": "1"}
+        with pytest.raises(ValueError, match="'APP__DEBUG' is a value"):
+            load(Config, prefix="APP__", source=env)
+
+    def test_strict_rejects_unknown(self):
+        env = {**ENV, "APP__DB__POOL__SIEZ": "3"}
+        assert load(Config, prefix="APP__", source=env).db.pool.size == 10
+        with pytest.raises(ValueError, match="APP__DB__POOL__SIEZ"):
+            load(Config, prefix="APP__", source=env, strict=True)
+
+    def test_segment_rename(self):
+        @dataclass
+        class Renamed:
+            hosts: int = field(default=1, metadata={"env": "HOST_COUNT"})
+
+        tree = decode({"X__HOST_COUNT": "3"}, prefix="X__")
+        assert bind_tree(Renamed, tree, prefix="X__") == Renamed(3)
+
+    def test_single_scan(self):
+        class Counting(dict):
+            scans = 0
+
+            def items(self):
+                Counting.scans += 1
+                return super().items()
+
+        load(Config, prefix="APP__", source=Counting(ENV))
+        assert Counting.scans == 1
@@ -0,0 +1,69 @@
+import os
+import pytest
+from unittest.mock import patch
+from roskarl import env_var, env_var_int, env_var_list
+from roskarl.prefix import PrefixIndex
+
+ENV = {
+    "PLUGIN_KAFKA_BROKERS": "a:9092, b:9092",
+    "PLUGIN_KAFKA_TIMEOUT": "5",
+    "PLUGIN_S3_BUCKET": "data",
+    "PLUGIN_S3X_BUCKET": "other",
+    "PATH": "/usr/bin",
+    "Z\U0010ffff": "edge",
+}
+
+
+@pytest.fixture
+def index():
+    return PrefixIndex(ENV)
+
+
+class TestPrefixIndex:
+    def test_view(self, index):
+        assert dict(index.view("PLUGIN_KAFKA_")) == {
+            "PLUGIN_KAFKA_BROKERS": "a:9092, b:9092",
+            "PLUGIN_KAFKA_TIMEOUT": "5",
+        }
+
+    def test_view_stripped(self, index):
+        view = index.view("PLUGIN_S3_", strip=True)
+        assert dict(view) == {"BUCKET": "data"}
+        assert view["BUCKET"] == "data"
+        assert "PLUGIN_S3_BUCKET" not in view
+        assert view.get("MISSING") is None
+
+    def test_view_rejects_names_outside_prefix(self, index):
+        view = index.view("PLUGIN_S3_")
+        assert "PATH" not in view
+        assert view.get("PATH") is None
+        with pytest.raises(KeyError):
+            view["PATH"]
+
+    def test_matches_linear_scan(self, index):
+        for prefix in ["", "P", "PLUGIN_", "PLUGIN_S3", "PLUGIN_S3_", "Q", "Z"]:
+            expected = {k: v for k, v in ENV.items() if k.startswith(prefix)}
+            assert dict(index.view(prefix)) == expected
+            assert index.count(prefix) == len(expected)
+
+    def test_max_char_prefix(self, index):
+        assert dict(index.view("Z\U0010ffff")) == {"Z\U0010ffff": "edge"}
+
+    def test_is_a_snapshot(self):
+        source = dict(ENV)
+        index = PrefixIndex(source)
+        source["PLUGIN_KAFKA_NEW"] = "1"
+        assert index.count("PLUGIN_KAFKA_") == 2
+
+    def test_defaults_to_active_source(self):
+        with patch.dict(os.environ, {"A_X": "1", "B_X": "2"}, clear=True):
+            assert dict(PrefixIndex().view("A_")) == {"A_X": "1"}
+
+    def test_scope_feeds_helpers(self, index):
+        with index.scope("PLUGIN_KAFKA_"):
+            assert env_var_list("BROKERS") == ["a:9092", "b:9092"]
+            assert env_var_int("TIMEOUT") == 5
+            assert env_var("PATH") is None
+        with pytest.raises(ValueError, match="'BUCKET' is not set"):
+            with index.scope("PLUGIN_KAFKA_"):
+                env_var("BUCKET", required=True)
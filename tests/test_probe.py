@@ -0,0 +1,152 @@
+import asyncio
+import socket
+import pytest
+from unittest.mock import patch
+from roskarl import DSN
+from roskarl.env import parse_dsn
+from roskarl import probe
+from roskarl.probe import HostProbe, clear_probe_cache, order_hosts, probe_hosts
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_probe_cache()
+    yield
+    clear_probe_cache()
+
+
+def closed_port() -> int:
+    """A local port nothing is listening on, so connects are refused."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def ipv6_available() -> bool:
+    try:
+        with socket.socket(socket.AF_INET6) as sock:
+            sock.bind(("::1", 0))
+    except OSError:
+        return False
+    return True
+
+
+async def with_listener(body, host="127.0.0.1"):
+    accepted = []
+
+    def on_connect(reader, writer):
+        accepted.append(1)
+        writer.close()
+
+    server = await asyncio.start_server(on_connect, host, 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        return await body(port, accepted)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def dsn_for(*hosts):
+    hostname, port = hosts[0]
+    return DSN("postgresql", "u", "p", hostname, port, "db", hosts=hosts)
+
+
+class TestProbeHosts:
+    def test_reachable_and_unreachable(self):
+        dead = closed_port()
+
+        async def body(port, accepted):
+            return await probe_hosts([("127.0.0.1", port), ("127.0.0.1", dead)])
+
+        up, down = asyncio.run(with_listener(body))
+        assert up.available and up.latency >= 0
+        assert not down.available and down.error
+
+    def test_results_cached_within_ttl(self):
+        async def body(port, accepted):
+            await probe_hosts([("127.0.0.1", port)])
+            await probe_hosts([("127.0.0.1", port)])
+            await asyncio.sleep(0.05)
+            return len(accepted)
+
+        assert asyncio.run(with_listener(body)) == 1
+
+    def test_ttl_zero_always_probes(self):
+        async def body(port, accepted):
+            await probe_hosts([("127.0.0.1", port)], ttl=0)
+            await probe_hosts([("127.0.0.1", port)], ttl=0)
+            await asyncio.sleep(0.05)
+            return len(accepted)
+
+        assert asyncio.run(with_listener(body)) == 2
+
+    def test_duplicate_hosts_probed_once(self):
+        async def body(port, accepted):
+            results = await probe_hosts([("127.0.0.1", port)] * 3, ttl=0)
+            await asyncio.sleep(0.05)
+            return results, len(accepted)
+
+        results, connects = asyncio.run(with_listener(body))
+        assert len(results) == 3
+        assert connects == 1
+
+
+class TestOrderHosts:
+    def test_unreachable_hosts_move_last(self):
+        dead = closed_port()
+
+        async def body(port, accepted):
+            dsn = dsn_for(("127.0.0.1", dead), ("127.0.0.1", port))
+            return await order_hosts(dsn)
+
+        ordered = asyncio.run(with_listener(body))
+        assert ordered.port != dead
+        assert ordered.hosts[-1] == ("127.0.0.1", dead)
+
+    @pytest.mark.skipif(not ipv6_available(), reason="no IPv6 loopback")
+    def test_bracketed_ipv6_host(self):
+        dead = closed_port()
+
+        async def body(port, accepted):
+            dsn = parse_dsn(f"postgresql://u:p@127.0.0.1:{dead},[::1]:{port}/db")
+            return await order_hosts(dsn), accepted
+
+        ordered, accepted = asyncio.run(with_listener(body, "::1"))
+        assert accepted == [1]
+        assert ordered.hosts[0][0] == "[::1]"
+        assert ordered.connection_string.startswith("postgresql://u:p@[::1]:")
+
+    def test_orders_by_latency(self):
+        latencies = {"slow": 0.3, "fast": 0.01, "mid": 0.1, "down": None}
+
+        async def fake_connect(hostname, port, timeout):
+            return HostProbe(hostname, port, latencies[hostname])
+
+        dsn = dsn_for(("down", 1), ("slow", 1), ("fast", 1), ("mid", 1))
+        with patch.object(probe, "_connect", fake_connect):
+            ordered = asyncio.run(order_hosts(dsn))
+        assert [h for h, _ in ordered.hosts] == ["fast", "mid", "slow", "down"]
+        assert ordered.hostname == "fast"
+        assert (
+            ordered.connection_string
+            == "postgresql://u:p@fast:1,mid:1,slow:1,down:1/db"
+        )
+
+    def test_missing_port_uses_protocol_default(self):
+        seen = []
+
+        async def fake_connect(hostname, port, timeout):
+            seen.append(port)
+            return HostProbe(hostname, port, 0.01)
+
+        dsn = dsn_for(("a", None), ("b", 6000))
+        with patch.object(probe, "_connect", fake_connect):
+            ordered = asyncio.run(order_hosts(dsn))
+        assert sorted(seen) == [5432, 6000]
+        assert set(ordered.hosts) == {("a", None), ("b", 6000)}
+
+    def test_missing_port_unknown_protocol_raises(self):
+        dsn = DSN("weird", "u", "p", "a")
+        with pytest.raises(ValueError, match="No port"):
+            asyncio.run(order_hosts(dsn))
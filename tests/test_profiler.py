@@ -0,0 +1,194 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from dataclasses import dataclass
+from unittest.mock import patch
+from roskarl import (
+    env_var,
+    env_var_bytes,
+    env_var_cron,
+    env_var_dsn,
+    env_var_dsn_set,
+    env_var_int,
+    env_var_json,
+    env_var_secret,
+    env_var_zoneinfo,
+)
+from roskarl import profiler
+from roskarl.profiler import profiling
+from roskarl.validate import load_all
+
+
+def stats(profile, name):
+    return next(s for s in profile.variables() if s.name == name)
+
+
+class TestProfiling:
+    def test_off_by_default(self):
+        assert profiler.active is None
+        with profiling() as profile:
+            assert profiler.active is profile
+        assert profiler.active is None
+
+    def test_records_set_and_defaulted(self):
+        env = {"WORKERS": "4", "SCHEDULE": "*/5 * * * *"}
+        with patch.dict(os.environ, env, clear=True), profiling() as profile:
+            env_var_int("WORKERS")
+            env_var_int("WORKERS")
+            env_var_cron("SCHEDULE")
+            env_var("REGION", default="eu")
+        workers = stats(profile, "WORKERS")
+        assert (workers.calls, workers.set, workers.defaulted) == (2, 2, 0)
+        assert workers.parser == "int"
+        assert stats(profile, "SCHEDULE").parser == "env_var_cron"
+        region = stats(profile, "REGION")
+        assert (region.calls, region.set, region.defaulted) == (1, 0, 1)
+        assert all(s.lookup_ns > 0 and s.parse_ns > 0 for s in profile.variables())
+
+    def test_sorted_slowest_first(self):
+        with patch.dict(os.environ, {"A": "1"}, clear=True):
+            with profiling() as profile:
+                env_var_int("A")
+                env_var_cron("B", default="0 * * * *")
+        totals = [s.total_ns for s in profile.variables()]
+        assert totals == sorted(totals, reverse=True)
+
+    def test_counts_errors(self):
+        with patch.dict(os.environ, {"WORKERS": "many"}, clear=True):
+            with profiling() as profile:
+                with pytest.raises(ValueError):
+                    env_var_int("WORKERS")
+                with pytest.raises(ValueError):
+                    env_var("MISSING", required=True)
+        assert stats(profile, "WORKERS").errors == 1
+        assert stats(profile, "MISSING").errors == 1
+
+    def test_cache_hits(self):
+        env = {"TZ_A": "Europe/Stockholm", "TZ_B": "Europe/Stockholm", "DOC": "[1]"}
+        with patch.dict(os.environ, env, clear=True), profiling() as profile:
+            env_var_zoneinfo("TZ_A")
+            env_var_zoneinfo("TZ_B")
+            env_var_json("DOC", frozen=True)
+            env_var_json("DOC", frozen=True)
+            env_var_cron("UNSET_A", default="0 0 * * *")
+            env_var_cron("UNSET_B", default="0 0 * * *")
+        assert stats(profile, "TZ_B").cache_hits == 1
+        assert stats(profile, "DOC").cache_hits == 1
+        assert stats(profile, "UNSET_B").cache_hits == 1
+
+    def test_bytes_and_dsn_helpers(self):
+        env = {"BLOB": "abc", "DATABASE": "postgresql://u:p@h/db"}
+        with patch.dict(os.environ, env, clear=True), profiling() as profile:
+            env_var_bytes("BLOB")
+            env_var_dsn("DATABASE")
+        assert {s.name for s in profile.variables()} == {"BLOB", "DATABASE"}
+
+    def test_dsn_set_and_secrets_dir(self, tmp_path):
+        (tmp_path / "db_password").write_text("from-file")
+        env = {
+            "DB_SHARDS_0": "postgresql://u:p@a/db",
+            "DB_SHARDS_1": "postgresql://u:p@b/db",
+            "API_KEY": "from-env",
+        }
+        with patch.dict(os.environ, env, clear=True), profiling() as profile:
+            assert len(env_var_dsn_set("DB_SHARDS")) == 2
+            assert env_var_secret("DB_PASSWORD", secrets_dir=tmp_path).reveal() == (
+                "from-file"
+            )
+            assert env_var_secret("API_KEY", secrets_dir=tmp_path).reveal() == (
+                "from-env"
+            )
+            env_var_secret("UNSET", secrets_dir=tmp_path, should_print_unset=False)
+        assert stats(profile, "DB_SHARDS").parser == "env_var_dsn_set"
+        assert stats(profile, "DB_PASSWORD").set == 1
+        assert stats(profile, "API_KEY").parser == "env_var_secret"
+        assert stats(profile, "UNSET").defaulted == 1
+
+    def test_not_imported_by_zone_cache(self):
+        code = (
+            "import sys, roskarl.tz; roskarl.tz.load_zone('UTC');"
+            " roskarl.tz.load_zone('UTC');"
+            " assert 'roskarl.profiler' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_records_worker_threads(self):
+        @dataclass
+        class Config:
+            workers: int
+            schedule: str = "0 * * * *"
+
+        with patch.dict(os.environ, {"WORKERS": "2"}, clear=True):
+            with profiling() as profile:
+                load_all(Config)
+        assert {s.name for s in profile.variables()} == {"WORKERS", "SCHEDULE"}
+
+
+class TestReport:
+    def test_json(self):
+        with patch.dict(os.environ, {"WORKERS": "4"}, clear=True):
+            with profiling() as profile:
+                env_var_int("WORKERS")
+        data = json.loads(profile.to_json())
+        assert data["variables"][0]["name"] == "WORKERS"
+        assert data["variables"][0]["set"] == 1
+        assert data["parsers"] == [
+            {
+                "parser": "int",
+                "variables": 1,
+                "calls": 1,
+                "cache_hits": 0,
+                "parse_ms": data["variables"][0]["parse_ms"],
+            }
+        ]
+
+    def test_text(self):
+        with patch.dict(os.environ, {"WORKERS": "4"}, clear=True):
+            with profiling() as profile:
+                env_var_int("WORKERS")
+                env_var("REGION", default="eu")
+        lines = profile.report().splitlines()
+        assert lines[0].startswith("roskarl: 2 variables read in ")
+        assert any(
+            line.startswith("WORKERS ") and line.endswith(" int") for line in lines
+        )
+
+    def test_enabled_by_environment(self, tmp_path):
+        target = tmp_path / "profile.json"
+        env = {**os.environ, "ROSKARL_PROFILE": str(target), "WORKERS": "4"}
+        code = "from roskarl import env_var_int; env_var_int('WORKERS')"
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        data = json.loads(target.read_text())
+        assert [v["name"] for v in data["variables"]] == ["WORKERS"]
+
+    @pytest.mark.parametrize("value", ["0", "false", "No", "OFF"])
+    def test_disabled_by_environment(self, tmp_path, value):
+        env = {**os.environ, "ROSKARL_PROFILE": value, "WORKERS": "4"}
+        code = (
+            "import roskarl.profiler as p; from roskarl import env_var_int; "
+            "env_var_int('WORKERS'); assert p.active is None"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        assert result.stderr == ""
+        assert list(tmp_path.iterdir()) == []
+
+    def test_enabled_by_environment_to_stderr(self):
+        env = {**os.environ, "ROSKARL_PROFILE": "1", "WORKERS": "4"}
+        code = "from roskarl import env_var_int; env_var_int('WORKERS')"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        assert result.stderr.startswith("roskarl: 1 variables read in ")
@@ -0,0 +1,171 @@
+import os
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from roskarl import env_var_iso8601_datetime, env_var_rfc3339_datetime
+from roskarl.rfc3339 import (
+    parse_fields,
+    parse_rfc3339,
+    parse_rfc3339_datetime64,
+    parse_rfc3339_epoch_ns,
+    parse_rfc3339_many,
+)
+
+
+class TestParseRfc3339:
+    def test_utc_offset(self):
+        assert parse_rfc3339("2026-01-01T00:00:00+00:00") == datetime(
+            2026, 1, 1, tzinfo=timezone.utc
+        )
+
+    def test_z_suffix(self):
+        result = parse_rfc3339("2026-01-01T12:30:45Z")
+        assert result == datetime(2026, 1, 1, 12, 30, 45, tzinfo=timezone.utc)
+        assert result.utcoffset() == timedelta(0)
+
+    def test_lowercase_t_and_z(self):
+        assert parse_rfc3339("2026-01-01t12:30:45z") == datetime(
+            2026, 1, 1, 12, 30, 45, tzinfo=timezone.utc
+        )
+
+    def test_space_separator(self):
+        assert parse_rfc3339("2026-01-01 12:30:45Z").hour == 12
+
+    def test_negative_offset(self):
+        result = parse_rfc3339("2026-01-01T00:00:00-05:30")
+        assert result.utcoffset() == -timedelta(hours=5, minutes=30)
+
+    def test_fraction_is_padded(self):
+        assert parse_rfc3339("2026-01-01T00:00:00.5Z").microsecond == 500000
+
+    def test_nanosecond_fraction_is_truncated(self):
+        assert parse_rfc3339("2026-01-01T00:00:00.123456789Z").microsecond == 123456
+
+    def test_ten_digit_fraction_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-01-01T00:00:00.1234567890Z")
+
+    def test_empty_fraction_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-01-01T00:00:00.Z")
+
+    def test_missing_offset_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-01-01T00:00:00")
+
+    def test_missing_offset_allowed(self):
+        assert parse_rfc3339("2026-01-01T00:00:00", require_offset=False) == datetime(
+            2026, 1, 1
+        )
+
+    def test_offset_without_colon_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-01-01T00:00:00+0000")
+
+    def test_date_only_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-01-01")
+
+    def test_invalid_calendar_date_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-02-30T00:00:00Z")
+
+    def test_hour_out_of_range_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-01-01T24:00:00Z")
+
+    def test_non_ascii_digits_raise(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("２026-01-01T00:00:00Z")
+
+    def test_signed_field_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-+1-01T00:00:00Z")
+
+    def test_trailing_garbage_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-01-01T00:00:00Zjunk")
+
+    def test_offset_minutes_out_of_range_raises(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339("2026-01-01T00:00:00+05:60")
+
+    def test_matches_fromisoformat(self):
+        for value in [
+            "2026-01-01T00:00:00+00:00",
+            "1999-12-31T23:59:59.999999+14:00",
+            "2000-02-29T12:00:00.1-08:00",
+        ]:
+            assert parse_rfc3339(value) == datetime.fromisoformat(value)
+
+
+class TestParseFields:
+    def test_nanoseconds_preserved(self):
+        assert parse_fields("2026-01-01T00:00:00.000000001Z")[6] == 1
+
+    def test_naive_offset_is_none(self):
+        assert parse_fields("2026-01-01T00:00:00")[7] is None
+
+
+class TestBulk:
+    def test_many(self):
+        values = ["2026-01-01T00:00:00Z", "2026-01-02T00:00:00+01:00"]
+        assert parse_rfc3339_many(values) == [
+            datetime.fromisoformat("2026-01-01T00:00:00+00:00"),
+            datetime.fromisoformat("2026-01-02T00:00:00+01:00"),
+        ]
+
+    def test_many_propagates_error(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339_many(["2026-01-01T00:00:00Z", "nope"])
+
+    def test_epoch_ns(self):
+        assert parse_rfc3339_epoch_ns("1970-01-01T00:00:00.000000001Z") == 1
+
+    def test_epoch_ns_applies_offset(self):
+        assert parse_rfc3339_epoch_ns("1970-01-01T01:00:00+01:00") == 0
+
+    def test_epoch_ns_requires_offset(self):
+        with pytest.raises(ValueError):
+            parse_rfc3339_epoch_ns("1970-01-01T00:00:00")
+
+    def test_datetime64(self):
+        numpy = pytest.importorskip("numpy")
+        result = parse_rfc3339_datetime64(
+            ["2026-01-01T00:00:00.123456789Z", "2026-01-01T01:00:00+01:00"]
+        )
+        assert result.dtype == numpy.dtype("datetime64[ns]")
+        assert result[0] == numpy.datetime64("2026-01-01T00:00:00.123456789", "ns")
+        assert result[1] == numpy.datetime64("2026-01-01T00:00:00", "ns")
+
+    def test_datetime64_without_numpy(self):
+        with patch.dict("sys.modules", {"numpy": None}):
+            with pytest.raises(ImportError, match="requires numpy"):
+                parse_rfc3339_datetime64(["2026-01-01T00:00:00Z"])
+
+
+class TestEnvVarDatetimeFastPath:
+    def test_rfc3339_accepts_z_and_nanoseconds(self):
+        with patch.dict(os.environ, {"TEST_DT": "2026-01-01T00:00:00.123456789Z"}):
+            assert env_var_rfc3339_datetime("TEST_DT") == datetime(
+                2026, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc
+            )
+
+    def test_rfc3339_rejects_date_only(self):
+        with patch.dict(os.environ, {"TEST_DT": "2026-01-01"}):
+            with pytest.raises(ValueError, match="not a valid RFC3339"):
+                env_var_rfc3339_datetime("TEST_DT")
+
+    def test_iso8601_accepts_lowercase_z(self):
+        with patch.dict(os.environ, {"TEST_DT": "2026-01-01T00:00:00z"}):
+            assert env_var_iso8601_datetime("TEST_DT") == datetime(
+                2026, 1, 1, tzinfo=timezone.utc
+            )
+
+    def test_iso8601_accepts_date_only(self):
+        with patch.dict(os.environ, {"TEST_DT": "2026-01-01"}):
+            assert env_var_iso8601_datetime("TEST_DT") == datetime(2026, 1, 1)
+
+    def test_iso8601_accepts_basic_format(self):
+        with patch.dict(os.environ, {"TEST_DT": "20260101T000000"}):
+            assert env_var_iso8601_datetime("TEST_DT") == datetime(2026, 1, 1)
@@ -0,0 +1,90 @@
+import pytest
+from collections import Counter
+from roskarl import DSN
+from roskarl.ring import HashRing
+
+KEYS = [f"tenant-{i}" for i in range(20_000)]
+
+
+def shard(i: int) -> DSN:
+    return DSN("postgresql", "u", "p", f"shard{i}.internal", 5432, "app")
+
+
+class TestHashRing:
+    def test_lookup_is_deterministic(self):
+        a = HashRing([shard(i) for i in range(8)])
+        b = HashRing([shard(i) for i in reversed(range(8))])
+        assert a.get_many(KEYS) == b.get_many(KEYS)
+
+    def test_get_matches_get_many(self):
+        ring = HashRing([shard(i) for i in range(8)])
+        assert [ring.get(key) for key in KEYS[:500]] == ring.get_many(KEYS[:500])
+
+    def test_str_and_bytes_keys_agree(self):
+        ring = HashRing([shard(i) for i in range(8)])
+        assert ring.get("tenant-1") == ring.get(b"tenant-1")
+
+    def test_keys_spread_across_all_nodes(self):
+        ring = HashRing([shard(i) for i in range(64)])
+        load = Counter(ring.get_many(KEYS))
+        assert len(load) == 64
+        expected = len(KEYS) / 64
+        assert max(load.values()) < expected * 1.6
+        assert min(load.values()) > expected * 0.5
+
+    def test_adding_a_node_moves_about_one_nth_of_keys(self):
+        ring = HashRing([shard(i) for i in range(64)])
+        before = ring.get_many(KEYS)
+        ring.add(shard(64))
+        after = ring.get_many(KEYS)
+        moved = [(b, a) for b, a in zip(before, after) if b != a]
+        assert all(a == shard(64) for _, a in moved)
+        assert len(moved) < len(KEYS) / 65 * 2
+
+    def test_removing_a_node_only_moves_its_keys(self):
+        ring = HashRing([shard(i) for i in range(16)])
+        before = ring.get_many(KEYS)
+        ring.remove(shard(3))
+        after = ring.get_many(KEYS)
+        for b, a in zip(before, after):
+            if b != shard(3):
+                assert a == b
+            else:
+                assert a != shard(3)
+
+    def test_password_does_not_affect_placement(self):
+        a = HashRing([shard(0), shard(1)])
+        b = HashRing(
+            [
+                DSN("postgresql", "u", "rotated", f"shard{i}.internal", 5432, "app")
+                for i in range(2)
+            ]
+        )
+        assert [str(n) for n in a.get_many(KEYS[:200])] == [
+            str(n) for n in b.get_many(KEYS[:200])
+        ]
+
+    def test_duplicate_node_raises(self):
+        with pytest.raises(ValueError):
+            HashRing([shard(0), shard(0)])
+
+    def test_remove_unknown_raises(self):
+        with pytest.raises(KeyError):
+            HashRing([shard(0)]).remove(shard(1))
+
+    def test_empty_ring_raises(self):
+        ring = HashRing()
+        with pytest.raises(LookupError):
+            ring.get("key")
+        with pytest.raises(LookupError):
+            ring.get_many(["key"])
+
+    def test_custom_node_id(self):
+        ring = HashRing(["a", "b"], vnodes=10, node_id=str.upper)
+        assert ring.get("key") in ("a", "b")
+        assert len(ring) == 2
+        assert ring.nodes == ("a", "b")
+
+    def test_invalid_vnodes_raises(self):
+        with pytest.raises(ValueError):
+            HashRing(vnodes=0)
@@ -0,0 +1,202 @@
+import builtins
+import os
+import pytest
+from collections import ChainMap
+from unittest.mock import patch
+from roskarl import Secret, env_var_secret
+from roskarl import secrets_dir
+from roskarl.env import env_var_dsn
+from roskarl.secrets_dir import SecretFile, SecretsDir, find_secret_file
+from roskarl.source import override, use_source
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Counts files opened by roskarl.secrets_dir."""
+    opened = []
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(str(path))
+        return builtins.open(path, *args, **kwargs)
+
+    monkeypatch.setattr(secrets_dir, "open", counting_open, raising=False)
+    return opened
+
+
+def bump(path, content):
+    """Rewrites path in place with a later mtime, keeping the inode."""
+    stat = os.stat(path)
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestFindSecretFile:
+    def test_exact_then_lowercase(self, tmp_path):
+        (tmp_path / "db_password").write_text("x")
+        (tmp_path / "API_KEY").write_text("y")
+        assert find_secret_file(tmp_path, "DB_PASSWORD") == tmp_path / "db_password"
+        assert find_secret_file(tmp_path, "API_KEY") == tmp_path / "API_KEY"
+        assert find_secret_file(tmp_path, "MISSING") is None
+
+    def test_rejects_escaping_names(self, tmp_path):
+        (tmp_path / "inner").mkdir()
+        (tmp_path / "inner" / "x").write_text("x")
+        (tmp_path / ".hidden").write_text("x")
+        assert find_secret_file(tmp_path, "inner/x") is None
+        assert find_secret_file(tmp_path / "inner", "../inner/x") is None
+        assert find_secret_file(tmp_path, ".hidden") is None
+        assert find_secret_file(tmp_path, "") is None
+
+    def test_directories_do_not_match(self, tmp_path):
+        (tmp_path / "dir").mkdir()
+        assert find_secret_file(tmp_path, "dir") is None
+
+
+class TestSecretFile:
+    def test_strips_one_trailing_newline(self, tmp_path):
+        path = tmp_path / "s"
+        path.write_text("value\n\n")
+        assert SecretFile(path).read() == "value\n"
+
+    def test_cached_until_changed(self, tmp_path, reads):
+        path = tmp_path / "s"
+        path.write_text("one")
+        secret_file = SecretFile(path)
+        assert secret_file.read() == "one"
+        assert secret_file.read() == "one"
+        assert len(reads) == 1
+        bump(path, "two")
+        assert secret_file.read() == "two"
+        assert len(reads) == 2
+
+    def test_inode_change_is_picked_up(self, tmp_path):
+        path = tmp_path / "s"
+        path.write_text("old")
+        secret_file = SecretFile(path)
+        assert secret_file.read() == "old"
+        replacement = tmp_path / "s.new"
+        replacement.write_text("new")
+        os.utime(replacement, ns=(0, os.stat(path).st_mtime_ns))
+        os.replace(replacement, path)
+        assert secret_file.read() == "new"
+
+    def test_symlink_swap_is_picked_up(self, tmp_path):
+        # Kubernetes rotates mounted secrets by repointing a ..data symlink.
+        for version in ("v1", "v2"):
+            (tmp_path / version).mkdir()
+            (tmp_path / version / "token").write_text(f"token-{version}")
+        (tmp_path / "..data").symlink_to("v1")
+        (tmp_path / "token").symlink_to("..data/token")
+        secret_file = SecretFile(tmp_path / "token")
+        assert secret_file.read() == "token-v1"
+        (tmp_path / "..data_tmp").symlink_to("v2")
+        os.replace(tmp_path / "..data_tmp", tmp_path / "..data")
+        assert secret_file.read() == "token-v2"
+
+
+class TestSecretsDir:
+    def test_mapping(self, tmp_path):
+        (tmp_path / "db_password").write_text("pw\n")
+        (tmp_path / ".hidden").write_text("x")
+        (tmp_path / "sub").mkdir()
+        source = SecretsDir(tmp_path)
+        assert source["DB_PASSWORD"] == "pw"
+        assert source.get("MISSING") is None
+        assert "DB_PASSWORD" in source
+        assert "MISSING" not in source
+        assert list(source) == ["db_password"]
+        assert len(source) == 1
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        source = SecretsDir(tmp_path / "nope")
+        assert len(source) == 0
+        assert source.get("X") is None
+
+    def test_files_read_only_on_lookup(self, tmp_path, reads):
+        for i in range(20):
+            (tmp_path / f"secret_{i}").write_text(str(i))
+        source = SecretsDir(tmp_path)
+        assert len(source) == 20
+        assert reads == []
+        assert source["secret_3"] == "3"
+        assert source["secret_3"] == "3"
+        assert len(reads) == 1
+
+    def test_as_source(self, tmp_path):
+        (tmp_path / "db_dsn").write_text("postgresql://u:p@h:5432/db\n")
+        with patch.dict(os.environ, {"DB_DSN": "mysql://x:y@z:1/w"}):
+            with use_source(ChainMap(SecretsDir(tmp_path), os.environ)):
+                dsn = env_var_dsn("DB_DSN")
+        assert dsn.protocol == "postgresql"
+        assert dsn.password == "p"
+
+    def test_deleted_file_is_key_error(self, tmp_path):
+        path = tmp_path / "s"
+        path.write_text("x")
+        source = SecretsDir(tmp_path)
+        assert source["s"] == "x"
+        path.unlink()
+        assert source.get("s") is None
+
+
+class TestFileBackedSecret:
+    def test_env_var_secret_prefers_file(self, tmp_path, reads):
+        (tmp_path / "api_key").write_text("from-file\n")
+        with patch.dict(os.environ, {"API_KEY": "from-env"}):
+            secret = env_var_secret("API_KEY", secrets_dir=tmp_path)
+        assert reads == []
+        assert secret.path == tmp_path / "api_key"
+        assert secret.reveal() == "from-file"
+        assert secret.reveal() == "from-file"
+        assert len(reads) == 1
+
+    def test_override_wins_over_file(self, tmp_path):
+        (tmp_path / "api_key").write_text("from-file\n")
+        with override(API_KEY="from-override"):
+            secret = env_var_secret("API_KEY", secrets_dir=tmp_path)
+        assert secret.path is None
+        assert secret.reveal() == "from-override"
+        with override(API_KEY=None):
+            assert (
+                env_var_secret(
+                    "API_KEY", should_print_unset=False, secrets_dir=tmp_path
+                )
+                is None
+            )
+
+    def test_falls_back_to_env(self, tmp_path):
+        with patch.dict(os.environ, {"API_KEY": "from-env"}):
+            secret = env_var_secret("API_KEY", secrets_dir=tmp_path)
+        assert secret.path is None
+        assert secret.reveal() == "from-env"
+
+    def test_required_and_default_still_apply(self, tmp_path):
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError, match="is not set"):
+                env_var_secret("API_KEY", required=True, secrets_dir=tmp_path)
+            fallback = Secret("fallback")
+            assert env_var_secret("API_KEY", fallback, secrets_dir=tmp_path) == fallback
+
+    def test_rotation_picked_up_without_new_secret(self, tmp_path):
+        path = tmp_path / "token"
+        path.write_text("old")
+        secret = Secret.from_file(path)
+        assert secret.reveal() == "old"
+        bump(path, "new")
+        assert secret.reveal() == "new"
+
+    def test_masked_and_compared_by_path(self, tmp_path):
+        path = tmp_path / "token"
+        path.write_text("hunter2")
+        secret = Secret.from_file(path)
+        assert "hunter2" not in repr(secret)
+        assert "hunter2" not in str(secret)
+        assert secret == Secret.from_file(path)
+        assert hash(secret) == hash(Secret.from_file(path))
+        assert secret != Secret("hunter2")
+        assert Secret("hunter2") != secret
+
+    def test_missing_file_raises_on_reveal(self, tmp_path):
+        secret = Secret.from_file(tmp_path / "gone")
+        with pytest.raises(FileNotFoundError):
+            secret.reveal()
@@ -0,0 +1,236 @@
+import asyncio
+import os
+import threading
+import pytest
+from roskarl import env_var, env_var_dsn, env_var_int
+from roskarl.source import (
+    Sources,
+    current_source,
+    lookup,
+    override,
+    set_source,
+    use_source,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_default_source():
+    yield
+    set_source(None)
+
+
+class TestSource:
+    def test_defaults_to_os_environ(self, monkeypatch):
+        monkeypatch.setenv("ROSKARL_TEST", "from-environ")
+        assert current_source() is os.environ
+        assert lookup("ROSKARL_TEST") == "from-environ"
+
+    def test_use_source_is_scoped(self, monkeypatch):
+        monkeypatch.setenv("ROSKARL_TEST", "from-environ")
+        with use_source({"ROSKARL_TEST": "scoped"}):
+            assert env_var("ROSKARL_TEST") == "scoped"
+        assert env_var("ROSKARL_TEST") == "from-environ"
+
+    def test_use_source_does_not_touch_os_environ(self):
+        with use_source({"ROSKARL_ONLY_IN_SOURCE": "1"}):
+            assert env_var_int("ROSKARL_ONLY_IN_SOURCE") == 1
+        assert "ROSKARL_ONLY_IN_SOURCE" not in os.environ
+
+    def test_use_source_nests(self):
+        with use_source({"A": "outer"}):
+            with use_source({"A": "inner"}):
+                assert lookup("A") == "inner"
+            assert lookup("A") == "outer"
+
+    def test_empty_source_hides_environ(self, monkeypatch):
+        monkeypatch.setenv("ROSKARL_TEST", "from-environ")
+        with use_source({}):
+            assert lookup("ROSKARL_TEST") is None
+
+    def test_set_source_applies_to_other_threads(self):
+        set_source({"A": "global"})
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(lookup("A")))
+        thread.start()
+        thread.join()
+        assert seen == ["global"]
+
+    def test_scoped_source_is_task_local(self):
+        async def read(value):
+            with use_source({"A": value}):
+                await asyncio.sleep(0)
+                return lookup("A")
+
+        async def main():
+            return await asyncio.gather(read("one"), read("two"))
+
+        assert asyncio.run(main()) == ["one", "two"]
+
+    def test_dsn_reads_from_source(self):
+        with use_source({"DSN": "postgresql://u:p@h/db"}):
+            assert env_var_dsn("DSN").hostname == "h"
+
+
+def stack(**overrides):
+    layers = {
+        "defaults": {"TIMEOUT": "30", "LOG_LEVEL": "INFO", "ONLY_DEFAULT": "d"},
+        "base": {"TIMEOUT": "20", "DB": "base-db"},
+        "production": {"DB": "prod-db"},
+        "environ": {"LOG_LEVEL": "WARNING"},
+        "cli": {},
+    }
+    layers.update(overrides)
+    return Sources(layers.items())
+
+
+class TestSources:
+    def test_precedence_and_origin(self):
+        sources = stack()
+        assert sources.layers == ("defaults", "base", "production", "environ", "cli")
+        assert dict(sources) == {
+            "TIMEOUT": "20",
+            "LOG_LEVEL": "WARNING",
+            "ONLY_DEFAULT": "d",
+            "DB": "prod-db",
+        }
+        assert sources.origin("TIMEOUT") == "base"
+        assert sources.origin("DB") == "production"
+        assert sources.origin("LOG_LEVEL") == "environ"
+        assert sources.origin("MISSING") is None
+
+    def test_helpers_read_merged_view(self):
+        with use_source(stack(cli={"TIMEOUT": "5"})):
+            assert env_var_int("TIMEOUT") == 5
+
+    def test_duplicate_layer_rejected(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            Sources([("a", {}), ("a", {})])
+
+    def test_set_layer_reports_effective_changes(self):
+        sources = stack()
+        changed = sources.set_layer("cli", {"TIMEOUT": "1", "NEW": "x"})
+        assert changed == {"TIMEOUT", "NEW"}
+        assert sources["TIMEOUT"] == "1" and sources.origin("TIMEOUT") == "cli"
+        # Shadowed by a higher layer: no effective change.
+        assert sources.set_layer("defaults", {"DB": "other", "LOG_LEVEL": "DEBUG"}) == {
+            "ONLY_DEFAULT",
+        }
+        assert "ONLY_DEFAULT" not in sources
+        assert sources.origin("ONLY_DEFAULT") is None
+
+    def test_removal_falls_back_to_lower_layer(self):
+        sources = stack()
+        assert sources.set_layer("production", {}) == {"DB"}
+        assert sources["DB"] == "base-db"
+        assert sources.origin("DB") == "base"
+
+    def test_set_layer_only_resolves_changed_keys(self):
+        resolved = []
+
+        class Recording(Sources):
+            def _resolve(self, keys):
+                keys = list(keys)
+                resolved.extend(keys)
+                return super()._resolve(keys)
+
+        big = {f"K{i}": str(i) for i in range(10_000)}
+        sources = Recording([("base", big), ("cli", {})])
+        sources.set_layer("base", {**big, "K1": "changed"})
+        assert resolved == ["K1"]
+        assert sources["K1"] == "changed"
+
+    def test_refresh_picks_up_mutations(self, monkeypatch):
+        monkeypatch.setenv("ROSKARL_LAYERED", "1")
+        sources = Sources(
+            [("defaults", {"ROSKARL_LAYERED": "0"}), ("environ", os.environ)]
+        )
+        assert sources["ROSKARL_LAYERED"] == "1"
+        monkeypatch.delenv("ROSKARL_LAYERED")
+        assert sources["ROSKARL_LAYERED"] == "1"
+        assert sources.refresh("environ") == {"ROSKARL_LAYERED"}
+        assert sources["ROSKARL_LAYERED"] == "0"
+        assert sources.refresh() == set()
+
+    def test_unknown_layer(self):
+        with pytest.raises(KeyError):
+            stack().set_layer("nope", {})
+
+
+class TestOverride:
+    def test_overrides_active_source(self, monkeypatch):
+        monkeypatch.setenv("ROSKARL_TEST", "from-environ")
+        with override(ROSKARL_TEST="overridden"):
+            assert env_var("ROSKARL_TEST") == "overridden"
+            with use_source({"ROSKARL_TEST": "scoped"}):
+                assert env_var("ROSKARL_TEST") == "overridden"
+        assert env_var("ROSKARL_TEST") == "from-environ"
+        assert os.environ["ROSKARL_TEST"] == "from-environ"
+
+    def test_other_names_fall_through(self):
+        with use_source({"A": "1", "B": "2"}):
+            with override({"A": "x"}):
+                assert lookup("A") == "x"
+                assert lookup("B") == "2"
+
+    def test_none_reads_as_unset(self, monkeypatch):
+        monkeypatch.setenv("ROSKARL_TEST", "from-environ")
+        with override(ROSKARL_TEST=None):
+            assert lookup("ROSKARL_TEST") is None
+            assert env_var("ROSKARL_TEST", default="fallback") == "fallback"
+
+    def test_nesting_innermost_wins(self):
+        with use_source({}):
+            with override(A="outer", B="outer"):
+                with override({"A": "mapping"}, B="kwarg"):
+                    assert (lookup("A"), lookup("B")) == ("mapping", "kwarg")
+                    with override(A="inner"):
+                        assert (lookup("A"), lookup("B")) == ("inner", "kwarg")
+                assert (lookup("A"), lookup("B")) == ("outer", "outer")
+            assert lookup("A") is None
+
+    def test_restored_after_exception(self):
+        with use_source({}):
+            with pytest.raises(RuntimeError):
+                with override(A="x"):
+                    raise RuntimeError
+            assert lookup("A") is None
+
+    def test_thousands_of_concurrent_tasks(self):
+        tasks = 5_000
+
+        async def handle(tenant):
+            with override(TENANT=str(tenant), TIMEOUT=str(tenant % 60)):
+                seen = []
+                for _ in range(3):
+                    await asyncio.sleep(0)
+                    seen.append((env_var("TENANT"), env_var_int("TIMEOUT")))
+                return tenant, seen
+
+        async def main():
+            return await asyncio.gather(*(handle(i) for i in range(tasks)))
+
+        with use_source({"TENANT": "base", "TIMEOUT": "99"}):
+            results = asyncio.run(main())
+            assert lookup("TENANT") == "base"
+        assert len(results) == tasks
+        for tenant, seen in results:
+            assert seen == [(str(tenant), tenant % 60)] * 3
+
+    def test_threads_are_isolated(self):
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def worker(i):
+            with override(WORKER=str(i)):
+                barrier.wait()
+                for _ in range(1_000):
+                    if lookup("WORKER") != str(i):
+                        errors.append(i)
+                        break
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
@@ -0,0 +1,140 @@
+import json
+import os
+import pytest
+from dataclasses import FrozenInstanceError, dataclass, field
+from types import MappingProxyType
+from unittest.mock import patch
+from roskarl import env_var_json, env_var_toml
+from roskarl.structured import _parse_cached, freeze
+
+
+@dataclass(frozen=True)
+class Route:
+    path: str
+    weight: int = 1
+    tags: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Routing:
+    routes: tuple[Route, ...]
+    limits: dict[str, float] = field(default_factory=dict)
+    fallback: Route | None = None
+
+
+@dataclass
+class Mutable:
+    value: int
+
+
+ROUTING = {
+    "routes": [{"path": "/a", "weight": 3, "tags": ["x"]}, {"path": "/b"}],
+    "limits": {"tenant-1": 10, "tenant-2": 2.5},
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _parse_cached.cache_clear()
+
+
+class TestJson:
+    def test_parses(self):
+        with patch.dict(os.environ, {"DATA": '{"a": [1, 2]}'}, clear=True):
+            assert env_var_json("DATA") == {"a": [1, 2]}
+
+    def test_unset_semantics(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert env_var_json("DATA", default={"d": 1}) == {"d": 1}
+            assert env_var_json("DATA", default_factory=list) == []
+            with pytest.raises(ValueError, match="'DATA' is not set"):
+                env_var_json("DATA", required=True)
+
+    def test_invalid(self):
+        with patch.dict(os.environ, {"DATA": "{oops"}, clear=True):
+            with pytest.raises(ValueError, match="'DATA' is not valid JSON"):
+                env_var_json("DATA")
+
+    def test_mutable_results_not_shared(self):
+        with patch.dict(os.environ, {"DATA": '{"a": []}'}, clear=True):
+            first = env_var_json("DATA")
+            first["a"].append(1)
+            assert env_var_json("DATA") == {"a": []}
+        assert _parse_cached.cache_info().currsize == 0
+
+    def test_frozen_is_deep_and_cached(self):
+        with patch.dict(os.environ, {"DATA": '{"a": [{"b": 1}]}'}, clear=True):
+            first = env_var_json("DATA", frozen=True)
+            assert env_var_json("DATA", frozen=True) is first
+        assert isinstance(first, MappingProxyType)
+        assert first["a"] == (MappingProxyType({"b": 1}),)
+        with pytest.raises(TypeError):
+            first["a"][0]["b"] = 2
+        assert _parse_cached.cache_info().hits == 1
+
+    def test_new_raw_value_is_reparsed(self):
+        with patch.dict(os.environ, {"DATA": "[1]"}, clear=True):
+            assert env_var_json("DATA", frozen=True) == (1,)
+            os.environ["DATA"] = "[2]"
+            assert env_var_json("DATA", frozen=True) == (2,)
+
+    def test_into_dataclass(self):
+        with patch.dict(os.environ, {"ROUTING": json.dumps(ROUTING)}, clear=True):
+            routing = env_var_json("ROUTING", into=Routing, required=True)
+        assert routing.routes == (Route("/a", 3, ("x",)), Route("/b"))
+        assert routing.limits == {"tenant-1": 10.0, "tenant-2": 2.5}
+        assert routing.fallback is None
+
+    def test_into_frozen_dataclass_is_cached(self):
+        with patch.dict(os.environ, {"ROUTING": json.dumps(ROUTING)}, clear=True):
+            first = env_var_json("ROUTING", into=Routing, frozen=True)
+            assert env_var_json("ROUTING", into=Routing, frozen=True) is first
+        assert isinstance(first.limits, MappingProxyType)
+        with pytest.raises(FrozenInstanceError):
+            first.routes = ()
+
+    def test_into_mutable_dataclass_not_cached(self):
+        with patch.dict(os.environ, {"DATA": '{"value": 1}'}, clear=True):
+            first = env_var_json("DATA", into=Mutable, frozen=True)
+            assert env_var_json("DATA", into=Mutable, frozen=True) is not first
+
+    @pytest.mark.parametrize(
+        ("document", "message"),
+        [
+            ({"routes": [{"path": "/a", "weight": "3"}]}, r"\$.routes\[0\].weight: "),
+            ({"routes": [{"path": "/a", "weight": True}]}, "expected int, got bool"),
+            ({"routes": [{"weight": 1}]}, r"\$.routes\[0\]: missing key 'path'"),
+            ({"routes": [], "extra": 1}, "unknown key 'extra'"),
+            ({"routes": {}}, r"\$.routes: expected an array, got dict"),
+            ([], "expected an object, got list"),
+        ],
+    )
+    def test_into_mismatch(self, document, message):
+        with patch.dict(os.environ, {"ROUTING": json.dumps(document)}, clear=True):
+            with pytest.raises(ValueError, match="'ROUTING' does not match Routing"):
+                env_var_json("ROUTING", into=Routing)
+            with pytest.raises(ValueError, match=message):
+                env_var_json("ROUTING", into=Routing)
+
+
+class TestToml:
+    def test_parses(self):
+        document = 'name = "svc"\n[limits]\ntenant = 10\n'
+        with patch.dict(os.environ, {"CONF": document}, clear=True):
+            assert env_var_toml("CONF") == {"name": "svc", "limits": {"tenant": 10}}
+            frozen = env_var_toml("CONF", frozen=True)
+            assert frozen["limits"] == MappingProxyType({"tenant": 10})
+
+    def test_into_dataclass(self):
+        document = '[[routes]]\npath = "/a"\nweight = 2\n'
+        with patch.dict(os.environ, {"CONF": document}, clear=True):
+            assert env_var_toml("CONF", into=Routing).routes == (Route("/a", 2),)
+
+    def test_invalid(self):
+        with patch.dict(os.environ, {"CONF": "name = "}, clear=True):
+            with pytest.raises(ValueError, match="'CONF' is not valid TOML"):
+                env_var_toml("CONF")
+
+
+def test_freeze_leaves_scalars():
+    assert freeze({"a": [1, "x", None]}) == MappingProxyType({"a": (1, "x", None)})
@@ -0,0 +1,85 @@
+import os
+import pytest
+from unittest.mock import patch
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from roskarl import env_var_tz, env_var_zoneinfo
+from roskarl import tz
+from roskarl.tz import clear_zone_cache, load_zone, zone_index
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_zone_cache()
+    yield
+    clear_zone_cache()
+
+
+class TestLoadZone:
+    def test_returns_zoneinfo(self):
+        assert load_zone("Europe/Stockholm") == ZoneInfo("Europe/Stockholm")
+
+    def test_same_instance_returned(self):
+        assert load_zone("Europe/Stockholm") is load_zone("Europe/Stockholm")
+
+    def test_unknown_raises(self):
+        with pytest.raises(ZoneInfoNotFoundError):
+            load_zone("Invalid/Timezone")
+
+    def test_path_like_key_rejected(self):
+        with pytest.raises(ZoneInfoNotFoundError):
+            load_zone("../../etc/passwd")
+
+    def test_cached_zone_skips_zoneinfo(self):
+        load_zone("Asia/Tokyo")
+        with patch.object(tz, "ZoneInfo", side_effect=AssertionError("reloaded")):
+            assert load_zone("Asia/Tokyo").key == "Asia/Tokyo"
+
+    def test_unknown_zone_checked_once(self):
+        with pytest.raises(ZoneInfoNotFoundError):
+            load_zone("Mars/Olympus_Mons")
+        with patch.object(tz, "ZoneInfo", side_effect=AssertionError("loaded")):
+            with pytest.raises(ZoneInfoNotFoundError):
+                load_zone("Mars/Olympus_Mons")
+
+    @pytest.mark.parametrize("key", ["posix/Europe/Stockholm", "right/UTC"])
+    def test_keys_outside_index(self, key):
+        assert key not in zone_index()
+        assert load_zone(key) == ZoneInfo(key)
+        assert load_zone(key) is load_zone(key)
+
+    def test_index_built_once(self):
+        with patch.object(tz, "available_timezones", return_value={"UTC"}) as available:
+            assert zone_index() == {"UTC"}
+            assert zone_index() == {"UTC"}
+        assert available.call_count == 1
+
+
+class TestEnvVarZoneinfo:
+    def test_returns_zoneinfo(self):
+        with patch.dict(os.environ, {"TEST_TZ": "America/New_York"}):
+            assert env_var_zoneinfo("TEST_TZ") == ZoneInfo("America/New_York")
+
+    def test_invalid_raises(self):
+        with patch.dict(os.environ, {"TEST_TZ": "Invalid/Timezone"}):
+            with pytest.raises(ValueError, match="Timezone string was not valid"):
+                env_var_zoneinfo("TEST_TZ")
+
+    def test_default_used_when_unset(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert env_var_zoneinfo("TEST_TZ", default=ZoneInfo("UTC")) == ZoneInfo(
+                "UTC"
+            )
+
+    def test_required_raises_when_unset(self):
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                env_var_zoneinfo("TEST_TZ", required=True)
+
+    def test_env_var_tz_accepts_posix_keys(self):
+        with patch.dict(os.environ, {"TEST_TZ": "posix/Europe/Stockholm"}):
+            assert env_var_tz("TEST_TZ") == "posix/Europe/Stockholm"
+
+    def test_env_var_tz_shares_cache(self):
+        with patch.dict(os.environ, {"TEST_TZ": "Europe/Oslo"}):
+            assert env_var_tz("TEST_TZ") == "Europe/Oslo"
+            assert env_var_zoneinfo("TEST_TZ") is load_zone("Europe/Oslo")
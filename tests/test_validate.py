@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+import pytest
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from unittest.mock import patch
+from roskarl import DSN, env_var, env_var_path
+from roskarl.source import override
+from roskarl.validate import FieldError, ValidationErrors, load_all, validate
+
+
+def slow_check(name, **kwargs):
+    time.sleep(0.2)
+    value = env_var(name, **kwargs)
+    if value == "bad":
+        raise ValueError(f"'{name}' failed the slow check")
+    return value
+
+
+@dataclass
+class Config:
+    database: DSN
+    workers: int
+    timeout: timedelta = timedelta(seconds=30)
+    debug: bool = False
+
+
+class TestValidate:
+    def test_valid(self):
+        env = {"DATABASE": "postgresql://u:p@h/db", "WORKERS": "2"}
+        with patch.dict(os.environ, env, clear=True):
+            assert validate(Config) == []
+            assert load_all(Config).workers == 2
+
+    def test_collects_every_error_in_field_order(self):
+        env = {"WORKERS": "many", "TIMEOUT": "soon", "DEBUG": "yes"}
+        with patch.dict(os.environ, env, clear=True):
+            errors = validate(Config)
+        assert [error.env for error in errors] == [
+            "DATABASE",
+            "WORKERS",
+            "TIMEOUT",
+            "DEBUG",
+        ]
+        assert errors[0] == FieldError(
+            "database", "DATABASE", "Environment variable 'DATABASE' is not set"
+        )
+
+    def test_load_all_raises_all(self):
+        with patch.dict(os.environ, {"APP_WORKERS": "many"}, clear=True):
+            with pytest.raises(ValidationErrors) as info:
+                load_all(Config, prefix="APP_")
+        assert len(info.value.errors) == 2
+        assert isinstance(info.value, ValueError)
+        message = str(info.value)
+        assert message.startswith("2 invalid setting(s):")
+        assert "APP_DATABASE:" in message and "APP_WORKERS:" in message
+
+    def test_io_bound_fields_run_concurrently(self, tmp_path):
+        @dataclass
+        class Slow:
+            a: str = field(default="", metadata={"helper": slow_check})
+            b: str = field(default="", metadata={"helper": slow_check})
+            c: str = field(default="", metadata={"helper": slow_check})
+            d: str = field(default="", metadata={"helper": slow_check})
+
+        env = {"A": "ok", "B": "bad", "C": "ok", "D": "bad"}
+        with patch.dict(os.environ, env, clear=True):
+            start = time.perf_counter()
+            errors = validate(Slow)
+            elapsed = time.perf_counter() - start
+        assert [error.env for error in errors] == ["B", "D"]
+        assert elapsed < 0.6
+
+    def test_worker_threads_see_scoped_overrides(self, tmp_path):
+        seen = []
+
+        def record_thread(name, **kwargs):
+            seen.append(threading.current_thread() is threading.main_thread())
+            return env_var_path(name, must_exist=True, **kwargs)
+
+        @dataclass
+        class Paths:
+            data: Path = field(metadata={"helper": record_thread})
+
+        with patch.dict(os.environ, {}, clear=True):
+            with override(DATA=str(tmp_path)):
+                assert load_all(Paths).data == tmp_path
+        assert seen == [False]
+
+    def test_io_metadata_opt_out(self):
+        seen = []
+
+        def record_thread(name, **kwargs):
+            seen.append(threading.current_thread() is threading.main_thread())
+            return env_var(name, **kwargs)
+
+        @dataclass
+        class Inline:
+            value: str = field(
+                default="x", metadata={"helper": record_thread, "io": False}
+            )
+            path: Path | None = field(
+                default=None,
+                metadata={"helper": partial(env_var_path, must_exist=True)},
+            )
+
+        with patch.dict(os.environ, {"PATH": "/nonexistent/dir"}, clear=True):
+            errors = validate(Inline)
+        assert seen == [True]
+        assert [error.env for error in errors] == ["PATH"]
+
+    def test_other_exceptions_are_collected(self):
+        def unreadable(name, **kwargs):
+            raise PermissionError(13, "Permission denied", "/mnt/nfs/data")
+
+        def broken(name, **kwargs):
+            return int(None)
+
+        @dataclass
+        class Mixed:
+            data: Path = field(metadata={"helper": unreadable})
+            size: int = field(metadata={"helper": broken, "io": False})
+            workers: int = 1
+
+        with patch.dict(os.environ, {"WORKERS": "many"}, clear=True):
+            errors = validate(Mixed)
+        assert [error.env for error in errors] == ["DATA", "SIZE", "WORKERS"]
+        assert errors[0].message.startswith("PermissionError: ")
+        assert errors[1].message.startswith("TypeError: ")
+        assert not errors[2].message.startswith("ValueError")
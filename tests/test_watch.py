@@ -0,0 +1,257 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+import pytest
+from functools import partial
+from roskarl import env_var_int, env_var_log_level, env_var_dsn
+from roskarl import dotenv
+from roskarl.watch import ConfigWatcher
+
+
+def write(path, content):
+    """Writes path and pushes its mtime forward so the change is always seen."""
+    existed = path.exists()
+    mtime = os.stat(path).st_mtime_ns if existed else time.time_ns()
+    path.write_text(content)
+    os.utime(path, ns=(mtime, mtime + 1_000_000_000))
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / ".env"
+    write(path, "TIMEOUT=5\nLOG_LEVEL=INFO\n")
+    return path
+
+
+class TestCheck:
+    def test_watch_returns_current_value(self, env_file):
+        watcher = ConfigWatcher(env_file)
+        assert watcher.watch("TIMEOUT", env_var_int, print) == 5
+        assert watcher.watch("LOG_LEVEL", env_var_log_level, print) == logging.INFO
+
+    def test_callback_fires_with_parsed_value(self, env_file):
+        seen = []
+        watcher = ConfigWatcher(env_file)
+        watcher.watch("TIMEOUT", env_var_int, seen.append)
+        assert watcher.check() == []
+        write(env_file, "TIMEOUT=30\nLOG_LEVEL=INFO\n")
+        assert watcher.check() == ["TIMEOUT"]
+        assert seen == [30]
+
+    def test_callback_may_register_a_watch(self, env_file):
+        seen = []
+        watcher = ConfigWatcher(env_file)
+
+        def on_timeout(value):
+            seen.append(watcher.watch("LOG_LEVEL", env_var_log_level, seen.append))
+
+        watcher.watch("TIMEOUT", env_var_int, on_timeout)
+        write(env_file, "TIMEOUT=30\nLOG_LEVEL=INFO\n")
+        thread = threading.Thread(target=watcher.check, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert seen == [logging.INFO]
+        write(env_file, "TIMEOUT=30\nLOG_LEVEL=DEBUG\n")
+        assert watcher.check() == ["LOG_LEVEL"]
+        assert seen == [logging.INFO, logging.DEBUG]
+
+    def test_only_changed_keys_are_reparsed(self, env_file):
+        calls = []
+
+        def counting(parser):
+            def helper(name):
+                calls.append(name)
+                return parser(name)
+
+            return helper
+
+        watcher = ConfigWatcher(env_file)
+        watcher.watch("TIMEOUT", counting(env_var_int), lambda v: None)
+        watcher.watch("LOG_LEVEL", counting(env_var_log_level), lambda v: None)
+        calls.clear()
+        write(env_file, "TIMEOUT=5\nLOG_LEVEL=DEBUG\nOTHER=1\n")
+        assert watcher.check() == ["LOG_LEVEL"]
+        assert calls == ["LOG_LEVEL"]
+
+    def test_unchanged_file_is_not_reparsed(self, env_file, monkeypatch):
+        watcher = ConfigWatcher(env_file)
+        parses = []
+        original = dotenv.parse_dotenv
+        monkeypatch.setattr(
+            dotenv,
+            "parse_dotenv",
+            lambda *a, **k: parses.append(1) or original(*a, **k),
+        )
+        for _ in range(5):
+            watcher.check()
+        assert parses == []
+
+    def test_same_parsed_value_does_not_fire(self, env_file):
+        seen = []
+        watcher = ConfigWatcher(env_file)
+        watcher.watch("LOG_LEVEL", env_var_log_level, seen.append)
+        write(env_file, "TIMEOUT=5\nLOG_LEVEL=info\n")
+        assert watcher.check() == ["LOG_LEVEL"]
+        assert seen == []
+
+    def test_removed_key_fires_none(self, env_file):
+        seen = []
+        watcher = ConfigWatcher(env_file)
+        watcher.watch(
+            "TIMEOUT", partial(env_var_int, should_print_unset=False), seen.append
+        )
+        write(env_file, "LOG_LEVEL=INFO\n")
+        watcher.check()
+        assert seen == [None]
+
+    def test_invalid_value_reported_and_old_value_kept(self, env_file):
+        seen, errors = [], []
+        watcher = ConfigWatcher(env_file, on_error=lambda n, e: errors.append(n))
+        watcher.watch("TIMEOUT", env_var_int, seen.append)
+        write(env_file, "TIMEOUT=soon\n")
+        watcher.check()
+        assert errors == ["TIMEOUT"] and seen == []
+        write(env_file, "TIMEOUT=7\n")
+        watcher.check()
+        assert seen == [7]
+
+    def test_broken_file_keeps_last_values(self, env_file):
+        errors = []
+        watcher = ConfigWatcher(env_file, on_error=lambda n, e: errors.append(n))
+        write(env_file, "TIMEOUT='unterminated\n")
+        watcher.check()
+        assert errors == [str(env_file)]
+        assert watcher.source["TIMEOUT"] == "5"
+
+    def test_broken_file_at_construction_raises(self, tmp_path):
+        path = tmp_path / ".env"
+        write(path, "not a line\n")
+        with pytest.raises(ValueError, match="invalid .env line"):
+            ConfigWatcher(path)
+
+    def test_missing_path_is_empty_until_created(self, tmp_path):
+        seen = []
+        path = tmp_path / ".env"
+        watcher = ConfigWatcher(path)
+        assert (
+            watcher.watch(
+                "TIMEOUT", partial(env_var_int, should_print_unset=False), seen.append
+            )
+            is None
+        )
+        write(path, "TIMEOUT=1\n")
+        watcher.check()
+        assert seen == [1]
+
+
+class TestDirectories:
+    def test_secrets_directory_rotation(self, tmp_path):
+        (tmp_path / "secrets").mkdir()
+        dsn_file = tmp_path / "secrets" / "db_dsn"
+        write(dsn_file, "postgresql://u:old@h:5432/db\n")
+        seen = []
+        watcher = ConfigWatcher(tmp_path / "secrets")
+        first = watcher.watch("DB_DSN", env_var_dsn, seen.append)
+        assert first.password == "old"
+        write(dsn_file, "postgresql://u:new@h:5432/db\n")
+        watcher.check()
+        assert [dsn.password for dsn in seen] == ["new"]
+
+    def test_later_paths_override(self, tmp_path, env_file):
+        (tmp_path / "config").mkdir()
+        watcher = ConfigWatcher(env_file, tmp_path / "config")
+        seen = []
+        assert watcher.watch("TIMEOUT", env_var_int, seen.append) == 5
+        write(tmp_path / "config" / "TIMEOUT", "60")
+        watcher.check()
+        assert seen == [60]
+        (tmp_path / "config" / "TIMEOUT").unlink()
+        watcher.check()
+        assert seen == [60, 5]
+
+
+class TestRunners:
+    def test_thread(self, env_file):
+        seen = []
+        with ConfigWatcher(env_file, interval=0.01) as watcher:
+            watcher.watch("TIMEOUT", env_var_int, seen.append)
+            write(env_file, "TIMEOUT=9\n")
+            deadline = time.monotonic() + 5
+            while not seen and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert seen == [9]
+        assert watcher._thread is None
+
+    def test_callback_may_stop_the_thread(self, env_file):
+        stopped = threading.Event()
+        watcher = ConfigWatcher(env_file, interval=0.01)
+
+        def on_timeout(value):
+            watcher.stop()
+            stopped.set()
+
+        watcher.watch("TIMEOUT", env_var_int, on_timeout)
+        watcher.start()
+        thread = watcher._thread
+        write(env_file, "TIMEOUT=9\n")
+        assert stopped.wait(5)
+        thread.join(5)
+        assert not thread.is_alive()
+        assert watcher._thread is None
+
+    def test_thread_cannot_start_twice(self, env_file):
+        watcher = ConfigWatcher(env_file, interval=0.01)
+        watcher.start()
+        try:
+            with pytest.raises(RuntimeError):
+                watcher.start()
+        finally:
+            watcher.stop()
+
+    def test_asyncio_callbacks_run_on_loop(self, env_file):
+        async def main():
+            loop = asyncio.get_running_loop()
+            changed = asyncio.Event()
+            seen = []
+
+            def on_change(value):
+                assert asyncio.get_running_loop() is loop
+                seen.append(value)
+                changed.set()
+
+            watcher = ConfigWatcher(env_file, interval=0.01)
+            watcher.watch("TIMEOUT", env_var_int, on_change)
+            task = asyncio.create_task(watcher.run())
+            write(env_file, "TIMEOUT=11\n")
+            await asyncio.wait_for(changed.wait(), 5)
+            task.cancel()
+            return seen
+
+        assert asyncio.run(main()) == [11]
+
+    def test_asyncio_helpers_run_off_loop(self, env_file):
+        threads = []
+
+        def helper(name):
+            threads.append(threading.current_thread() is threading.main_thread())
+            return env_var_int(name)
+
+        async def main():
+            changed = asyncio.Event()
+            watcher = ConfigWatcher(env_file, interval=0.01)
+            watcher.watch("TIMEOUT", helper, lambda value: changed.set())
+            task = asyncio.create_task(watcher.run())
+            write(env_file, "TIMEOUT=12\n")
+            await asyncio.wait_for(changed.wait(), 5)
+            task.cancel()
+
+        asyncio.run(main())
+        assert threads[0] is True  # watch() itself runs on the caller
+        assert threads[1:] == [False]
+
+    def test_interval_must_be_positive(self):
+        with pytest.raises(ValueError):
+            ConfigWatcher(interval=0)